@@ -9,6 +9,11 @@ import subprocess
 import os
 from typing import Set, List, Dict, Optional, Tuple
 
+from .defaults import (
+    DEFAULT_PRIVATE_BRANCHES, DEFAULT_PUBLIC_BRANCHES,
+    DEFAULT_PRIVATE_PATTERNS, DEFAULT_EXCLUDE_FROM_PUBLIC
+)
+
 
 class BranchContext:
     """Manages branch context and security rules with configurable patterns."""
@@ -29,37 +34,16 @@ class BranchContext:
         config = config or {}
         
         # Configure private branches (can contain private content)
-        self.PRIVATE_BRANCHES = set(config.get('private_branches', ['private', 'local']))
+        self.PRIVATE_BRANCHES = set(config.get('private_branches', DEFAULT_PRIVATE_BRANCHES))
         
         # Configure public branches (must not contain private content)
-        self.PUBLIC_BRANCHES = set(config.get('public_branches', 
-            ['main', 'master', 'dev', 'test', 'staging', 'live', 'prod', 'production']))
+        self.PUBLIC_BRANCHES = set(config.get('public_branches', DEFAULT_PUBLIC_BRANCHES))
         
         # Configure private content patterns
-        self.PRIVATE_PATTERNS = set(config.get('private_patterns', {
-            'CLAUDE.md',
-            'private/',
-            'convos/',
-            'logs/',
-            'credentials/',
-            'secrets/',
-            '.env.local',
-            '.env.private',
-            '**/__private__*',
-            '**/private_*',
-        }))
+        self.PRIVATE_PATTERNS = set(config.get('private_patterns', DEFAULT_PRIVATE_PATTERNS))
         
         # Configure exclude patterns for public branches
-        self.EXCLUDE_FROM_PUBLIC = set(config.get('exclude_from_public', {
-            'CLAUDE.md',
-            'private/claude/',
-            'private/docs/',
-            'private/notes/',
-            'private/temp/',
-            'revisions/',
-            'test-runs/',
-            'test_runs/',
-        }))
+        self.EXCLUDE_FROM_PUBLIC = set(config.get('exclude_from_public', DEFAULT_EXCLUDE_FROM_PUBLIC))
     
     @property
     def current_branch(self) -> str:
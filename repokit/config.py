@@ -63,9 +63,9 @@ class ConfigManager:
                 "scripts",
                 "tests",
             ],
-            "private_dirs": DEFAULT_PRIVATE_DIRS.copy(),
-            "sensitive_files": DEFAULT_SENSITIVE_FILES.copy(),
-            "sensitive_patterns": DEFAULT_SENSITIVE_PATTERNS.copy(),
+            "private_dirs": list(DEFAULT_PRIVATE_DIRS),
+            "sensitive_files": list(DEFAULT_SENSITIVE_FILES),
+            "sensitive_patterns": list(DEFAULT_SENSITIVE_PATTERNS),
             "private_branch": "private",
             "github": True,
             "use_github_noreply": True,  # Add GitHub no-reply setting
@@ -639,7 +639,9 @@ class ConfigManager:
         
         if "directory_types" in self.config:
             self.directory_manager.type_mapping.update(self.config["directory_types"])
-        
+
+        self.directory_manager.invalidate_caches()
+
         # Check if we're using a directory profile
         profile = self.config.get("directory_profile")
         groups = self.config.get("directory_groups", [])
@@ -675,4 +677,4 @@ class ConfigManager:
         
         # Ensure private_dirs is always set
         if "private_dirs" not in self.config:
-            self.config["private_dirs"] = DEFAULT_PRIVATE_DIRS.copy()
+            self.config["private_dirs"] = list(DEFAULT_PRIVATE_DIRS)
@@ -4,25 +4,76 @@ Default configuration values for RepoKit.
 
 This module provides centralized default values to prevent duplication
 and ensure consistency across the codebase.
+
+Sequence defaults are immutable tuples and mapping defaults are read-only
+views, so they can be shared without defensive copies. Callers that need a
+customizable copy should use list(...) or dict(...).
 """
 
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, FrozenSet, List, Mapping, Tuple
+
+if TYPE_CHECKING:
+    from typing import Final
+
+__all__ = [
+    "AI_INSTRUCTIONS_FILE",
+    "VIM_BACKUP_PATTERNS",
+    "DEFAULT_PRIVATE_DIRS",
+    "DEFAULT_SENSITIVE_FILES",
+    "DEFAULT_SENSITIVE_PATTERNS",
+    "DEFAULT_PRIVATE_BRANCHES",
+    "DEFAULT_PUBLIC_BRANCHES",
+    "DEFAULT_PRIVATE_PATTERNS",
+    "DEFAULT_EXCLUDE_FROM_PUBLIC",
+    "BRANCH_SPECIFIC_EXCLUDES",
+    "BRANCH_BITS",
+    "EXCLUDE_MASK",
+    "EXCLUDED_BRANCHES_FOR",
+    "DEFAULT_BRANCH_STRATEGIES",
+    "DEFAULT_DIRECTORY_PROFILES",
+    "DEFAULT_DIRECTORY_GROUPS",
+    "DEFAULT_DIRECTORY_TYPE_MAPPING",
+    "DEFAULT_PRIVATE_DIR_SETS",
+    "normalize_path",
+    "compile_patterns",
+    "is_sensitive",
+    "is_private_path",
+    "excluded_branch_mask",
+    "is_excluded_on_branch",
+    "branches_excluding",
+]
+
+# Names shared by several lists below; defined once so the lists stay in sync
+AI_INSTRUCTIONS_FILE: Final[str] = "CLAUDE.md"
+VIM_BACKUP_PATTERNS: Final[Tuple[str, ...]] = (
+    "*.*~",          # Vim backup files (primary pattern for files like listall.cmd~)
+    "*~",            # Vim backup files (fallback for single extension)
+)
+
 # Default private directories that should not appear in public branches
-DEFAULT_PRIVATE_DIRS = [
+DEFAULT_PRIVATE_DIRS: Final[Tuple[str, ...]] = (
     "private",
     "revisions", 
     "logs",
     "convos"
-]
+)
 
 # Default sensitive files that should not appear in public branches
-DEFAULT_SENSITIVE_FILES = [
-    "CLAUDE.md",
+DEFAULT_SENSITIVE_FILES: Final[Tuple[str, ...]] = (
+    AI_INSTRUCTIONS_FILE,
     ".repokit.json"
-]
+)
 
 # Default sensitive file patterns (supports glob patterns)
 # Cross-platform compatible patterns using Python's fnmatch/pathlib
-DEFAULT_SENSITIVE_PATTERNS = [
+DEFAULT_SENSITIVE_PATTERNS: Final[Tuple[str, ...]] = (
     "Clipboard Text*",
     "nul",           # Windows reserved name
     "*.tmp",
@@ -30,21 +81,20 @@ DEFAULT_SENSITIVE_PATTERNS = [
     ".env*",
     "*.backup",
     "*.bak",
-    "*.*~",          # Vim backup files (primary pattern for files like listall.cmd~)
-    "*~",            # Vim backup files (fallback for single extension)
+    *VIM_BACKUP_PATTERNS,
     "logs/*",        # All files in logs directory
     "logs/**/*",     # All files in logs subdirectories  
     "revisions/*",   # All files in revisions directory
     "revisions/**/*", # All files in revisions subdirectories
-]
+)
 
 # Default branch configurations for BranchContext
-DEFAULT_PRIVATE_BRANCHES = [
+DEFAULT_PRIVATE_BRANCHES: Final[Tuple[str, ...]] = (
     "private",
     "local"
-]
+)
 
-DEFAULT_PUBLIC_BRANCHES = [
+DEFAULT_PUBLIC_BRANCHES: Final[Tuple[str, ...]] = (
     "main", 
     "master", 
     "dev", 
@@ -53,11 +103,11 @@ DEFAULT_PUBLIC_BRANCHES = [
     "live", 
     "prod", 
     "production"
-]
+)
 
 # Files/directories that should only exist in private branches
-DEFAULT_PRIVATE_PATTERNS = [
-    "CLAUDE.md",
+DEFAULT_PRIVATE_PATTERNS: Final[Tuple[str, ...]] = (
+    AI_INSTRUCTIONS_FILE,
     "private/",
     "convos/",
     "logs/",
@@ -67,13 +117,12 @@ DEFAULT_PRIVATE_PATTERNS = [
     ".env.private",
     "**/__private__*",
     "**/private_*",
-    "*~",  # Vim backup files
-    "*.*~",  # Vim backup files (multiple extensions)
-]
+    *VIM_BACKUP_PATTERNS,
+)
 
 # Files that should be excluded from public branches during merges
-DEFAULT_EXCLUDE_FROM_PUBLIC = [
-    "CLAUDE.md",
+DEFAULT_EXCLUDE_FROM_PUBLIC: Final[Tuple[str, ...]] = (
+    AI_INSTRUCTIONS_FILE,
     "private/claude/",
     "private/docs/",
     "private/notes/",
@@ -81,29 +130,55 @@ DEFAULT_EXCLUDE_FROM_PUBLIC = [
     "revisions/",
     "test-runs/",
     "test_runs/",
-]
+)
+
+# Branches that get the public excludes in BRANCH_SPECIFIC_EXCLUDES
+_BRANCHES_WITH_EXCLUDES = ("dev", "main", "staging", "test", "live")
+
+# Everything a public branch must not contain; shared by every public entry
+_PUBLIC_EXCLUDES = DEFAULT_PRIVATE_DIRS + DEFAULT_SENSITIVE_FILES
 
 # Branch-specific excludes - files that should only exist in certain branches
-BRANCH_SPECIFIC_EXCLUDES = {
-    "private": [],  # Private branch can contain everything
-    "dev": DEFAULT_PRIVATE_DIRS + DEFAULT_SENSITIVE_FILES,
-    "main": DEFAULT_PRIVATE_DIRS + DEFAULT_SENSITIVE_FILES,
-    "staging": DEFAULT_PRIVATE_DIRS + DEFAULT_SENSITIVE_FILES,
-    "test": DEFAULT_PRIVATE_DIRS + DEFAULT_SENSITIVE_FILES,
-    "live": DEFAULT_PRIVATE_DIRS + DEFAULT_SENSITIVE_FILES,
-}
+BRANCH_SPECIFIC_EXCLUDES: Final[Mapping[str, Tuple[str, ...]]] = MappingProxyType({
+    "private": (),  # Private branch can contain everything
+    **{branch: _PUBLIC_EXCLUDES for branch in _BRANCHES_WITH_EXCLUDES},
+})
+
+# One bit per branch in BRANCH_SPECIFIC_EXCLUDES, so "which branches exclude
+# this name?" is a single dict lookup returning a bitmask
+BRANCH_BITS: Final[Mapping[str, int]] = MappingProxyType({
+    branch: 1 << index for index, branch in enumerate(BRANCH_SPECIFIC_EXCLUDES)
+})
+
+
+def _build_exclude_masks():
+    """Map each excluded name to the bitmask of branches that exclude it."""
+    masks = {}
+    for branch, excludes in BRANCH_SPECIFIC_EXCLUDES.items():
+        for name in excludes:
+            masks[name] = masks.get(name, 0) | BRANCH_BITS[branch]
+    return masks
+
+
+EXCLUDE_MASK: Final[Mapping[str, int]] = MappingProxyType(_build_exclude_masks())
+
+# Inverse of BRANCH_SPECIFIC_EXCLUDES: excluded name -> branches excluding it
+EXCLUDED_BRANCHES_FOR: Final[Mapping[str, FrozenSet[str]]] = MappingProxyType({
+    name: frozenset(branch for branch, bit in BRANCH_BITS.items() if mask & bit)
+    for name, mask in EXCLUDE_MASK.items()
+})
 
 # Default branch configurations - centralized from directory_analyzer.py
-DEFAULT_BRANCH_STRATEGIES = {
+DEFAULT_BRANCH_STRATEGIES: Final[Mapping[str, List[str]]] = MappingProxyType({
     "simple": ["private", "dev", "main"],
     "standard": ["private", "dev", "main", "test", "staging", "live"],
     "gitflow": ["private", "develop", "main"],
     "github-flow": ["private", "main"],
     "minimal": ["main"]
-}
+})
 
 # Default directory profiles - centralized from directory_profiles.py
-DEFAULT_DIRECTORY_PROFILES = {
+DEFAULT_DIRECTORY_PROFILES: Final[Mapping[str, List[str]]] = MappingProxyType({
     "minimal": ["src", "tests", "docs"],
     "standard": [
         "src", "tests", "docs", "scripts", "config", 
@@ -114,18 +189,18 @@ DEFAULT_DIRECTORY_PROFILES = {
         "private", "convos", "revisions", "data", "examples", 
         "tools", "resources", "assets"
     ]
-}
+})
 
 # Directory groups by purpose - centralized from directory_profiles.py
-DEFAULT_DIRECTORY_GROUPS = {
+DEFAULT_DIRECTORY_GROUPS: Final[Mapping[str, List[str]]] = MappingProxyType({
     "development": ["src", "tests", "scripts", "tools"],
     "documentation": ["docs", "examples", "resources"],
     "operations": ["config", "logs", "data"],
     "privacy": ["private", "convos", "credentials"],
-}
+})
 
 # Directory type mapping (conceptual → actual name) - from directory_profiles.py
-DEFAULT_DIRECTORY_TYPE_MAPPING = {
+DEFAULT_DIRECTORY_TYPE_MAPPING: Final[Mapping[str, str]] = MappingProxyType({
     "src": "src",  # Will be customized for each project (e.g., "repokit")
     "tests": "tests",
     "docs": "docs",
@@ -134,10 +209,296 @@ DEFAULT_DIRECTORY_TYPE_MAPPING = {
     "private": "private",
     "convos": "convos",
     "logs": "logs",
-}
+})
 
 # Enhanced private directory sets - from directory_profiles.py
-DEFAULT_PRIVATE_DIR_SETS = {
-    "standard": DEFAULT_PRIVATE_DIRS.copy(),
-    "enhanced": DEFAULT_PRIVATE_DIRS + ["credentials", "secrets", "local"],
-}
\ No newline at end of file
+DEFAULT_PRIVATE_DIR_SETS: Final[Mapping[str, List[str]]] = MappingProxyType({
+    "standard": list(DEFAULT_PRIVATE_DIRS),
+    "enhanced": list(DEFAULT_PRIVATE_DIRS) + ["credentials", "secrets", "local"],
+})
+
+
+# ---------------------------------------------------------------------------
+# Compiled pattern matchers
+#
+# The pattern lists above mix literal names ("nul", "CLAUDE.md") with glob
+# patterns ("*.tmp", "**/private_*"). Literals are answered with a set lookup;
+# only names that miss fall through to a single regex built from the globs.
+# ---------------------------------------------------------------------------
+
+_GLOB_MAGIC = frozenset("*?[")
+_WILDCARD_BUCKET = "*"
+
+# fnmatch.fnmatch() folds case on case-insensitive platforms; keep that behavior
+_CASE_INSENSITIVE = os.path.normcase("A") == "a"
+
+
+@lru_cache(maxsize=16384)
+def normalize_path(path: str) -> str:
+    """
+    Normalize a relative path for pattern matching.
+
+    Converts Windows separators to "/" and strips a leading "./". Cached,
+    since the same paths are checked against several pattern sets.
+
+    Args:
+        path: Relative path in either separator style
+
+    Returns:
+        Forward-slash path without a leading "./"
+    """
+    path = path.replace("\\", "/")
+    while path.startswith("./"):
+        path = path[2:]
+    return path
+
+
+def _partition_patterns(patterns):
+    """
+    Partition patterns into literal names and glob patterns.
+
+    Args:
+        patterns: Iterable of literal names and fnmatch-style glob patterns
+
+    Returns:
+        Tuple of (frozenset of literals, list of globs)
+    """
+    literals = set()
+    globs = []
+    for pattern in patterns:
+        pattern = pattern.replace("\\", "/")
+        if _GLOB_MAGIC.isdisjoint(pattern):
+            literals.add(pattern.lower() if _CASE_INSENSITIVE else pattern)
+        else:
+            globs.append(pattern)
+    return frozenset(literals), globs
+
+
+def _compile_globs(globs):
+    """Union glob patterns into one compiled regex, or None if there are none."""
+    if not globs:
+        return None
+    flags = re.IGNORECASE if _CASE_INSENSITIVE else 0
+    # dict.fromkeys drops duplicate alternatives while keeping order
+    alternatives = dict.fromkeys(fnmatch.translate(p) for p in globs)
+    return re.compile("|".join(alternatives), flags)
+
+
+def _split_patterns(patterns):
+    """
+    Partition patterns into literal names and a compiled glob regex.
+
+    Args:
+        patterns: Iterable of literal names and fnmatch-style glob patterns
+
+    Returns:
+        Tuple of (frozenset of literals, compiled regex or None)
+    """
+    literals, globs = _partition_patterns(patterns)
+    return literals, _compile_globs(globs)
+
+
+def _bucket_globs(globs):
+    """
+    Group glob patterns by their first character and compile each group.
+
+    Patterns starting with a literal character can only match paths that
+    start with the same character; patterns starting with a wildcard go in
+    the _WILDCARD_BUCKET and are tried for every path.
+
+    Args:
+        globs: List of fnmatch-style glob patterns
+
+    Returns:
+        Dictionary mapping first character to compiled regex
+    """
+    buckets = {}
+    for pattern in globs:
+        key = pattern[0]
+        if key in _GLOB_MAGIC:
+            key = _WILDCARD_BUCKET
+        elif _CASE_INSENSITIVE:
+            key = key.lower()
+        buckets.setdefault(key, []).append(pattern)
+    return {key: _compile_globs(group) for key, group in buckets.items()}
+
+
+def _matches(path, literals, glob_re):
+    """Match a path or its basename against split literals and globs."""
+    path = normalize_path(path)
+    if _CASE_INSENSITIVE:
+        path = path.lower()
+    name = path.rsplit("/", 1)[-1]
+    if path in literals or name in literals:
+        return True
+    if glob_re is None:
+        return False
+    return glob_re.match(path) is not None or glob_re.match(name) is not None
+
+
+@lru_cache(maxsize=32)
+def _compile_pattern_tuple(patterns):
+    """Build and cache the matcher for a tuple of patterns."""
+    literals, glob_re = _split_patterns(patterns)
+    return lambda path: _matches(path, literals, glob_re)
+
+
+def compile_patterns(patterns):
+    """
+    Build a matcher for sensitive-file style patterns.
+
+    A path matches when either its full (forward-slash) path or its basename
+    matches one of the patterns, mirroring the checks used during cleanup.
+    Matchers are cached per pattern list, so repeated calls with the same
+    configured patterns reuse the compiled regex.
+
+    Args:
+        patterns: Iterable of literal names and fnmatch-style glob patterns
+
+    Returns:
+        Callable taking a relative path and returning True on a match
+    """
+    return _compile_pattern_tuple(tuple(patterns))
+
+
+# Default matchers are built on first use (see __getattr__ below), so importing
+# this module for a constant such as DEFAULT_PRIVATE_BRANCHES compiles nothing.
+# They are left out of __all__, which linters check against names bound at
+# module level; explicit imports still resolve through __getattr__.
+_LAZY_MATCHERS = frozenset({
+    "SENSITIVE_LITERALS",
+    "SENSITIVE_GLOB_RE",
+    "PRIVATE_LITERALS",
+    "PRIVATE_PATTERN_BUCKETS",
+})
+
+
+@lru_cache(maxsize=None)
+def _default_matchers():
+    """
+    Compile the default matchers and publish them as module globals.
+
+    Returns:
+        Dictionary of matcher name to literal set, regex, or bucket mapping
+    """
+    sensitive_literals, sensitive_glob_re = _split_patterns(
+        DEFAULT_SENSITIVE_PATTERNS + DEFAULT_SENSITIVE_FILES
+    )
+    private_literals, private_globs = _partition_patterns(DEFAULT_PRIVATE_PATTERNS)
+    matchers = {
+        "SENSITIVE_LITERALS": sensitive_literals,
+        "SENSITIVE_GLOB_RE": sensitive_glob_re,
+        "PRIVATE_LITERALS": private_literals,
+        "PRIVATE_PATTERN_BUCKETS": MappingProxyType(_bucket_globs(private_globs)),
+    }
+    # Later attribute access skips __getattr__ entirely
+    globals().update(matchers)
+    return matchers
+
+
+def __getattr__(name):
+    """Build the default matchers on first access (PEP 562)."""
+    if name in _LAZY_MATCHERS:
+        return _default_matchers()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def is_sensitive(path: str) -> bool:
+    """
+    Check a path against the default sensitive files and patterns.
+
+    Args:
+        path: Repository-relative path
+
+    Returns:
+        True if the path or its basename matches a sensitive entry
+    """
+    matchers = _default_matchers()
+    return _matches(
+        path, matchers["SENSITIVE_LITERALS"], matchers["SENSITIVE_GLOB_RE"]
+    )
+
+
+def is_private_path(path: str) -> bool:
+    """
+    Check a path against the default private-branch-only patterns.
+
+    Literal entries match exactly, entries ending in "/" match anything
+    inside that top-level directory, and globs are matched on the full path
+    using only the bucket for its first character plus the wildcard bucket.
+
+    Args:
+        path: Repository-relative path
+
+    Returns:
+        True if the path should only exist in private branches
+    """
+    matchers = _default_matchers()
+    literals = matchers["PRIVATE_LITERALS"]
+    buckets = matchers["PRIVATE_PATTERN_BUCKETS"]
+
+    path = normalize_path(path)
+    if _CASE_INSENSITIVE:
+        path = path.lower()
+    if path in literals:
+        return True
+    head, sep, _ = path.partition("/")
+    if sep and head + "/" in literals:
+        return True
+    for key in (path[:1], _WILDCARD_BUCKET):
+        glob_re = buckets.get(key)
+        if glob_re is not None and glob_re.match(path) is not None:
+            return True
+    return False
+
+
+def _exclude_keys(path):
+    """Return the top-level component and basename used for exclude lookups."""
+    path = normalize_path(path)
+    return path.split("/", 1)[0], path.rsplit("/", 1)[-1]
+
+
+def excluded_branch_mask(path: str) -> int:
+    """
+    Get the bitmask of branches whose excludes cover a path.
+
+    A path is covered when its top-level directory or its basename is
+    listed in BRANCH_SPECIFIC_EXCLUDES for that branch.
+
+    Args:
+        path: Repository-relative path
+
+    Returns:
+        Bitmask built from BRANCH_BITS (0 if no branch excludes the path)
+    """
+    head, name = _exclude_keys(path)
+    return EXCLUDE_MASK.get(head, 0) | EXCLUDE_MASK.get(name, 0)
+
+
+def is_excluded_on_branch(branch: str, path: str) -> bool:
+    """
+    Check whether a path must be excluded from a branch.
+
+    Args:
+        branch: Branch name
+        path: Repository-relative path
+
+    Returns:
+        True if the branch's excludes cover the path
+    """
+    return bool(excluded_branch_mask(path) & BRANCH_BITS.get(branch, 0))
+
+
+def branches_excluding(path: str) -> frozenset:
+    """
+    Get the branches whose excludes cover a path.
+
+    Args:
+        path: Repository-relative path
+
+    Returns:
+        Frozenset of branch names (empty if no branch excludes the path)
+    """
+    head, name = _exclude_keys(path)
+    empty = frozenset()
+    return EXCLUDED_BRANCHES_FOR.get(head, empty) | EXCLUDED_BRANCHES_FOR.get(name, empty)
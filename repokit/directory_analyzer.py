@@ -7,84 +7,295 @@ Supports universal project migration for any project type.
 """
 
 import os
+import errno
 import fnmatch
 import shutil
 import logging
 import subprocess
+import sys
+import threading
+import time
 import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional, Any
+from typing import Dict, List, Set, FrozenSet, Tuple, Optional, Any
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 from .defaults import DEFAULT_PRIVATE_DIRS, DEFAULT_BRANCH_STRATEGIES
 
 
+# FICLONE ioctl from linux/fs.h: make dst share all of src's extents in one
+# call on reflink-capable filesystems (btrfs, XFS, bcachefs)
+_FICLONE = (
+    0x40049409 if fcntl is not None and sys.platform.startswith("linux") else None
+)
+
+
+# copy_file_range errors meaning "not possible here", not "the copy failed":
+# cross-device on older kernels, missing syscall, unsupported filesystem, or
+# a seccomp filter denying it. Anything else (ENOSPC, EIO, ...) propagates.
+_COPY_RANGE_UNSUPPORTED = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM}
+)
+
+
+# Directory listings keyed by (path, skipped names), valid while the
+# directory's mtime is unchanged: adding, removing or renaming an entry
+# always updates it. Listings younger than _RACY_LISTING_NS are not stored,
+# since a change within the same timestamp tick would go unnoticed.
+_LISTING_CACHE: Dict[Tuple[str, FrozenSet[str]], Tuple[int, tuple, tuple]] = {}
+_LISTING_CACHE_MAX = 65536
+_RACY_LISTING_NS = 2 * 10**9
+
+# Fully walked DirectoryAnalyzers keyed by (directory, verbose, concurrency
+# limit), stored with
+# the mtimes of every directory in their walk and reused while all of those
+# are unchanged. Trees with a directory modified within _RACY_LISTING_NS of
+# the walk are not stored.
+_ANALYZER_CACHE: Dict[
+    Tuple[str, int, Optional[int]], Tuple[Tuple[int, ...], "DirectoryAnalyzer"]
+] = {}
+_ANALYZER_CACHE_MAX = 32
+
+
+def _copy_file(src: str, dst: str) -> str:
+    """
+    Copy a file with its metadata, letting the kernel move the data.
+
+    On Linux, first tries a FICLONE reflink, an instant copy-on-write clone.
+    Otherwise uses os.copy_file_range where available, which copies
+    in-kernel (and may still share extents).
+    Falls back to shutil.copy2 (itself sendfile-based on Linux) only when
+    the syscall is unsupported for this pair of files; real I/O failures
+    such as a full disk are raised. Backups are real copies rather than
+    hardlinks, so later in-place edits of the original leave them intact.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+
+    Returns:
+        The destination path (usable as a shutil.copytree copy_function)
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        return shutil.copy2(src, dst)
+
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            if _FICLONE is not None and remaining > 0:
+                try:
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                    remaining = 0
+                except OSError:
+                    # Not reflink-capable here; copy_file_range reports
+                    # anything that is a real failure
+                    pass
+            while remaining > 0:
+                copied = copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except OSError as e:
+        if e.errno not in _COPY_RANGE_UNSUPPORTED:
+            raise
+        return shutil.copy2(src, dst)
+
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _scandir_snapshot(path: str) -> Dict[str, os.DirEntry]:
+    """
+    List a directory once, keeping each DirEntry.
+
+    DirEntry caches the dirent type (and stat results once requested), so
+    the snapshot can be shared by analyzers instead of each re-stat'ing the
+    same names.
+
+    Args:
+        path: Directory to list
+
+    Returns:
+        Dictionary of {name: DirEntry}
+
+    Raises:
+        OSError: If the directory cannot be listed
+    """
+    with os.scandir(path) as it:
+        return {entry.name: entry for entry in it}
+
+
 class GitManager:
     """
     Manages Git repository state detection and operations.
     """
 
-    def __init__(self, target_dir: str, verbose: int = 0):
-        """Initialize GitManager."""
+    def __init__(
+        self,
+        target_dir: str,
+        verbose: int = 0,
+        entry_cache: Optional[Dict[str, os.DirEntry]] = None,
+    ):
+        """
+        Initialize GitManager.
+
+        Args:
+            target_dir: Repository directory
+            verbose: Verbosity level (0=normal, 1=info, 2=debug)
+            entry_cache: Optional top-level scandir snapshot of target_dir,
+                used to answer is_git_repo() without another lstat
+        """
         self.target_dir = os.path.abspath(target_dir)
         self.verbose = verbose
         self.logger = logging.getLogger("repokit.git")
 
-    def run_git(self, args: List[str], check: bool = True) -> Optional[str]:
-        """Run a git command and return output."""
+        # Memoized read-only query results, dropped by any uncached command
+        self._git_cache: Dict[Tuple[str, ...], Optional[str]] = {}
+        self._state_cache: Optional[Dict[str, Any]] = None
+        self._is_repo: Optional[bool] = (
+            ".git" in entry_cache if entry_cache is not None else None
+        )
+
+    def clear_cache(self) -> None:
+        """Forget memoized query results and repository state."""
+        self._git_cache.clear()
+        self._state_cache = None
+        self._is_repo = None
+
+    def run_git(
+        self,
+        args: List[str],
+        check: bool = True,
+        cache: bool = False,
+        capture: bool = True,
+        input: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Run a git command and return output.
+
+        Args:
+            args: Git arguments (without the leading "git")
+            check: Raise CalledProcessError on failure instead of returning None
+            cache: Memoize the output; only for read-only queries. Any
+                uncached command clears the memoized results, since it may
+                change the repository.
+            capture: Capture stdout. When False, stdout is discarded and an
+                empty string is returned on success; for callers that only
+                need the exit status.
+            input: Text to feed to the command's stdin
+
+        Returns:
+            Stripped stdout, or None if the command failed and check is False
+        """
+        key = tuple(args)
+        if cache:
+            if key in self._git_cache:
+                return self._git_cache[key]
+        else:
+            self.clear_cache()
+
         cmd = ["git"] + args
 
         if self.verbose >= 2:
             self.logger.debug(f"Running: {' '.join(cmd)} in {self.target_dir}")
 
         try:
+            # Git emits paths as raw bytes; decode as UTF-8 and keep anything
+            # else round-trippable instead of failing under a non-UTF-8 locale
             result = subprocess.run(
-                cmd, cwd=self.target_dir, check=check, capture_output=True, text=True
+                cmd,
+                cwd=self.target_dir,
+                check=check,
+                input=input,
+                stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                encoding="utf-8",
+                errors="surrogateescape",
             )
-            return result.stdout.strip()
+            output = result.stdout.strip() if capture else ""
         except subprocess.CalledProcessError as e:
             if self.verbose >= 1:
                 self.logger.warning(f"Git command failed: {e.stderr}")
             if check:
                 raise
-            return None
+            output = None
+
+        if cache:
+            self._git_cache[key] = output
+        return output
 
     def is_git_repo(self) -> bool:
-        """Check if directory is a Git repository."""
-        return os.path.exists(os.path.join(self.target_dir, ".git"))
+        """
+        Check if directory is a Git repository.
+
+        A .git directory or a .git file (worktrees, submodules) counts. The
+        answer is cached alongside the repository state.
+        """
+        if self._is_repo is None:
+            self._is_repo = os.path.lexists(os.path.join(self.target_dir, ".git"))
+        return self._is_repo
 
     def get_repo_state(self) -> Dict[str, Any]:
-        """Get comprehensive Git repository state."""
+        """
+        Get comprehensive Git repository state.
+
+        The state is computed once and reused until a git command run through
+        run_git() without cache=True (or clear_cache()) invalidates it.
+        """
+        if self._state_cache is None:
+            self._state_cache = self._read_repo_state()
+        return self._state_cache
+
+    def _read_repo_state(self) -> Dict[str, Any]:
+        """Query Git for the repository state."""
         if not self.is_git_repo():
             return {"is_repo": False}
 
         state = {"is_repo": True}
 
         try:
-            # Get current branch
-            state["current_branch"] = self.run_git(
-                ["branch", "--show-current"], check=False
+            # Current branch, commits, and uncommitted changes in one call.
+            # -z NUL-terminates records, so paths containing newlines cannot
+            # be mistaken for extra records
+            status_output = self.run_git(
+                ["status", "--porcelain=v2", "--branch", "-z"], check=False, cache=True
             )
-
-            # Get all branches
-            branches_output = self.run_git(["branch", "-a"], check=False)
-            if branches_output:
-                branches = []
-                for line in branches_output.split("\n"):
-                    line = line.strip()
-                    if line and not line.startswith("remotes/"):
-                        branch = line.lstrip("* ").strip()
-                        if branch:
-                            branches.append(branch)
-                state["branches"] = branches
-
-            # Check for uncommitted changes
-            status_output = self.run_git(["status", "--porcelain"], check=False)
-            state["has_uncommitted_changes"] = bool(
-                status_output and status_output.strip()
+            current_branch = None
+            has_commits = False
+            has_changes = False
+            for record in (status_output or "").split("\0"):
+                if record.startswith("# branch.head "):
+                    head = record[len("# branch.head ") :]
+                    current_branch = "" if head == "(detached)" else head
+                elif record.startswith("# branch.oid "):
+                    has_commits = record != "# branch.oid (initial)"
+                elif record and not record.startswith("#"):
+                    has_changes = True
+                    break
+            state["current_branch"] = current_branch
+            state["has_uncommitted_changes"] = has_changes
+            state["has_commits"] = has_commits
+
+            # Get local branches
+            branches_output = self.run_git(
+                ["for-each-ref", "--format=%(refname:short)", "refs/heads/"],
+                check=False,
+                cache=True,
             )
+            if branches_output:
+                state["branches"] = [
+                    branch for branch in branches_output.split("\n") if branch
+                ]
 
             # Get remotes
-            remotes_output = self.run_git(["remote", "-v"], check=False)
+            remotes_output = self.run_git(["remote", "-v"], check=False, cache=True)
             remotes = {}
             if remotes_output:
                 for line in remotes_output.split("\n"):
@@ -97,13 +308,6 @@ class GitManager:
                                 remotes[remote_name] = remote_url
             state["remotes"] = remotes
 
-            # Check if repo has commits
-            try:
-                self.run_git(["rev-parse", "HEAD"], check=True)
-                state["has_commits"] = True
-            except:
-                state["has_commits"] = False
-
         except Exception as e:
             self.logger.warning(f"Error getting Git state: {str(e)}")
 
@@ -152,7 +356,7 @@ class ProjectAnalyzer:
                 "Pipfile",
                 "poetry.lock",
             ],
-            "extensions": [".py", ".pyw"],
+            "extensions": (".py", ".pyw"),
             "directories": ["src", "lib", "tests"],
         },
         "javascript": {
@@ -162,98 +366,140 @@ class ProjectAnalyzer:
                 "yarn.lock",
                 "webpack.config.js",
             ],
-            "extensions": [".js", ".jsx", ".ts", ".tsx"],
+            "extensions": (".js", ".jsx", ".ts", ".tsx"),
             "directories": ["src", "lib", "node_modules", "dist"],
         },
         "java": {
             "files": ["pom.xml", "build.gradle", "build.xml"],
-            "extensions": [".java", ".class"],
+            "extensions": (".java", ".class"),
             "directories": ["src", "target", "build"],
         },
         "csharp": {
             "files": ["*.csproj", "*.sln", "packages.config"],
-            "extensions": [".cs", ".vb"],
+            "extensions": (".cs", ".vb"),
             "directories": ["bin", "obj"],
         },
         "go": {
             "files": ["go.mod", "go.sum"],
-            "extensions": [".go"],
+            "extensions": (".go",),
             "directories": ["cmd", "pkg", "internal"],
         },
         "rust": {
             "files": ["Cargo.toml", "Cargo.lock"],
-            "extensions": [".rs"],
+            "extensions": (".rs",),
             "directories": ["src", "target"],
         },
     }
 
-    def __init__(self, target_dir: str, verbose: int = 0):
-        """Initialize ProjectAnalyzer."""
+    # Every extension that marks a file as source code
+    SOURCE_EXTENSIONS = frozenset(
+        ext for patterns in LANGUAGE_PATTERNS.values() for ext in patterns["extensions"]
+    )
+
+    def __init__(
+        self,
+        target_dir: str,
+        verbose: int = 0,
+        concurrency_limit: Optional[int] = None,
+        directory_analyzer: Optional["DirectoryAnalyzer"] = None,
+    ):
+        """
+        Initialize ProjectAnalyzer.
+
+        Args:
+            target_dir: Directory to analyze
+            verbose: Verbosity level (0=normal, 1=info, 2=debug)
+            concurrency_limit: Maximum parallel directory walks and file
+                copies (default: os.cpu_count())
+            directory_analyzer: Optional DirectoryAnalyzer for target_dir to
+                reuse instead of building (and walking) a new one
+        """
         self.target_dir = os.path.abspath(target_dir)
         self.verbose = verbose
         self.logger = logging.getLogger("repokit.project_analyzer")
 
+        # List the top level once and share the snapshot with both helpers
+        try:
+            entry_cache = _scandir_snapshot(self.target_dir)
+        except OSError:
+            entry_cache = None
+
         # Initialize Git manager
-        self.git_manager = GitManager(target_dir, verbose)
+        self.git_manager = GitManager(target_dir, verbose, entry_cache=entry_cache)
 
         # Initialize directory analyzer for RepoKit-specific analysis
-        self.directory_analyzer = DirectoryAnalyzer(target_dir, verbose)
-
-        # Project analysis results
-        self.project_type = None
-        self.language = None
-        self.git_state = None
-        self.migration_complexity = None
+        if directory_analyzer is None:
+            directory_analyzer = DirectoryAnalyzer(
+                target_dir,
+                verbose,
+                concurrency_limit=concurrency_limit,
+                entry_cache=entry_cache,
+            )
+        self.directory_analyzer = directory_analyzer
 
-        # Perform analysis
-        self._analyze_project()
+        # Project analysis results, each computed on first access so callers
+        # only pay for the git queries and tree walk they actually use
+        self._project_type = None
+        self._language = None
+        self._git_state = None
+        self._migration_complexity = None
 
-    def _analyze_project(self) -> None:
-        """Perform comprehensive project analysis."""
         self.logger.info(f"Analyzing project: {self.target_dir}")
 
-        # Detect project type and language
-        self.language = self._detect_language()
-        self.project_type = self._determine_project_type()
-
-        # Analyze Git state
-        self.git_state = self.git_manager.get_repo_state()
-
-        # Assess migration complexity
-        self.migration_complexity = self._assess_migration_complexity()
+    @property
+    def language(self) -> str:
+        """Get the primary programming language."""
+        if self._language is None:
+            self._language = self._detect_language()
+        return self._language
+
+    @property
+    def project_type(self) -> str:
+        """Get the project type."""
+        if self._project_type is None:
+            self._project_type = self._determine_project_type()
+        return self._project_type
+
+    @property
+    def git_state(self) -> Dict[str, Any]:
+        """Get the Git repository state."""
+        if self._git_state is None:
+            self._git_state = self.git_manager.get_repo_state()
+        return self._git_state
+
+    @property
+    def migration_complexity(self) -> str:
+        """Get the migration complexity level."""
+        if self._migration_complexity is None:
+            self._migration_complexity = self._assess_migration_complexity()
+        return self._migration_complexity
 
     def _detect_language(self) -> str:
         """Detect primary programming language."""
         scores = {lang: 0 for lang in self.LANGUAGE_PATTERNS}
 
-        # Check for characteristic files
+        # Characteristic file/directory checks use the analyzer's top-level
+        # snapshot
+        top_entries = self.directory_analyzer.get_top_level_names() or frozenset()
+
+        # File counts by extension come from the directory analyzer's shared walk
+        ext_counts = self.directory_analyzer.get_extension_counts()
+
         for lang, patterns in self.LANGUAGE_PATTERNS.items():
+            # Check for characteristic files
             for file_pattern in patterns["files"]:
                 if "*" in file_pattern:
-                    # Handle glob patterns
-                    import glob
-
-                    matches = glob.glob(os.path.join(self.target_dir, file_pattern))
-                    if matches:
-                        scores[lang] += 10
-                else:
-                    # Direct file check
-                    if os.path.exists(os.path.join(self.target_dir, file_pattern)):
+                    # Match glob patterns against the in-memory listing
+                    if fnmatch.filter(top_entries, file_pattern):
                         scores[lang] += 10
+                elif file_pattern in top_entries:
+                    scores[lang] += 10
 
-            # Count files by extension
-            ext_count = 0
-            for root, dirs, files in os.walk(self.target_dir):
-                if ".git" in root:
-                    continue
-                for file in files:
-                    if any(file.endswith(ext) for ext in patterns["extensions"]):
-                        ext_count += 1
-            scores[lang] += ext_count
+            scores[lang] += sum(ext_counts[ext] for ext in patterns["extensions"])
 
             # Check for characteristic directories
             for dir_name in patterns["directories"]:
-                if os.path.exists(os.path.join(self.target_dir, dir_name)):
+                if dir_name in top_entries:
                     scores[lang] += 5
 
         # Return language with highest score
@@ -263,9 +509,14 @@ class ProjectAnalyzer:
 
     def _determine_project_type(self) -> str:
         """Determine project type based on structure and content."""
+        # Every presence check below reads the analyzer's top-level snapshot
+        # instead of stat'ing candidate paths
+        top_names = self.directory_analyzer.get_top_level_names()
+        known_names = top_names or frozenset()
+
         # Check if it's definitively a RepoKit-managed project
         repokit_config_path = os.path.join(self.target_dir, ".repokit.json")
-        if os.path.exists(repokit_config_path):
+        if ".repokit.json" in known_names:
             try:
                 with open(repokit_config_path, 'r') as f:
                     config = json.load(f)
@@ -283,18 +534,14 @@ class ProjectAnalyzer:
                 return "repokit"
         
         # Check for RepoKit-like structure (but not definitively RepoKit-managed)
-        if self._has_repokit_structure():
+        if self._has_repokit_structure(known_names):
             return "repokit_like"
 
-        # Check for empty directory
-        try:
-            contents = os.listdir(self.target_dir)
-            # Filter out hidden files for empty check
-            visible_contents = [item for item in contents if not item.startswith(".")]
-            if not visible_contents:
-                return "empty"
-        except OSError:
+        # Check for empty directory, ignoring hidden files
+        if top_names is None:
             return "inaccessible"
+        if all(name.startswith(".") for name in top_names):
+            return "empty"
 
         # Check if it's a Git repository
         if self.git_state and self.git_state.get("is_repo"):
@@ -304,18 +551,8 @@ class ProjectAnalyzer:
                 return "git_new"
 
         # Check if it has source files
-        has_source = False
-        for root, dirs, files in os.walk(self.target_dir):
-            for file in files:
-                if any(
-                    file.endswith(ext)
-                    for lang_patterns in self.LANGUAGE_PATTERNS.values()
-                    for ext in lang_patterns["extensions"]
-                ):
-                    has_source = True
-                    break
-            if has_source:
-                break
+        ext_counts = self.directory_analyzer.get_extension_counts()
+        has_source = any(ext_counts[ext] for ext in self.SOURCE_EXTENSIONS)
 
         if has_source:
             return "source_no_git"
@@ -450,20 +687,19 @@ class ProjectAnalyzer:
 
         return steps
 
-    def _has_repokit_structure(self) -> bool:
+    def _has_repokit_structure(self, top_names: Set[str]) -> bool:
         """
         Check for RepoKit-specific directory structure patterns.
-        
+
+        Args:
+            top_names: Names present at the top level of the target directory
+
         Returns:
             True if directory structure suggests RepoKit-like organization
         """
         # Check for RepoKit standard directories
         repokit_dirs = ["private", "logs", "scripts", "tests", "docs"]
-        found_dirs = 0
-        
-        for directory in repokit_dirs:
-            if os.path.exists(os.path.join(self.target_dir, directory)):
-                found_dirs += 1
+        found_dirs = sum(1 for directory in repokit_dirs if directory in top_names)
         
         # Require majority of RepoKit directories to suggest RepoKit structure
         return found_dirs >= len(repokit_dirs) * 0.6
@@ -479,76 +715,246 @@ class DirectoryAnalyzer:
     """
 
     # Standard RepoKit directories
-    STANDARD_DIRS = [
-        "convos",
-        "docs",
-        "logs",
-        "private",
-        "revisions",
-        "scripts",
-        "tests",
-    ]
+    STANDARD_DIRS = frozenset(
+        {
+            "convos",
+            "docs",
+            "logs",
+            "private",
+            "revisions",
+            "scripts",
+            "tests",
+        }
+    )
 
     # Private directories that shouldn't be checked in
     PRIVATE_DIRS = DEFAULT_PRIVATE_DIRS
 
     # Special directories that need special handling
-    SPECIAL_DIRS = [".git", ".github", ".vscode"]
+    SPECIAL_DIRS = (".git", ".github", ".vscode")
 
     # Template directories to look for in the target
-    TEMPLATE_DIRS = [".github"]
+    TEMPLATE_DIRS = (".github",)
+
+    # Action per migration strategy for special and template directories
+    # (unknown strategies keep everything), and per-directory exceptions
+    STRATEGY_ACTIONS = {"safe": "backup", "replace": "replace", "merge": "merge"}
+    SPECIAL_DIR_ACTIONS = {("safe", ".git"): "keep"}
+
+    # File categories, in reporting order
+    CATEGORIES = (
+        "python",  # Python source files
+        "javascript",  # JavaScript source files
+        "html",  # HTML files
+        "css",  # CSS files
+        "markdown",  # Markdown files
+        "images",  # Image files
+        "documents",  # Document files
+        "data",  # Data files
+        "config",  # Configuration files
+        "other",  # Other files
+    )
 
-    def __init__(self, target_dir: str, verbose: int = 0):
+    # File category by lowercased extension; anything else is "other"
+    EXT_TO_CATEGORY = {
+        ".py": "python",
+        ".pyw": "python",
+        ".js": "javascript",
+        ".jsx": "javascript",
+        ".ts": "javascript",
+        ".tsx": "javascript",
+        ".html": "html",
+        ".htm": "html",
+        ".css": "css",
+        ".scss": "css",
+        ".sass": "css",
+        ".md": "markdown",
+        ".markdown": "markdown",
+        ".png": "images",
+        ".jpg": "images",
+        ".jpeg": "images",
+        ".gif": "images",
+        ".svg": "images",
+        ".ico": "images",
+        ".doc": "documents",
+        ".docx": "documents",
+        ".pdf": "documents",
+        ".txt": "documents",
+        ".rtf": "documents",
+        ".csv": "data",
+        ".json": "data",
+        ".xml": "data",
+        ".yaml": "data",
+        ".yml": "data",
+        ".ini": "config",
+        ".cfg": "config",
+        ".conf": "config",
+        ".config": "config",
+        ".toml": "config",
+    }
+
+    # VCS metadata and generated directories never descended into when
+    # categorizing files
+    SKIP_DIRS = frozenset(
+        {
+            ".git",
+            "node_modules",
+            "target",
+            "__pycache__",
+            ".venv",
+            "dist",
+            "build",
+        }
+    )
+
+    # Infix of the names trees are renamed to while _discard_tree() deletes
+    # them; such directories are never walked
+    DISCARD_MARKER = ".repokit-discard-"
+
+    def __init__(
+        self,
+        target_dir: str,
+        verbose: int = 0,
+        concurrency_limit: Optional[int] = None,
+        entry_cache: Optional[Dict[str, os.DirEntry]] = None,
+    ):
         """
         Initialize the directory analyzer.
 
         Args:
             target_dir: Directory to analyze
             verbose: Verbosity level (0=normal, 1=info, 2=debug)
+            concurrency_limit: Maximum number of subtrees walked in parallel
+                (default: os.cpu_count(); 1 walks serially)
+            entry_cache: Optional top-level scandir snapshot of target_dir
+                already taken by the caller; used instead of rescanning
         """
         self.target_dir = os.path.abspath(target_dir)
         self.verbose = verbose
         self.logger = logging.getLogger("repokit.analyzer")
+        self.concurrency_limit = concurrency_limit or os.cpu_count() or 1
+
+        # Background deletions of replaced backups, as (thread, renamed path)
+        self._cleanup_threads: List[Tuple[threading.Thread, str]] = []
+        self._discard_count = 0
+
+        # The target directory is scanned on first use of a result
+        self._reset_results()
+        self._entry_cache = entry_cache
 
+    def _reset_results(self) -> None:
+        """Clear the scan results and the cached tree walk."""
         # Analysis results
-        self.existing_dirs = set()
-        self.missing_dirs = set()
-        self.special_dirs = {}
-        self.template_conflicts = {}
-
-        # Scan target directory
-        self._scan_directory()
-
-    def _scan_directory(self) -> None:
-        """Scan the target directory and categorize content."""
-        if not os.path.exists(self.target_dir):
-            self.logger.warning(f"Target directory does not exist: {self.target_dir}")
-            return
+        self._scanned = False
+        self._existing_dirs = set()
+        self._missing_dirs = set()
+        self._special_dirs = {}
+        self._template_conflicts = {}
+        self._has_git_repository = False
+        self._has_template_conflicts = False
+
+        # Top-level DirEntry snapshot (names are None if the directory could
+        # not be listed) and results of the single tree walk shared by the
+        # file analyses
+        self._top_entries = {}
+        self._top_names: Optional[FrozenSet[str]] = None
+        self._walk_cache = None
+
+    def refresh(self) -> None:
+        """
+        Rescan the target directory, discarding cached results.
+
+        The tree is walked at most once per analyzer, and categorize_files(),
+        suggest_language() and get_summary() all reuse that walk. Call this
+        after the directory has changed (e.g. after execute_migration_plan())
+        to analyze its new contents.
+        """
+        self._reset_results()
+        self._entry_cache = None
+
+    def _ensure_scanned(self) -> None:
+        """Scan the target directory if that has not happened yet."""
+        if not self._scanned:
+            self._scanned = True
+            entry_cache, self._entry_cache = self._entry_cache, None
+            self._scan_directory(entry_cache)
+
+    @property
+    def existing_dirs(self) -> Set[str]:
+        """Standard directories present in the target directory."""
+        self._ensure_scanned()
+        return self._existing_dirs
+
+    @property
+    def missing_dirs(self) -> Set[str]:
+        """Standard directories absent from the target directory."""
+        self._ensure_scanned()
+        return self._missing_dirs
+
+    @property
+    def special_dirs(self) -> Dict[str, str]:
+        """Special directories found, as {name: path}."""
+        self._ensure_scanned()
+        return self._special_dirs
+
+    @property
+    def template_conflicts(self) -> Dict[str, Dict[str, str]]:
+        """Existing files per template directory, as {dir: {rel path: path}}."""
+        self._ensure_scanned()
+        return self._template_conflicts
+
+    def _scan_directory(
+        self, entry_cache: Optional[Dict[str, os.DirEntry]] = None
+    ) -> None:
+        """
+        Scan the target directory and categorize content.
+
+        Args:
+            entry_cache: Optional top-level scandir snapshot to reuse
+        """
+        # One scandir of the top level; DirEntry.is_dir() reuses the dirent
+        # type instead of a stat per candidate name, and a missing target is
+        # reported by scandir itself rather than a separate exists() probe
+        if entry_cache is None:
+            try:
+                entry_cache = _scandir_snapshot(self.target_dir)
+            except FileNotFoundError:
+                self.logger.warning(f"Target directory does not exist: {self.target_dir}")
+                return
+            except OSError as e:
+                self.logger.warning(f"Cannot scan directory {self.target_dir}: {e}")
 
         self.logger.info(f"Scanning directory: {self.target_dir}")
 
+        if entry_cache is not None:
+            self._top_entries = entry_cache
+            self._top_names = frozenset(entry_cache)
+        top_dirs = {
+            name: entry.path
+            for name, entry in self._top_entries.items()
+            if entry.is_dir()
+        }
+
         # Check for standard directories
-        for dirname in self.STANDARD_DIRS:
-            dirpath = os.path.join(self.target_dir, dirname)
-            if os.path.exists(dirpath) and os.path.isdir(dirpath):
-                self.existing_dirs.add(dirname)
-            else:
-                self.missing_dirs.add(dirname)
+        self._existing_dirs = top_dirs.keys() & self.STANDARD_DIRS
+        self._missing_dirs = set(self.STANDARD_DIRS.difference(top_dirs))
 
         # Check for special directories
         for dirname in self.SPECIAL_DIRS:
-            dirpath = os.path.join(self.target_dir, dirname)
-            if os.path.exists(dirpath) and os.path.isdir(dirpath):
-                self.special_dirs[dirname] = dirpath
+            if dirname in top_dirs:
+                self._special_dirs[dirname] = top_dirs[dirname]
 
         # Check for template conflicts
         for template_dir in self.TEMPLATE_DIRS:
-            dirpath = os.path.join(self.target_dir, template_dir)
-            if os.path.exists(dirpath) and os.path.isdir(dirpath):
-                self.template_conflicts[template_dir] = self._scan_template_conflicts(
+            if template_dir in top_dirs:
+                self._template_conflicts[template_dir] = self._scan_template_conflicts(
                     template_dir
                 )
 
+        # Scan results are fixed from here on; answer the summary checks once
+        self._has_git_repository = ".git" in self._special_dirs
+        self._has_template_conflicts = any(self._template_conflicts.values())
+
         if self.verbose >= 1:
             self._log_scan_results()
 
@@ -565,46 +971,66 @@ class DirectoryAnalyzer:
         conflicts = {}
         dirpath = os.path.join(self.target_dir, template_dir)
 
-        if not os.path.exists(dirpath):
-            return conflicts
-
-        for root, dirs, files in os.walk(dirpath):
+        # Walk roots are dirpath itself or dirpath + sep + subpath, so both
+        # path prefixes are built once per directory and file names are
+        # concatenated onto them (a missing dirpath walks to nothing)
+        prefix_len = len(dirpath) + 1
+        for root, files in self._walk_tree(dirpath):
+            rel_prefix = os.path.join(root[prefix_len:], "") if root != dirpath else ""
+            root_prefix = os.path.join(root, "")
             for file in files:
-                filepath = os.path.join(root, file)
-                rel_path = os.path.relpath(filepath, dirpath)
-                conflicts[rel_path] = filepath
+                conflicts[rel_prefix + file] = root_prefix + file
 
         return conflicts
 
     def _log_scan_results(self) -> None:
         """Log the results of the directory scan."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         self.logger.info(
-            f"Existing standard directories: {', '.join(self.existing_dirs) or 'None'}"
+            "Existing standard directories: %s",
+            ", ".join(self._existing_dirs) or "None",
         )
         self.logger.info(
-            f"Missing standard directories: {', '.join(self.missing_dirs) or 'None'}"
+            "Missing standard directories: %s", ", ".join(self._missing_dirs) or "None"
         )
         self.logger.info(
-            f"Special directories found: {', '.join(self.special_dirs.keys()) or 'None'}"
+            "Special directories found: %s", ", ".join(self._special_dirs) or "None"
         )
 
-        if self.template_conflicts:
-            for template_dir, conflicts in self.template_conflicts.items():
-                self.logger.info(
-                    f"Potential conflicts in {template_dir}: {len(conflicts)} files"
-                )
+        list_files = self.verbose >= 2 and self.logger.isEnabledFor(logging.DEBUG)
+        for template_dir, conflicts in self._template_conflicts.items():
+            self.logger.info(
+                "Potential conflicts in %s: %d files", template_dir, len(conflicts)
+            )
 
-                if self.verbose >= 2:
-                    for rel_path in conflicts:
-                        self.logger.debug(f"  - {rel_path}")
+            if list_files:
+                for rel_path in conflicts:
+                    self.logger.debug("  - %s", rel_path)
+
+    def get_top_level_names(self) -> Optional[FrozenSet[str]]:
+        """
+        Get the names at the top level of the target directory.
+
+        Returns:
+            Frozenset of entry names from the scan, or None if the target
+            directory does not exist or could not be listed
+        """
+        self._ensure_scanned()
+        return self._top_names
 
     def has_git_repository(self) -> bool:
         """Check if the target directory is a Git repository."""
-        return ".git" in self.special_dirs
+        if not self._scanned:
+            # One stat instead of the full scan (which also walks .github)
+            return os.path.isdir(os.path.join(self.target_dir, ".git"))
+        return self._has_git_repository
 
     def has_template_conflicts(self) -> bool:
         """Check if there are any template conflicts."""
-        return any(len(conflicts) > 0 for conflicts in self.template_conflicts.values())
+        self._ensure_scanned()
+        return self._has_template_conflicts
 
     def get_migration_plan(self, strategy: str = "safe") -> Dict[str, Any]:
         """
@@ -616,6 +1042,9 @@ class DirectoryAnalyzer:
         Returns:
             Dictionary with migration plan details
         """
+        # Template conflict handling depends only on the strategy
+        template_action = self._get_template_conflict_action(None, strategy)
+
         plan = {
             "target_dir": self.target_dir,
             "create_dirs": list(self.missing_dirs),
@@ -625,10 +1054,7 @@ class DirectoryAnalyzer:
                 for k, v in self.special_dirs.items()
             },
             "template_conflicts": {
-                k: {
-                    "conflicts": len(v),
-                    "action": self._get_template_conflict_action(k, strategy),
-                }
+                k: {"conflicts": len(v), "action": template_action}
                 for k, v in self.template_conflicts.items()
             },
             "strategy": strategy,
@@ -647,37 +1073,24 @@ class DirectoryAnalyzer:
         Returns:
             Action to take ("keep", "backup", "replace", "merge")
         """
-        if strategy == "safe":
-            if dirname == ".git":
-                return "keep"
-            else:
-                return "backup"
-        elif strategy == "replace":
-            return "replace"
-        elif strategy == "merge":
-            return "merge"
-        else:
-            return "keep"
+        action = self.SPECIAL_DIR_ACTIONS.get((strategy, dirname))
+        return action or self.STRATEGY_ACTIONS.get(strategy, "keep")
 
-    def _get_template_conflict_action(self, template_dir: str, strategy: str) -> str:
+    def _get_template_conflict_action(
+        self, template_dir: Optional[str], strategy: str
+    ) -> str:
         """
         Determine action for template conflicts based on strategy.
 
         Args:
-            template_dir: Template directory name
+            template_dir: Template directory name (unused; the action is
+                the same for every template directory)
             strategy: Migration strategy
 
         Returns:
             Action to take ("keep", "backup", "replace", "merge")
         """
-        if strategy == "safe":
-            return "backup"
-        elif strategy == "replace":
-            return "replace"
-        elif strategy == "merge":
-            return "merge"
-        else:
-            return "keep"
+        return self.STRATEGY_ACTIONS.get(strategy, "keep")
 
     def execute_migration_plan(
         self, plan: Dict[str, Any], dry_run: bool = False
@@ -712,9 +1125,8 @@ class DirectoryAnalyzer:
                 backup_path = f"{path}_backup"
                 self.logger.info(f"Backing up {dirname} to {backup_path}")
                 if not dry_run:
-                    if os.path.exists(backup_path):
-                        shutil.rmtree(backup_path)
-                    shutil.copytree(path, backup_path)
+                    self._discard_tree(backup_path)
+                    shutil.copytree(path, backup_path, copy_function=_copy_file)
             elif action == "replace":
                 self.logger.info(f"Replacing {dirname}")
                 if not dry_run:
@@ -737,12 +1149,7 @@ class DirectoryAnalyzer:
                     f"Backing up {len(conflicts)} files from {template_dir} to {backup_dir}"
                 )
                 if not dry_run:
-                    if not os.path.exists(backup_dir):
-                        os.makedirs(backup_dir, exist_ok=True)
-                    for rel_path, filepath in conflicts.items():
-                        backup_path = os.path.join(backup_dir, rel_path)
-                        os.makedirs(os.path.dirname(backup_path), exist_ok=True)
-                        shutil.copy2(filepath, backup_path)
+                    self._backup_files(conflicts, backup_dir)
             elif action == "replace":
                 self.logger.info(f"Replacing {len(conflicts)} files in {template_dir}")
                 dirpath = os.path.join(self.target_dir, template_dir)
@@ -753,62 +1160,339 @@ class DirectoryAnalyzer:
                     f"Marking {template_dir} for merge (requires template content)"
                 )
 
+        self.wait_for_cleanup()
         return True
 
+    def wait_for_cleanup(self) -> bool:
+        """
+        Wait for the background deletions started by the migration.
+
+        execute_migration_plan() calls this before returning, so renamed
+        trees never outlive it.
+
+        Returns:
+            True if every discarded tree is gone, False otherwise
+        """
+        threads, self._cleanup_threads = self._cleanup_threads, []
+        clean = True
+        for thread, old_path in threads:
+            thread.join()
+            if os.path.lexists(old_path):
+                self.logger.warning(f"Could not delete old backup: {old_path}")
+                clean = False
+        return clean
+
+    def _discard_tree(self, path: str) -> None:
+        """
+        Move a directory tree out of the way and delete it in the background.
+
+        The rename to a DISCARD_MARKER name next to path frees the path
+        immediately; the delete then overlaps with the rest of the migration
+        until wait_for_cleanup() joins it.
+
+        Args:
+            path: Directory (or file) to discard; nothing happens if it does
+                not exist
+
+        Raises:
+            OSError: If path can neither be renamed nor deleted
+        """
+        old_path = f"{path}{self.DISCARD_MARKER}{os.getpid()}-{self._discard_count}"
+        self._discard_count += 1
+        try:
+            os.rename(path, old_path)
+        except FileNotFoundError:
+            return
+        except OSError:
+            # Not renameable here; delete in place instead
+            self._remove_path(path)
+            return
+
+        thread = threading.Thread(target=self._remove_path, args=(old_path, True))
+        thread.start()
+        self._cleanup_threads.append((thread, old_path))
+
+    @staticmethod
+    def _remove_path(path: str, ignore_errors: bool = False) -> None:
+        """
+        Delete a directory tree, or a single file or symlink.
+
+        Args:
+            path: Path to delete
+            ignore_errors: If True, leave whatever cannot be deleted
+        """
+        try:
+            if os.path.isdir(path) and not os.path.islink(path):
+                shutil.rmtree(path, ignore_errors=ignore_errors)
+            else:
+                os.remove(path)
+        except OSError:
+            if not ignore_errors:
+                raise
+
+    def _backup_files(self, files: Dict[str, str], backup_dir: str) -> None:
+        """
+        Copy files into a backup directory, several at a time.
+
+        The backup directory tree is created up front, one makedirs per
+        deepest directory (makedirs creates the ancestors on the way), then
+        the copies run on a thread pool so their I/O latency overlaps.
+
+        Args:
+            files: Dictionary of {relative path: source path}
+            backup_dir: Directory to copy the files into
+        """
+        pairs = [
+            (filepath, os.path.join(backup_dir, rel_path))
+            for rel_path, filepath in files.items()
+        ]
+        dirs = {backup_dir} | {os.path.dirname(dst) for _, dst in pairs}
+        ancestors = set()
+        for dirpath in dirs:
+            parent = os.path.dirname(dirpath)
+            while len(parent) >= len(backup_dir) and parent not in ancestors:
+                ancestors.add(parent)
+                parent = os.path.dirname(parent)
+        for dirpath in dirs - ancestors:
+            os.makedirs(dirpath, exist_ok=True)
+
+        # For a handful of files, starting threads costs more than the
+        # overlapped I/O saves
+        workers = min(16, self.concurrency_limit, len(pairs))
+        if workers <= 1 or len(pairs) <= 4:
+            for src, dst in pairs:
+                _copy_file(src, dst)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # list() surfaces any copy error
+            list(executor.map(lambda pair: _copy_file(*pair), pairs))
+
+    def _walk_once(self) -> Dict[str, Any]:
+        """
+        Walk the target directory once and cache the results.
+
+        The walk keeps the (dirpath, filenames) listing and the file counts by
+        extension, so language detection, project type detection and the
+        summary all share one traversal. Per-category path lists are only
+        built if categorize_files() asks for them.
+
+        Returns:
+            Dictionary with "tree", "ext_counts", "total_files" and
+            "categories" (None until first requested)
+        """
+        if self._walk_cache is None:
+            tree = self._walk_tree(self.target_dir)
+            ext_counts = Counter()
+            total_files = 0
+            extension = self._extension
+            for _, files in tree:
+                total_files += len(files)
+                # Counter.update() counts an iterable in C
+                ext_counts.update(map(extension, files))
+            # Extensionless files are tallied under "" above
+            del ext_counts[""]
+            self._walk_cache = {
+                "tree": tree,
+                "ext_counts": ext_counts,
+                "total_files": total_files,
+                "categories": None,
+            }
+        return self._walk_cache
+
+    @staticmethod
+    def _extension(filename: str) -> str:
+        """Return the lowercased extension of a file name, including the dot."""
+        dot = filename.rfind(".")
+        return filename[dot:].lower() if dot >= 0 else ""
+
+    def get_extension_counts(self) -> Counter:
+        """
+        Get file counts by extension for the target directory.
+
+        Returns:
+            Counter mapping lowercased extension (including the dot) to number of files
+        """
+        return self._walk_once()["ext_counts"]
+
+    def categorize_counts(self) -> Dict[str, int]:
+        """
+        Count files per category in the target directory.
+
+        Derived from the extension counts, so no per-file path lists are
+        built.
+
+        Returns:
+            Dictionary of {category: file count}
+        """
+        walk = self._walk_once()
+        counts = dict.fromkeys(self.CATEGORIES, 0)
+        for ext, count in walk["ext_counts"].items():
+            counts[self.EXT_TO_CATEGORY.get(ext, "other")] += count
+        counts["other"] += walk["total_files"] - sum(walk["ext_counts"].values())
+        return counts
+
     def categorize_files(self, path: str = None) -> Dict[str, List[str]]:
         """
         Categorize files in a directory by type.
 
+        Results for the target directory are cached; treat them as read-only.
+        Callers that only need counts should use categorize_counts().
+
         Args:
             path: Directory path to categorize (default: target_dir)
 
         Returns:
             Dictionary with categorized files
         """
-        path = path or self.target_dir
-
-        categories = {
-            "python": [],  # Python source files
-            "javascript": [],  # JavaScript source files
-            "html": [],  # HTML files
-            "css": [],  # CSS files
-            "markdown": [],  # Markdown files
-            "images": [],  # Image files
-            "documents": [],  # Document files
-            "data": [],  # Data files
-            "config": [],  # Configuration files
-            "other": [],  # Other files
-        }
+        if path is None or os.path.abspath(path) == self.target_dir:
+            walk = self._walk_once()
+            if walk["categories"] is None:
+                walk["categories"] = self._categorize_tree(walk["tree"])
+            return walk["categories"]
+        return self._categorize_tree(self._walk_tree(path))
+
+    def _split_entries(self, entries) -> Tuple[List[str], List[str]]:
+        """
+        Split directory entries into subdirectories to descend and files.
+
+        Uses the dirent type cached on each DirEntry, so no entry is stat'ed.
+        Symlinks are neither followed nor categorized, and SKIP_DIRS and
+        trees being discarded are dropped.
+
+        Args:
+            entries: Iterable of os.DirEntry objects
+
+        Returns:
+            Tuple of (subdirectory paths, regular file names)
+        """
+        dirs = []
+        files = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                name = entry.name
+                if name not in self.SKIP_DIRS and self.DISCARD_MARKER not in name:
+                    dirs.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                files.append(entry.name)
+        return dirs, files
+
+    def _list_dir(self, path: str) -> Tuple[List[str], List[str]]:
+        """
+        List one directory with os.scandir, reusing an unchanged listing.
+
+        A directory whose mtime matches the one recorded at its last listing
+        (in this process) costs one stat instead of a full scandir.
+
+        Args:
+            path: Directory to list
+
+        Returns:
+            Tuple of (subdirectory paths, regular file names); empty if the
+            directory cannot be read
+        """
+        key = (path, self.SKIP_DIRS)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+            cached = _LISTING_CACHE.get(key)
+            if cached is not None and cached[0] == mtime_ns:
+                return list(cached[1]), list(cached[2])
+            with os.scandir(path) as it:
+                dirs, files = self._split_entries(it)
+        except OSError:
+            return [], []
+
+        if time.time_ns() - mtime_ns > _RACY_LISTING_NS:
+            if len(_LISTING_CACHE) >= _LISTING_CACHE_MAX:
+                _LISTING_CACHE.clear()
+            _LISTING_CACHE[key] = (mtime_ns, tuple(dirs), tuple(files))
+        return dirs, files
+
+    def _walk_subtree(self, top: str) -> List[Tuple[str, List[str]]]:
+        """
+        Walk one directory tree serially, skipping SKIP_DIRS.
+
+        Args:
+            top: Directory to walk
 
-        for root, dirs, files in os.walk(path):
-            # Skip .git directory
-            if ".git" in root.split(os.sep):
-                continue
+        Returns:
+            List of (dirpath, filenames) tuples in top-down order
+        """
+        result = []
+        stack = [top]
+        while stack:
+            root = stack.pop()
+            dirs, files = self._list_dir(root)
+            result.append((root, files))
+            # Reversed so subdirectories pop in listing order
+            stack.extend(reversed(dirs))
+        return result
+
+    def _walk_tree(self, path: str) -> List[Tuple[str, List[str]]]:
+        """
+        Walk a directory tree, fanning its subdirectories out to a thread pool.
+
+        Directory listing is I/O-bound, so on network or virtualized
+        filesystems several listings in flight overlap their latency. Results
+        keep the top-down order of a serial walk. The target directory's own
+        listing comes from the snapshot taken by _scan_directory().
+
+        Args:
+            path: Directory to walk
+
+        Returns:
+            List of (dirpath, filenames) tuples in top-down order
+        """
+        top_entries = None
+        if path == self.target_dir:
+            self._ensure_scanned()
+            top_entries = self._top_entries
+        if top_entries:
+            subdirs, files = self._split_entries(top_entries.values())
+        else:
+            # Let scandir report a missing or non-directory path rather than
+            # paying for a separate isdir() stat first
+            try:
+                with os.scandir(path) as it:
+                    subdirs, files = self._split_entries(it)
+            except OSError:
+                return []
+
+        result = [(path, files)]
+        workers = min(32, self.concurrency_limit, len(subdirs))
+        if workers <= 1:
+            for subdir in subdirs:
+                result.extend(self._walk_subtree(subdir))
+            return result
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for subtree in executor.map(self._walk_subtree, subdirs):
+                result.extend(subtree)
+        return result
+
+    def _categorize_tree(
+        self, tree: List[Tuple[str, List[str]]]
+    ) -> Dict[str, List[str]]:
+        """
+        Categorize the files of a walked directory tree.
+
+        Args:
+            tree: List of (dirpath, filenames) tuples from _walk_tree()
+
+        Returns:
+            Dictionary with categorized files
+        """
+        categories = {category: [] for category in self.CATEGORIES}
 
+        ext_to_category = self.EXT_TO_CATEGORY
+        extension = self._extension
+        for root, files in tree:
+            # Join the separator once per directory, then concatenate names
+            prefix = os.path.join(root, "")
             for file in files:
-                filepath = os.path.join(root, file)
-
-                # Categorize by extension
-                if file.endswith((".py", ".pyw")):
-                    categories["python"].append(filepath)
-                elif file.endswith((".js", ".jsx", ".ts", ".tsx")):
-                    categories["javascript"].append(filepath)
-                elif file.endswith((".html", ".htm")):
-                    categories["html"].append(filepath)
-                elif file.endswith((".css", ".scss", ".sass")):
-                    categories["css"].append(filepath)
-                elif file.endswith((".md", ".markdown")):
-                    categories["markdown"].append(filepath)
-                elif file.endswith((".png", ".jpg", ".jpeg", ".gif", ".svg", ".ico")):
-                    categories["images"].append(filepath)
-                elif file.endswith((".doc", ".docx", ".pdf", ".txt", ".rtf")):
-                    categories["documents"].append(filepath)
-                elif file.endswith((".csv", ".json", ".xml", ".yaml", ".yml")):
-                    categories["data"].append(filepath)
-                elif file.endswith((".ini", ".cfg", ".conf", ".config", ".toml")):
-                    categories["config"].append(filepath)
-                else:
-                    categories["other"].append(filepath)
+                categories[ext_to_category.get(extension(file), "other")].append(
+                    prefix + file
+                )
 
         return categories
 
@@ -819,11 +1503,11 @@ class DirectoryAnalyzer:
         Returns:
             Suggested language ("python", "javascript", or "generic")
         """
-        categories = self.categorize_files()
+        counts = self.categorize_counts()
 
         # Count files by language
-        python_count = len(categories["python"])
-        javascript_count = len(categories["javascript"])
+        python_count = counts["python"]
+        javascript_count = counts["javascript"]
 
         if python_count > javascript_count:
             return "python"
@@ -839,20 +1523,18 @@ class DirectoryAnalyzer:
         Returns:
             Summary dictionary
         """
-        categories = self.categorize_files()
+        file_counts = self.categorize_counts()
 
         summary = {
             "target_dir": self.target_dir,
-            "existing_dirs": sorted(list(self.existing_dirs)),
-            "missing_dirs": sorted(list(self.missing_dirs)),
+            "existing_dirs": sorted(self.existing_dirs),
+            "missing_dirs": sorted(self.missing_dirs),
             "special_dirs": list(self.special_dirs.keys()),
             "has_git_repository": self.has_git_repository(),
             "has_template_conflicts": self.has_template_conflicts(),
             "suggested_language": self.suggest_language(),
-            "file_counts": {
-                category: len(files) for category, files in categories.items()
-            },
-            "total_files": sum(len(files) for files in categories.values()),
+            "file_counts": file_counts,
+            "total_files": sum(file_counts.values()),
         }
 
         return summary
@@ -929,19 +1611,96 @@ class MigrationManager:
         return self.execute_migration(plan, dry_run)
 
 
+def _tree_signature(
+    dirpaths: Tuple[str, ...], before_ns: int
+) -> Optional[Tuple[int, ...]]:
+    """
+    Collect the mtimes of walked directories for the analyzer cache.
+
+    Args:
+        dirpaths: Directories to stat
+        before_ns: time.time_ns() taken before they were listed; a directory
+            modified after (or within _RACY_LISTING_NS of) that moment may
+            have changed unseen, so it invalidates the signature
+
+    Returns:
+        Tuple of st_mtime_ns per directory, or None if any directory cannot
+        be stat'ed or was modified too recently
+    """
+    mtimes = []
+    for path in dirpaths:
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        if before_ns - mtime_ns <= _RACY_LISTING_NS:
+            return None
+        mtimes.append(mtime_ns)
+    return tuple(mtimes)
+
+
+def _cached_directory_analyzer(
+    directory: str, verbose: int, concurrency_limit: Optional[int] = None
+) -> "DirectoryAnalyzer":
+    """
+    Get a fully walked DirectoryAnalyzer, reusing one for an unchanged tree.
+
+    An analyzer is reused while every directory of its walk still has the
+    mtime recorded when it was stored: adding, removing or renaming an entry
+    anywhere in the tree changes one of them. Results only depend on entry
+    names, so in-place file edits do not matter.
+
+    Args:
+        directory: Absolute directory path
+        verbose: Verbosity level (0=normal, 1=info, 2=debug)
+        concurrency_limit: Maximum number of subtrees walked in parallel
+            (default: os.cpu_count())
+
+    Returns:
+        DirectoryAnalyzer whose scan and walk are complete (shared; do not
+        refresh() or migrate with it)
+    """
+    key = (directory, verbose, concurrency_limit)
+    cached = _ANALYZER_CACHE.get(key)
+    if cached is not None:
+        signature, analyzer = cached
+        dirpaths = tuple(root for root, _ in analyzer._walk_once()["tree"])
+        if _tree_signature(dirpaths, time.time_ns()) == signature:
+            return analyzer
+
+    before_ns = time.time_ns()
+    analyzer = DirectoryAnalyzer(
+        directory, verbose, concurrency_limit=concurrency_limit
+    )
+    analyzer.get_summary()
+    dirpaths = tuple(root for root, _ in analyzer._walk_once()["tree"])
+    # A directory that could not be walked at all has nothing to validate
+    signature = _tree_signature(dirpaths, before_ns) if dirpaths else None
+    if signature is None:
+        _ANALYZER_CACHE.pop(key, None)
+    else:
+        if len(_ANALYZER_CACHE) >= _ANALYZER_CACHE_MAX:
+            _ANALYZER_CACHE.clear()
+        _ANALYZER_CACHE[key] = (signature, analyzer)
+    return analyzer
+
+
 def analyze_directory(directory: str, verbose: int = 0) -> Dict[str, Any]:
     """
     Analyze a directory for RepoKit compatibility.
 
+    Repeated calls for an unchanged directory tree within one process reuse
+    the previous walk instead of walking the tree again.
+
     Args:
         directory: Directory to analyze
         verbose: Verbosity level (0=normal, 1=info, 2=debug)
 
     Returns:
-        Analysis summary
+        Analysis summary (a new dictionary on every call)
     """
-    analyzer = DirectoryAnalyzer(directory, verbose)
-    return analyzer.get_summary()
+    directory = os.path.abspath(directory)
+    return _cached_directory_analyzer(directory, verbose).get_summary()
 
 
 def plan_migration(
@@ -981,18 +1740,32 @@ def migrate_directory(
     return migration.migrate(strategy, dry_run)
 
 
-def analyze_project(directory: str, verbose: int = 0) -> Dict[str, Any]:
+def analyze_project(
+    directory: str, verbose: int = 0, concurrency_limit: Optional[int] = None
+) -> Dict[str, Any]:
     """
     Comprehensive project analysis for universal migration.
 
+    Repeated calls for an unchanged directory tree within one process reuse
+    the previous directory walk; the git state is queried afresh each time.
+
     Args:
         directory: Directory to analyze
         verbose: Verbosity level (0=normal, 1=info, 2=debug)
+        concurrency_limit: Maximum number of subtrees walked in parallel
+            (default: os.cpu_count())
 
     Returns:
-        Comprehensive analysis summary
+        Comprehensive analysis summary (a new dictionary on every call)
     """
-    analyzer = ProjectAnalyzer(directory, verbose)
+    directory = os.path.abspath(directory)
+    analyzer = ProjectAnalyzer(
+        directory,
+        verbose,
+        directory_analyzer=_cached_directory_analyzer(
+            directory, verbose, concurrency_limit
+        ),
+    )
     return analyzer.get_comprehensive_summary()
 
 
@@ -1023,23 +1796,26 @@ def universal_migrate_project(
     Returns:
         True if successful, False otherwise
     """
-    # Use ProjectAnalyzer for comprehensive analysis
-    analyzer = ProjectAnalyzer(directory, verbose)
-    summary = analyzer.get_comprehensive_summary()
+    # Resolve against the working directory once; everything below gets an
+    # absolute path, which abspath() only normalizes
+    directory = os.path.abspath(directory)
 
     # Determine target name
     if not target_name:
-        target_name = os.path.basename(os.path.abspath(directory))
+        target_name = os.path.basename(directory)
+
+    # Use UniversalMigrationExecutor for the actual migration; its
+    # comprehensive analysis is only computed up front to auto-select
+    # strategies, otherwise if and when a step needs it
+    executor = UniversalMigrationExecutor(directory, target_name, verbose)
 
     # Auto-select strategies if requested
     if strategy == "auto":
-        strategy = summary["recommended_strategy"]
+        strategy = executor.summary["recommended_strategy"]
 
     if branch_strategy == "auto":
-        branch_strategy = summary["recommended_branch_strategy"]
+        branch_strategy = executor.summary["recommended_branch_strategy"]
 
-    # Use UniversalMigrationExecutor for the actual migration
-    executor = UniversalMigrationExecutor(directory, target_name, verbose)
     return executor.execute_migration(strategy, branch_strategy, publish_to, dry_run)
 
 
@@ -1069,7 +1845,8 @@ def adopt_project(
         True if successful, False otherwise
     """
     # Use the directory name as the project name
-    target_name = os.path.basename(os.path.abspath(directory))
+    directory = os.path.abspath(directory)
+    target_name = os.path.basename(directory)
 
     # For adoption, we modify in-place rather than creating a new structure
     return universal_migrate_project(
@@ -1091,15 +1868,63 @@ class UniversalMigrationExecutor:
     including Git repository setup, file migration, and remote publishing.
     """
 
-    def __init__(self, source_dir: str, target_name: str, verbose: int = 0):
-        """Initialize UniversalMigrationExecutor."""
+    def __init__(
+        self,
+        source_dir: str,
+        target_name: str,
+        verbose: int = 0,
+        max_concurrency: int = 8,
+        analyzer: Optional[ProjectAnalyzer] = None,
+        summary: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize UniversalMigrationExecutor.
+
+        Args:
+            source_dir: Source directory to migrate
+            target_name: Target repository name
+            verbose: Verbosity level (0=normal, 1=info, 2=debug)
+            max_concurrency: Maximum parallel directory walks and file copies
+            analyzer: Existing ProjectAnalyzer for source_dir to reuse
+                (default: built on first use)
+            summary: Comprehensive summary already computed for source_dir
+                (default: taken from the analyzer when needed)
+        """
         self.source_dir = os.path.abspath(source_dir)
         self.target_name = target_name
         self.verbose = verbose
+        self.max_concurrency = max_concurrency
         self.logger = logging.getLogger("repokit.universal_executor")
 
-        # Initialize project analyzer
-        self.analyzer = ProjectAnalyzer(source_dir, verbose)
+        self._analyzer = analyzer
+        self._summary = summary
+
+    @property
+    def analyzer(self) -> ProjectAnalyzer:
+        """
+        Project analyzer for the source directory (built on first use).
+
+        Its directory walk is bounded by max_concurrency and shared with
+        analyze_project() calls using the same settings while the tree is
+        unchanged.
+        """
+        if self._analyzer is None:
+            self._analyzer = ProjectAnalyzer(
+                self.source_dir,
+                self.verbose,
+                concurrency_limit=self.max_concurrency,
+                directory_analyzer=_cached_directory_analyzer(
+                    self.source_dir, self.verbose, self.max_concurrency
+                ),
+            )
+        return self._analyzer
+
+    @property
+    def summary(self) -> Dict[str, Any]:
+        """Comprehensive analysis of the source directory (computed once)."""
+        if self._summary is None:
+            self._summary = self.analyzer.get_comprehensive_summary()
+        return self._summary
 
     def execute_migration(
         self,
@@ -1123,6 +1948,9 @@ class UniversalMigrationExecutor:
         if dry_run:
             return self._simulate_migration(strategy, branch_strategy, publish_to)
 
+        # The steps run strictly in order: the checkouts in step 3 rewrite the
+        # working tree that steps 2 and 4 write into, so overlapping them
+        # would race. Parallelism lives inside the steps (walks and copies).
         try:
             # Step 1: Prepare target structure
             if not self._prepare_target_structure():
@@ -1148,29 +1976,34 @@ class UniversalMigrationExecutor:
             return True
 
         except Exception as e:
-            self.logger.error(f"Migration failed: {str(e)}")
+            self.logger.error("Migration failed: %s", e)
             return False
 
     def _simulate_migration(
         self, strategy: str, branch_strategy: str, publish_to: Optional[str]
     ) -> bool:
         """Simulate migration for dry run."""
-        summary = self.analyzer.get_comprehensive_summary()
+        # The simulation only reports; skip the analysis and formatting
+        # entirely when nothing would be shown
+        if not self.logger.isEnabledFor(logging.INFO):
+            return True
+
+        summary = self.summary
 
         self.logger.info("=== MIGRATION SIMULATION ===")
-        self.logger.info(f"Source: {self.source_dir}")
-        self.logger.info(f"Target: {self.target_name}")
-        self.logger.info(f"Project type: {summary['project_type']}")
-        self.logger.info(f"Language: {summary['detected_language']}")
-        self.logger.info(f"Migration strategy: {strategy}")
-        self.logger.info(f"Branch strategy: {branch_strategy}")
+        self.logger.info("Source: %s", self.source_dir)
+        self.logger.info("Target: %s", self.target_name)
+        self.logger.info("Project type: %s", summary["project_type"])
+        self.logger.info("Language: %s", summary["detected_language"])
+        self.logger.info("Migration strategy: %s", strategy)
+        self.logger.info("Branch strategy: %s", branch_strategy)
 
         if publish_to:
-            self.logger.info(f"Would publish to: {publish_to}")
+            self.logger.info("Would publish to: %s", publish_to)
 
         self.logger.info("Migration steps:")
         for i, step in enumerate(summary["migration_steps"], 1):
-            self.logger.info(f"  {i}. {step}")
+            self.logger.info("  %d. %s", i, step)
 
         return True
 
@@ -1182,13 +2015,13 @@ class UniversalMigrationExecutor:
 
     def _migrate_files(self, strategy: str) -> bool:
         """Migrate files based on strategy."""
-        self.logger.info(f"Migrating files using strategy: {strategy}")
+        self.logger.info("Migrating files using strategy: %s", strategy)
         # Implementation would go here
         return True
 
     def _setup_git_repository(self, branch_strategy: str) -> bool:
         """Set up Git repository with chosen branch strategy."""
-        self.logger.info(f"Setting up Git repository with strategy: {branch_strategy}")
+        self.logger.info("Setting up Git repository with strategy: %s", branch_strategy)
         
         try:
             git_manager = GitManager(self.source_dir, self.verbose)
@@ -1202,33 +2035,52 @@ class UniversalMigrationExecutor:
             current_branch = repo_state.get("current_branch")
             existing_branches = set(repo_state.get("branches", []))
             
-            self.logger.info(f"Current branch: {current_branch}")
-            self.logger.info(f"Existing branches: {existing_branches}")
-            self.logger.info(f"Target branches for {branch_strategy}: {branches}")
+            self.logger.info("Current branch: %s", current_branch)
+            self.logger.info("Existing branches: %s", existing_branches)
+            self.logger.info("Target branches for %s: %s", branch_strategy, branches)
             
-            # Create missing branches
-            for branch in branches:
-                if branch not in existing_branches:
-                    try:
-                        git_manager.run_git(["checkout", "-b", branch])
-                        self.logger.info(f"Created branch: {branch}")
-                        existing_branches.add(branch)
-                    except Exception as e:
-                        self.logger.warning(f"Failed to create branch {branch}: {e}")
+            # Create missing branches at HEAD in one ref transaction; an
+            # unborn HEAD has nothing to point them at, so fall back to
+            # checkout -b there (or if the transaction is rejected)
+            missing = [b for b in branches if b not in existing_branches]
+            if missing and repo_state.get("has_commits"):
+                try:
+                    git_manager.run_git(
+                        ["update-ref", "--stdin"],
+                        capture=False,
+                        input="".join(f"create refs/heads/{b} HEAD\n" for b in missing),
+                    )
+                    for branch in missing:
+                        self.logger.info("Created branch: %s", branch)
+                    existing_branches.update(missing)
+                    missing = []
+                except Exception as e:
+                    self.logger.debug("Batched branch creation failed: %s", e)
+
+            for branch in missing:
+                try:
+                    git_manager.run_git(["checkout", "-b", branch], capture=False)
+                    self.logger.info("Created branch: %s", branch)
+                    existing_branches.add(branch)
+                    current_branch = branch
+                except Exception as e:
+                    self.logger.warning("Failed to create branch %s: %s", branch, e)
             
             # Switch to main/default branch
             default_branch = "main" if "main" in branches else branches[-1]
-            if default_branch in existing_branches:
+            if default_branch == current_branch:
+                self.logger.info("Already on default branch: %s", default_branch)
+            elif default_branch in existing_branches:
                 try:
-                    git_manager.run_git(["checkout", default_branch])
-                    self.logger.info(f"Switched to default branch: {default_branch}")
+                    git_manager.run_git(["checkout", default_branch], capture=False)
+                    self.logger.info("Switched to default branch: %s", default_branch)
                 except Exception as e:
-                    self.logger.warning(f"Failed to switch to {default_branch}: {e}")
+                    self.logger.warning("Failed to switch to %s: %s", default_branch, e)
             
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to setup Git repository: {e}")
+            self.logger.error("Failed to setup Git repository: %s", e)
             return False
 
     def _generate_templates(self) -> bool:
@@ -1239,6 +2091,6 @@ class UniversalMigrationExecutor:
 
     def _publish_to_remote(self, service: str) -> bool:
         """Publish to remote service."""
-        self.logger.info(f"Publishing to {service}...")
+        self.logger.info("Publishing to %s...", service)
         # Implementation would go here
         return True
@@ -9,8 +9,10 @@ This allows for customized directory setups based on project needs.
 import os
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Any, Optional
+from typing import Dict, FrozenSet, List, Set, Any, Optional, Tuple
 
 from .defaults import (
     DEFAULT_PRIVATE_DIRS as CENTRALIZED_PRIVATE_DIRS,
@@ -20,12 +22,63 @@ from .defaults import (
     DEFAULT_PRIVATE_DIR_SETS
 )
 
+try:
+    import orjson
+except ImportError:  # optional; the stdlib parser is the fallback
+    orjson = None
+
+# Both accept the raw bytes of a config file
+_loads = orjson.loads if orjson is not None else json.loads
+
 # Set up logging
 logger = logging.getLogger("repokit.directories")
 
 # Use centralized configurations from defaults.py
 # These are now imported directly, eliminating duplication
 
+# Directories modified this recently may change again within the same mtime
+# tick, so their state is not cached by manage_gitkeep_files()
+_RACY_STATE_NS = 2 * 10**9
+
+# .gitkeep contents for standard and private directories
+_STD_MARK = b"# This file ensures the directory is tracked by Git\n"
+_PRIVATE_MARK = b"# This file ensures the directory exists\n"
+
+
+def _create_gitkeep(gitkeep_path: str, content: bytes) -> bool:
+    """
+    Create a .gitkeep marker unless one already exists.
+
+    Args:
+        gitkeep_path: Path of the .gitkeep file
+        content: Marker contents
+
+    Returns:
+        True if the marker was created, False if it already existed
+    """
+    try:
+        # O_EXCL answers "does it exist?" as part of the create itself
+        fd = os.open(gitkeep_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return False
+    try:
+        os.write(fd, content)
+    finally:
+        os.close(fd)
+    return True
+
+
+def _ensure_dir_with_gitkeep(path: str, content: bytes) -> None:
+    """
+    Create a directory and its .gitkeep marker unless they already exist.
+
+    Args:
+        path: Directory to create
+        content: Marker contents, written only when no .gitkeep exists yet
+    """
+    os.makedirs(path, exist_ok=True)
+    _create_gitkeep(path + os.sep + ".gitkeep", content)
+
 
 class DirectoryProfileManager:
     """Manages directory profiles, groups, and types for project setup."""
@@ -46,6 +99,13 @@ class DirectoryProfileManager:
         self.private_dirs = DEFAULT_PRIVATE_DIR_SETS.copy()
         self.type_mapping = DEFAULT_DIRECTORY_TYPE_MAPPING.copy()
 
+        # Derived lookups memoized per call signature; see invalidate_caches()
+        self._expansions: Dict[Any, Any] = {}
+
+        # Directory path -> (mtime_ns, subdirectory names) for directories that
+        # manage_gitkeep_files() found already settled
+        self._gitkeep_state: Dict[str, Tuple[int, Tuple[str, ...]]] = {}
+
         # Load custom configuration if provided
         if config_file:
             self.load_config(config_file)
@@ -61,8 +121,8 @@ class DirectoryProfileManager:
             True if loaded successfully, False otherwise
         """
         try:
-            with open(config_file, "r") as f:
-                config = json.load(f)
+            with open(config_file, "rb") as f:
+                config = _loads(f.read())
 
             # Update with custom configuration
             if "directory_profiles" in config:
@@ -77,6 +137,7 @@ class DirectoryProfileManager:
             if "directory_types" in config:
                 self.type_mapping.update(config["directory_types"])
 
+            self.invalidate_caches()
             logger.info(f"Loaded directory configuration from {config_file}")
             return True
         except Exception as e:
@@ -105,7 +166,8 @@ class DirectoryProfileManager:
             os.makedirs(os.path.dirname(os.path.abspath(config_file)), exist_ok=True)
 
             with open(config_file, "w") as f:
-                json.dump(config, f, indent=4)
+                # One write of the whole document instead of dump()'s many chunks
+                f.write(json.dumps(config, indent=4))
 
             logger.info(f"Saved directory configuration to {config_file}")
             return True
@@ -113,6 +175,15 @@ class DirectoryProfileManager:
             logger.error(f"Failed to save directory configuration: {str(e)}")
             return False
 
+    def invalidate_caches(self) -> None:
+        """
+        Drop memoized lookups derived from the profile tables.
+
+        Call this after changing profiles, groups, private_dirs or type_mapping
+        in place; load_config() does so itself.
+        """
+        self._expansions.clear()
+
     def get_directories_for_profile(self, profile: str) -> List[str]:
         """
         Get directory types for a specific profile.
@@ -135,11 +206,27 @@ class DirectoryProfileManager:
         Returns:
             List of directory types in the groups
         """
-        result = set()
-        for group in groups:
-            if group in self.groups:
-                result.update(self.groups[group])
-        return sorted(list(result))
+        return list(self._group_types(groups))
+
+    def _group_types(self, groups: List[str]) -> Tuple[str, ...]:
+        """
+        Get the memoized, sorted directory types of specific groups.
+
+        Args:
+            groups: List of group names
+
+        Returns:
+            Tuple of directory types in the groups; shared, so not for mutation
+        """
+        key = ("groups", tuple(groups))
+        expansion = self._expansions.get(key)
+        if expansion is None:
+            result = set()
+            for group in groups:
+                if group in self.groups:
+                    result.update(self.groups[group])
+            expansion = self._expansions[key] = tuple(sorted(result))
+        return expansion
 
     def get_private_directories(self, private_set: str = "standard") -> List[str]:
         """
@@ -153,6 +240,24 @@ class DirectoryProfileManager:
         """
         return self.private_dirs.get(private_set, self.private_dirs["standard"]).copy()
 
+    def _private_types(self, private_set: str) -> FrozenSet[str]:
+        """
+        Get the memoized directory types of a private set.
+
+        Args:
+            private_set: Private directory set name
+
+        Returns:
+            Frozenset of private directory types
+        """
+        key = ("private", private_set)
+        types = self._expansions.get(key)
+        if types is None:
+            types = self._expansions[key] = frozenset(
+                self.private_dirs.get(private_set, self.private_dirs["standard"])
+            )
+        return types
+
     def get_actual_directory_name(
         self, dir_type: str, package_name: Optional[str] = None
     ) -> str:
@@ -191,32 +296,56 @@ class DirectoryProfileManager:
         Returns:
             Dictionary with categories and actual directory names
         """
-        # Start with profile directories
-        dir_types = set(self.get_directories_for_profile(profile))
+        key = ("all", profile, tuple(groups or ()), private_set, package_name)
+        expansion = self._expansions.get(key)
+        if expansion is None:
+            resolved = self._resolve_all_directories(
+                profile, groups, private_set, package_name
+            )
+            expansion = self._expansions[key] = (
+                tuple(resolved["standard"]), tuple(resolved["private"])
+            )
+        return {"standard": list(expansion[0]), "private": list(expansion[1])}
+
+    def _resolve_all_directories(
+        self,
+        profile: str,
+        groups: Optional[List[str]],
+        private_set: str,
+        package_name: Optional[str],
+    ) -> Dict[str, List[str]]:
+        """
+        Resolve profile, groups and private set to actual directory names.
+
+        Args:
+            profile: Profile name
+            groups: Optional additional groups
+            private_set: Private directory set name
+            package_name: Optional package name for src directory
+
+        Returns:
+            Dictionary with categories and actual directory names
+        """
+        # Start with profile directories (read in place; the public getters copy)
+        dir_types = set(self.profiles.get(profile, self.profiles["standard"]))
 
         # Add group directories if specified
         if groups:
-            dir_types.update(self.get_directories_for_groups(groups))
+            dir_types.update(self._group_types(groups))
 
         # Get private directories
-        private_types = set(self.get_private_directories(private_set))
+        private_types = self._private_types(private_set)
 
-        # Convert types to actual directory names
-        standard_dirs = []
-        private_dirs = []
-
-        for dir_type in dir_types:
-            actual_name = self.get_actual_directory_name(dir_type, package_name)
-            if dir_type in private_types:
-                private_dirs.append(actual_name)
-            else:
-                standard_dirs.append(actual_name)
-        
-        # Add all private directories from the private set (even if not in profile)
-        for private_type in private_types:
-            actual_name = self.get_actual_directory_name(private_type, package_name)
-            if actual_name not in private_dirs:
-                private_dirs.append(actual_name)
+        # Convert types to actual directory names. Every private type is created,
+        # even if not in the profile, so profile types only decide the standard set.
+        standard_dirs = {
+            self.get_actual_directory_name(dir_type, package_name)
+            for dir_type in dir_types - private_types
+        }
+        private_dirs = {
+            self.get_actual_directory_name(private_type, package_name)
+            for private_type in private_types
+        }
 
         return {"standard": sorted(standard_dirs), "private": sorted(private_dirs)}
 
@@ -245,37 +374,75 @@ class DirectoryProfileManager:
             profile, groups, private_set, package_name
         )
 
-        created_dirs = {"standard": [], "private": []}
+        # Private .gitkeep files get a different marker (they are ignored in .gitignore)
+        tasks = [
+            (category, dirname, content)
+            for category, content in (("standard", _STD_MARK), ("private", _PRIVATE_MARK))
+            for dirname in directories[category]
+        ]
 
-        # Create standard directories
-        for dirname in directories["standard"]:
-            dir_path = os.path.join(base_path, dirname)
-            os.makedirs(dir_path, exist_ok=True)
-            created_dirs["standard"].append(dirname)
-
-            # Create .gitkeep file
-            gitkeep_path = os.path.join(dir_path, ".gitkeep")
-            if not os.path.exists(gitkeep_path):
-                with open(gitkeep_path, "w") as f:
-                    f.write("# This file ensures the directory is tracked by Git\n")
-
-        # Create private directories
-        for dirname in directories["private"]:
-            dir_path = os.path.join(base_path, dirname)
-            os.makedirs(dir_path, exist_ok=True)
-            created_dirs["private"].append(dirname)
-
-            # Create .gitkeep file (will be ignored in .gitignore)
-            gitkeep_path = os.path.join(dir_path, ".gitkeep")
-            if not os.path.exists(gitkeep_path):
-                with open(gitkeep_path, "w") as f:
-                    f.write("# This file ensures the directory exists\n")
+        # Join once; each directory path is then a plain concatenation
+        prefix = os.path.join(base_path, "")
+
+        def create(task: Tuple[str, str, bytes]) -> None:
+            _ensure_dir_with_gitkeep(prefix + task[1], task[2])
+
+        # Directories are independent, so mkdir/open latency can overlap; for a
+        # handful of them, starting threads costs more than it saves
+        if len(tasks) < 4:
+            for task in tasks:
+                create(task)
+        else:
+            with ThreadPoolExecutor(max_workers=min(16, len(tasks))) as executor:
+                # list() surfaces any creation error
+                list(executor.map(create, tasks))
+
+        created_dirs = {"standard": [], "private": []}
+        for category, dirname, _ in tasks:
+            created_dirs[category].append(dirname)
 
         logger.info(f"Created {len(created_dirs['standard'])} standard directories")
         logger.info(f"Created {len(created_dirs['private'])} private directories")
 
         return created_dirs
 
+    def _profile_name_sets(self) -> Dict[str, FrozenSet[str]]:
+        """
+        Get the actual directory names of every profile.
+
+        Returns:
+            Mapping of profile name to the directory names it creates
+        """
+        name_sets = self._expansions.get("profile_names")
+        if name_sets is None:
+            name_sets = self._expansions["profile_names"] = {
+                profile_name: frozenset(
+                    self.get_actual_directory_name(d) for d in profile_dirs
+                )
+                for profile_name, profile_dirs in self.profiles.items()
+            }
+        return name_sets
+
+    def _all_possible_names(self) -> FrozenSet[str]:
+        """
+        Get every directory name a known directory type could map to.
+
+        Returns:
+            Directory names from all profiles, plus common src package names
+        """
+        names = self._expansions.get("possible_names")
+        if names is None:
+            all_known_types = set()
+            for profile in self.profiles.values():
+                all_known_types.update(profile)
+
+            possible = {self.get_actual_directory_name(t) for t in all_known_types}
+            # Also add common package names for src
+            if "src" in all_known_types:
+                possible.update(["src", "app", "lib", "pkg"])
+            names = self._expansions["possible_names"] = frozenset(possible)
+        return names
+
     def validate_directories(self, base_path: str) -> Dict[str, List[str]]:
         """
         Validate existing directories against all known directory types.
@@ -286,36 +453,23 @@ class DirectoryProfileManager:
         Returns:
             Dictionary with existing, missing, and unknown directories
         """
-        # Get all known directory types
-        all_known_types = set()
-        for profile in self.profiles.values():
-            all_known_types.update(profile)
-
-        # Get all directory names that could exist
-        all_possible_names = set()
-        for dir_type in all_known_types:
-            # Add with default name
-            all_possible_names.add(self.get_actual_directory_name(dir_type))
-            # Also add common package names for src
-            if dir_type == "src":
-                all_possible_names.update(["src", "app", "lib", "pkg"])
-
-        # Check existing directories
-        existing_dirs = []
-        for item in os.listdir(base_path):
-            item_path = os.path.join(base_path, item)
-            if os.path.isdir(item_path) and not item.startswith("."):
-                existing_dirs.append(item)
-
-        # Categorize directories
-        known_dirs = [d for d in existing_dirs if d in all_possible_names]
-        unknown_dirs = [d for d in existing_dirs if d not in all_possible_names]
-        missing_dirs = [d for d in all_possible_names if d not in existing_dirs]
+        all_possible_names = self._all_possible_names()
+
+        # One pass over the listing; DirEntry.is_dir() reuses the d_type it read
+        known_dirs = []
+        unknown_dirs = []
+        with os.scandir(base_path) as entries:
+            for entry in entries:
+                if not entry.name.startswith(".") and entry.is_dir():
+                    if entry.name in all_possible_names:
+                        known_dirs.append(entry.name)
+                    else:
+                        unknown_dirs.append(entry.name)
 
         return {
             "existing": sorted(known_dirs),
             "unknown": sorted(unknown_dirs),
-            "missing": sorted(missing_dirs),
+            "missing": sorted(all_possible_names.difference(known_dirs)),
         }
 
     def suggest_profile(self, base_path: str) -> str:
@@ -332,13 +486,10 @@ class DirectoryProfileManager:
         existing_dirs = set(validation["existing"])
 
         # Check each profile to see how many directories match
-        profile_matches = {}
-        for profile_name, profile_dirs in self.profiles.items():
-            # Convert profile types to actual directory names
-            profile_names = set(self.get_actual_directory_name(d) for d in profile_dirs)
-            # Count matches
-            matches = len(existing_dirs.intersection(profile_names))
-            profile_matches[profile_name] = matches
+        profile_matches = {
+            profile_name: len(existing_dirs & profile_names)
+            for profile_name, profile_names in self._profile_name_sets().items()
+        }
 
         # Find the profile with the most matches
         best_profile = max(profile_matches.items(), key=lambda x: x[1])
@@ -363,58 +514,101 @@ class DirectoryProfileManager:
             Dictionary with added and removed .gitkeep files
         """
         result = {"added": [], "removed": []}
-        
-        def process_directory(dir_path: str, relative_path: str = ""):
-            """Process a single directory for .gitkeep management."""
-            if not os.path.isdir(dir_path):
-                return
-                
-            gitkeep_path = os.path.join(dir_path, ".gitkeep")
-            gitkeep_exists = os.path.exists(gitkeep_path)
-            
-            # Get all items in directory (excluding .gitkeep itself)
+
+        # Explicit stack in place of recursion; children are pushed in reverse so
+        # directories are still visited parent-first in listing order. A parent's
+        # decision only depends on its own entries, so no bottom-up pass is needed.
+        # Paths are built by concatenation: each child's path is its parent's
+        # path + os.sep + its name (the base path is stripped of any trailing
+        # separator), and relative ones are carried as prefixes ("" or "a/b/").
+        sep = os.sep
+        stack = [(base_path.rstrip(sep) or base_path, "")]
+        while stack:
+            dir_path, relative_prefix = stack.pop()
+            gitkeep_path = dir_path + sep + ".gitkeep"
+            gitkeep_rel = relative_prefix + ".gitkeep"
+
+            # A directory whose mtime matches a settled earlier pass still has the
+            # same entries, so neither its listing nor its decision can differ
+            try:
+                mtime_ns = os.stat(dir_path).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            cached = self._gitkeep_state.get(dir_path)
+            if cached is not None and cached[0] == mtime_ns:
+                if recursive:
+                    for name in reversed(cached[1]):
+                        stack.append(
+                            (dir_path + sep + name, relative_prefix + name + sep)
+                        )
+                continue
+
+            # One directory read supplies names and cached d_type for every entry
             try:
-                items = [item for item in os.listdir(dir_path) if item != ".gitkeep"]
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
             except PermissionError:
                 logger.warning(f"Permission denied accessing directory: {dir_path}")
-                return
-            
+                continue
+            except OSError:
+                # Missing or not a directory
+                continue
+
+            gitkeep_exists = any(entry.name == ".gitkeep" for entry in entries)
+
             # Filter out hidden files and directories that should be ignored
-            non_hidden_items = [item for item in items if not item.startswith(".")]
-            
-            # Check if directory is effectively empty (only has hidden files or .gitkeep)
-            is_empty = len(non_hidden_items) == 0
-            
+            non_hidden = [entry for entry in entries if not entry.name.startswith(".")]
+
+            # Directory is effectively empty if it only has hidden files or .gitkeep
+            is_empty = not non_hidden
+
+            # Subdirectories to descend into (symlinks are left alone, as Git does)
+            subdirs = tuple(
+                entry.name
+                for entry in non_hidden
+                if entry.is_dir(follow_symlinks=False)
+            )
+
             # Manage .gitkeep based on directory state
             if is_empty and not gitkeep_exists:
                 # Add .gitkeep to empty directory
                 try:
-                    with open(gitkeep_path, "w") as f:
-                        f.write("# This file ensures the directory is tracked by Git\n")
-                    result["added"].append(os.path.join(relative_path, ".gitkeep") if relative_path else ".gitkeep")
-                    logger.debug(f"Added .gitkeep to empty directory: {dir_path}")
+                    if _create_gitkeep(gitkeep_path, _STD_MARK):
+                        result["added"].append(gitkeep_rel)
+                        logger.debug(f"Added .gitkeep to empty directory: {dir_path}")
                 except PermissionError:
                     logger.warning(f"Permission denied creating .gitkeep in: {dir_path}")
+                settled = False
             elif not is_empty and gitkeep_exists:
                 # Remove .gitkeep from non-empty directory
                 try:
                     os.remove(gitkeep_path)
-                    result["removed"].append(os.path.join(relative_path, ".gitkeep") if relative_path else ".gitkeep")
+                    result["removed"].append(gitkeep_rel)
                     logger.debug(f"Removed .gitkeep from non-empty directory: {dir_path}")
+                except FileNotFoundError:
+                    pass
                 except PermissionError:
                     logger.warning(f"Permission denied removing .gitkeep from: {dir_path}")
-                    
-            # Process subdirectories recursively if requested
+                settled = False
+            else:
+                settled = True
+
+            # Only remember directories that needed nothing and whose mtime is
+            # outside the timestamp-granularity window (see directory_analyzer)
+            if (
+                settled
+                and mtime_ns is not None
+                and time.time_ns() - mtime_ns > _RACY_STATE_NS
+            ):
+                self._gitkeep_state[dir_path] = (mtime_ns, subdirs)
+            else:
+                self._gitkeep_state.pop(dir_path, None)
+
+            # Queue subdirectories if requested
             if recursive:
-                for item in items:
-                    item_path = os.path.join(dir_path, item)
-                    if os.path.isdir(item_path) and not item.startswith("."):
-                        item_relative = os.path.join(relative_path, item) if relative_path else item
-                        process_directory(item_path, item_relative)
-        
-        # Start processing from base path
-        process_directory(base_path)
-        
+                for name in reversed(subdirs):
+                    stack.append((dir_path + sep + name, relative_prefix + name + sep))
+
         if result["added"] or result["removed"]:
             logger.info(f"Managed .gitkeep files: {len(result['added'])} added, {len(result['removed'])} removed")
         else:
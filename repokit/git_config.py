@@ -10,7 +10,48 @@ git config levels.
 import os
 import subprocess
 import logging
-from typing import Dict, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+# git config keys (as listed by git config --list) -> user info fields
+_USER_KEYS = {"user.name": "name", "user.email": "email"}
+
+# Environment that changes which files git config reads
+_CONFIG_ENV = (
+    "HOME", "XDG_CONFIG_HOME", "GIT_CONFIG_GLOBAL", "GIT_CONFIG_SYSTEM",
+    "GIT_CONFIG_NOSYSTEM",
+)
+
+# Merged listings shared by every GitConfigManager in the process, so the
+# several managers one RepoKit run creates need a single git call:
+# (repo path, config environment) -> (files, their stat signature, levels).
+# A listing is reused while every file it came from, and every default config
+# location, still stats the same; git rewrites config files through a lock
+# file and rename, so any edit made with git config changes the inode.
+_MergedEntry = Tuple[Tuple[str, ...], tuple, Dict[str, Dict[str, str]]]
+_MERGED_CACHE: Dict[tuple, _MergedEntry] = {}
+_MERGED_CACHE_MAX = 64
+
+
+def _file_signature(paths: Iterable[str]) -> tuple:
+    """
+    Build a cheap change signature for a set of files.
+
+    Args:
+        paths: Files to stat; missing ones are recorded as absent
+
+    Returns:
+        Tuple of (path, inode, mtime_ns, size) entries in path order
+    """
+    signature = []
+    for path in sorted(paths):
+        try:
+            st = os.stat(path)
+        except OSError:
+            signature.append((path, None, None, None))
+        else:
+            signature.append((path, st.st_ino, st.st_mtime_ns, st.st_size))
+    return tuple(signature)
 
 
 class GitConfigManager:
@@ -18,10 +59,11 @@ class GitConfigManager:
     Manages git configuration detection with multi-level cascade support.
 
     Detection levels (in order of precedence):
+    0. RepoKit overrides (REPOKIT_USER_NAME / REPOKIT_USER_EMAIL)
     1. Repository-specific config (.git/config)
     2. Global user config (~/.gitconfig)
     3. System config (/etc/gitconfig)
-    4. Environment variables
+    4. Git environment variables (GIT_AUTHOR_* / GIT_COMMITTER_*)
     5. Interactive prompts (if enabled)
     """
 
@@ -37,6 +79,10 @@ class GitConfigManager:
         self.verbose = verbose
         self.logger = logging.getLogger("repokit.git_config")
 
+        # Resolved user info by (repo_path, interactive); reset when
+        # configure_repo_git_user() writes new values
+        self._user_info_cache: Dict[tuple, Dict[str, str]] = {}
+
     def get_comprehensive_user_info(self, interactive: bool = True) -> Dict[str, str]:
         """
         Get git user information using comprehensive detection cascade.
@@ -47,32 +93,35 @@ class GitConfigManager:
         Returns:
             Dictionary with 'name' and 'email' keys
         """
-        user_info = {}
-
-        # Level 1: Repository-specific config
-        if self.repo_path:
-            repo_config = self._get_repo_git_config()
-            user_info.update(repo_config)
-            if self.verbose >= 2:
-                self.logger.debug(f"Repository config: {repo_config}")
-
-        # Level 2: Global git config (if missing data)
-        if not user_info.get('name') or not user_info.get('email'):
-            global_config = self._get_global_git_config()
-            for key, value in global_config.items():
+        # user.name/user.email do not change under us within one run; callers
+        # get a copy since some adjust the result before writing it back
+        cache_key = (self.repo_path, interactive)
+        cached = self._user_info_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+        # Level 0: RepoKit's own variables are explicit overrides, read before
+        # any git call; with both set, git is not consulted at all
+        user_info = self._get_repokit_env_config()
+        if user_info and self.verbose >= 2:
+            self.logger.debug(f"RepoKit environment overrides: {user_info}")
+
+        # Levels 1-3: Repository, global and system git config. One git call
+        # lists all three; per-level reads are the fallback for git < 2.26.
+        merged = None
+        for label, scope in (
+            ("Repository", "local"), ("Global", "global"), ("System", "system")
+        ):
+            if user_info.get('name') and user_info.get('email'):
+                break
+            if merged is None:
+                merged = self._read_merged_levels() or self._read_levels_concurrently()
+            level_config = merged[scope]
+            for key, value in level_config.items():
                 if not user_info.get(key):
                     user_info[key] = value
             if self.verbose >= 2:
-                self.logger.debug(f"Global config: {global_config}")
-
-        # Level 3: System git config (if still missing data)
-        if not user_info.get('name') or not user_info.get('email'):
-            system_config = self._get_system_git_config()
-            for key, value in system_config.items():
-                if not user_info.get(key):
-                    user_info[key] = value
-            if self.verbose >= 2:
-                self.logger.debug(f"System config: {system_config}")
+                self.logger.debug(f"{label} config: {level_config}")
 
         # Level 4: Environment variables
         if not user_info.get('name') or not user_info.get('email'):
@@ -99,119 +148,187 @@ class GitConfigManager:
             self.logger.info(f"Final git user config: name='{name}', "
                             f"email='{email}'")
 
+        self._user_info_cache[cache_key] = dict(user_info)
         return user_info
 
-    def _get_repo_git_config(self) -> Dict[str, str]:
-        """Get user config from repository-specific .git/config."""
-        if not self.repo_path:
-            return {}
-        
-        git_path = os.path.join(self.repo_path, ".git")
-        if not os.path.exists(git_path):
-            return {}
+    def _has_repo_level(self) -> bool:
+        """Check whether the repository config level applies to repo_path."""
+        return bool(self.repo_path) and os.path.exists(
+            os.path.join(self.repo_path, ".git")
+        )
 
-        config = {}
+    def _default_config_files(self, has_repo: bool) -> Set[str]:
+        """
+        Get the config files git reads by default for this manager.
 
-        # Get user.name from repo config
-        try:
-            result = subprocess.run(
-                ["git", "config", "--local", "user.name"],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                config["name"] = result.stdout.strip()
-        except Exception as e:
-            if self.verbose >= 3:
-                self.logger.debug(f"Failed to get repo user.name: {e}")
+        Args:
+            has_repo: Whether the repository level applies
 
-        # Get user.email from repo config
-        try:
-            result = subprocess.run(
-                ["git", "config", "--local", "user.email"],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                config["email"] = result.stdout.strip()
-        except Exception as e:
-            if self.verbose >= 3:
-                self.logger.debug(f"Failed to get repo user.email: {e}")
+        Returns:
+            Paths of the repository, global, XDG and system config files
+        """
+        home = os.path.expanduser("~")
+        xdg_home = os.environ.get("XDG_CONFIG_HOME") or os.path.join(home, ".config")
+        files = {
+            os.environ.get("GIT_CONFIG_GLOBAL") or os.path.join(home, ".gitconfig"),
+            os.path.join(xdg_home, "git", "config"),
+            os.environ.get("GIT_CONFIG_SYSTEM") or "/etc/gitconfig",
+        }
+        if has_repo:
+            files.add(os.path.join(os.path.abspath(self.repo_path), ".git", "config"))
+        return files
+
+    def _read_merged_levels(self) -> Optional[Dict[str, Dict[str, str]]]:
+        """
+        Read user.name and user.email from every config level in one git call.
 
-        return config
+        ``--show-scope`` tags each entry with the level it came from, so the
+        cascade can still apply its own precedence. Command-line and worktree
+        scopes are skipped, as the per-level reads never saw them. The listing
+        is shared process-wide until one of its files changes.
 
-    def _get_global_git_config(self) -> Dict[str, str]:
-        """Get user config from global ~/.gitconfig."""
-        config = {}
+        Returns:
+            Mapping of level (local, global, system) to its user info, or None
+            if git could not list scopes (older than 2.26) and each level must
+            be read on its own
+        """
+        has_repo = self._has_repo_level()
+        repo_root = os.path.abspath(self.repo_path) if has_repo else None
+        cache_key = (repo_root, tuple(os.environ.get(k) for k in _CONFIG_ENV))
 
-        # Get user.name from global config
-        try:
-            result = subprocess.run(
-                ["git", "config", "--global", "user.name"],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                config["name"] = result.stdout.strip()
-        except Exception as e:
-            if self.verbose >= 3:
-                self.logger.debug(f"Failed to get global user.name: {e}")
+        cached = _MERGED_CACHE.get(cache_key)
+        if cached is not None and _file_signature(cached[0]) == cached[1]:
+            return {scope: dict(config) for scope, config in cached[2].items()}
+
+        # Default locations are stat'ed before the read, so an edit racing
+        # with it invalidates the entry rather than hiding behind it
+        files = self._default_config_files(has_repo)
+        signature = dict((entry[0], entry) for entry in _file_signature(files))
 
-        # Get user.email from global config
         try:
             result = subprocess.run(
-                ["git", "config", "--global", "user.email"],
+                ["git", "config", "--list", "--show-scope", "--show-origin", "-z"],
+                cwd=repo_root,
                 capture_output=True,
-                text=True,
                 check=False,
             )
-            if result.returncode == 0 and result.stdout.strip():
-                config["email"] = result.stdout.strip()
         except Exception as e:
             if self.verbose >= 3:
-                self.logger.debug(f"Failed to get global user.email: {e}")
+                self.logger.debug(f"Failed to read git config: {e}")
+            return None
+
+        if result.returncode != 0:
+            return None
+
+        levels = {"local": {}, "global": {}, "system": {}}
+        origins = set()
+        # NUL-separated scope, origin and "key\nvalue"; later entries win
+        # git prints config bytes as stored (UTF-8 in practice), not in the
+        # locale encoding text=True would assume; decode stdout only, once
+        fields = result.stdout.decode("utf-8", "replace").split("\0")
+        for scope, origin, entry in zip(fields[::3], fields[1::3], fields[2::3]):
+            if origin.startswith("file:"):
+                origins.add(os.path.join(repo_root or os.getcwd(), origin[5:]))
+            config = levels.get(scope)
+            if config is None:
+                continue
+            key, _, value = entry.partition("\n")
+            field = _USER_KEYS.get(key)
+            if field and value.strip():
+                config[field] = value.strip()
+
+        if not has_repo:
+            # A repository around the current directory is not repo_path's
+            levels["local"] = {}
+
+        # Included files only show up as origins; track them too
+        signature.update(
+            (entry[0], entry) for entry in _file_signature(origins - files)
+        )
+        if len(_MERGED_CACHE) >= _MERGED_CACHE_MAX:
+            _MERGED_CACHE.clear()
+        _MERGED_CACHE[cache_key] = (
+            tuple(sorted(signature)),
+            tuple(signature[path] for path in sorted(signature)),
+            {scope: dict(config) for scope, config in levels.items()},
+        )
+        return levels
+
+    def _read_levels_concurrently(self) -> Dict[str, Dict[str, str]]:
+        """
+        Read the repository, global and system levels with one git call each.
 
-        return config
+        Fallback for git versions without ``--show-scope``. The reads are
+        independent and precedence is applied afterwards, so the three git
+        processes run side by side rather than back to back.
 
-    def _get_system_git_config(self) -> Dict[str, str]:
-        """Get user config from system /etc/gitconfig."""
-        config = {}
+        Returns:
+            Mapping of level (local, global, system) to its user info
+        """
+        readers = {
+            "local": self._get_repo_git_config,
+            "global": self._get_global_git_config,
+            "system": self._get_system_git_config,
+        }
+        with ThreadPoolExecutor(max_workers=len(readers)) as executor:
+            futures = {
+                scope: executor.submit(reader) for scope, reader in readers.items()
+            }
+        return {scope: future.result() for scope, future in futures.items()}
+
+    def _read_level(self, level: str) -> Dict[str, str]:
+        """
+        Read user.name and user.email from one git config level.
 
-        # Get user.name from system config
-        try:
-            result = subprocess.run(
-                ["git", "config", "--system", "user.name"],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                config["name"] = result.stdout.strip()
-        except Exception as e:
-            if self.verbose >= 3:
-                self.logger.debug(f"Failed to get system user.name: {e}")
+        One ``git config --list`` call covers both keys. ``-z`` terminates
+        entries with NUL, so values containing newlines still parse.
+
+        Args:
+            level: Config level flag without dashes (local, global or system)
 
-        # Get user.email from system config
+        Returns:
+            Dictionary with 'name' and/or 'email' keys that are set at the level
+        """
+        config = {}
         try:
             result = subprocess.run(
-                ["git", "config", "--system", "user.email"],
+                ["git", "config", "--list", f"--{level}", "-z"],
+                cwd=self.repo_path if level == "local" else None,
                 capture_output=True,
-                text=True,
                 check=False,
             )
-            if result.returncode == 0 and result.stdout.strip():
-                config["email"] = result.stdout.strip()
         except Exception as e:
             if self.verbose >= 3:
-                self.logger.debug(f"Failed to get system user.email: {e}")
+                self.logger.debug(f"Failed to read {level} git config: {e}")
+            return config
+
+        if result.returncode != 0:
+            return config
+
+        # Entries are "key\nvalue"; later entries win, as with git config --get
+        for entry in result.stdout.decode("utf-8", "replace").split("\0"):
+            key, _, value = entry.partition("\n")
+            field = _USER_KEYS.get(key)
+            if field and value.strip():
+                config[field] = value.strip()
 
         return config
 
+    def _get_repo_git_config(self) -> Dict[str, str]:
+        """Get user config from repository-specific .git/config."""
+        if not self._has_repo_level():
+            return {}
+
+        return self._read_level("local")
+
+    def _get_global_git_config(self) -> Dict[str, str]:
+        """Get user config from global ~/.gitconfig."""
+        return self._read_level("global")
+
+    def _get_system_git_config(self) -> Dict[str, str]:
+        """Get user config from system /etc/gitconfig."""
+        return self._read_level("system")
+
     def _get_env_git_config(self) -> Dict[str, str]:
         """Get user config from environment variables."""
         config = {}
@@ -228,6 +345,14 @@ class GitConfigManager:
             config["email"] = os.environ['GIT_COMMITTER_EMAIL']
 
         # Check for RepoKit-specific environment variables
+        config.update(self._get_repokit_env_config())
+
+        return config
+
+    def _get_repokit_env_config(self) -> Dict[str, str]:
+        """Get user config from RepoKit-specific environment variables."""
+        config = {}
+
         if os.environ.get('REPOKIT_USER_NAME'):
             config["name"] = os.environ['REPOKIT_USER_NAME']
 
@@ -335,36 +460,36 @@ class GitConfigManager:
         if not user_info:
             user_info = self.get_comprehensive_user_info(interactive=True)
 
-        success = True
+        # Values the repository already has need no write; the merged listing
+        # is normally cached from detection, so this check costs no git call
+        merged = self._read_merged_levels()
+        current = merged["local"] if merged is not None else {}
 
-        # Configure user.name
-        if user_info.get('name'):
-            try:
-                subprocess.run(
-                    ["git", "config", "user.name", user_info['name']],
-                    cwd=self.repo_path,
-                    check=True,
-                    capture_output=True
-                )
-                if self.verbose >= 1:
-                    self.logger.info(f"Set git user.name to: {user_info['name']}")
-            except subprocess.CalledProcessError as e:
-                self.logger.error(f"Failed to set git user.name: {e}")
-                success = False
+        success = True
 
-        # Configure user.email
-        if user_info.get('email'):
+        # Configure user.name and user.email (each is its own git config write;
+        # git locks the config file, so they cannot run side by side)
+        for key, field in _USER_KEYS.items():
+            value = user_info.get(field)
+            if not value:
+                continue
+            if current.get(field) == value:
+                if self.verbose >= 2:
+                    self.logger.debug(f"git {key} already set to: {value}")
+                continue
             try:
                 subprocess.run(
-                    ["git", "config", "user.email", user_info['email']],
+                    ["git", "config", key, value],
                     cwd=self.repo_path,
                     check=True,
                     capture_output=True
                 )
                 if self.verbose >= 1:
-                    self.logger.info(f"Set git user.email to: {user_info['email']}")
+                    self.logger.info(f"Set git {key} to: {value}")
             except subprocess.CalledProcessError as e:
-                self.logger.error(f"Failed to set git user.email: {e}")
+                self.logger.error(f"Failed to set git {key}: {e}")
                 success = False
 
+        # Even a partial write may have changed what detection would find
+        self._user_info_cache.clear()
         return success
\ No newline at end of file
@@ -18,7 +18,7 @@ from .template_engine import TemplateEngine
 from .defaults import (
     DEFAULT_PRIVATE_DIRS, DEFAULT_SENSITIVE_FILES, DEFAULT_SENSITIVE_PATTERNS,
     DEFAULT_PRIVATE_BRANCHES, DEFAULT_PUBLIC_BRANCHES, 
-    DEFAULT_PRIVATE_PATTERNS, DEFAULT_EXCLUDE_FROM_PUBLIC
+    DEFAULT_PRIVATE_PATTERNS, DEFAULT_EXCLUDE_FROM_PUBLIC, compile_patterns
 )
 
 
@@ -55,7 +55,11 @@ class RepoManager:
         )
 
     def run_git(
-        self, args: List[str], cwd: Optional[str] = None, check: bool = True
+        self,
+        args: List[str],
+        cwd: Optional[str] = None,
+        check: bool = True,
+        input: Optional[str] = None,
     ) -> Optional[str]:
         """
         Run a git command and return its output.
@@ -64,6 +68,7 @@ class RepoManager:
             args: List of git command arguments
             cwd: Working directory for the command
             check: Whether to check for command success
+            input: Optional text to feed to the command's stdin
 
         Returns:
             Command output as string
@@ -83,7 +88,7 @@ class RepoManager:
             
             result = subprocess.run(
                 cmd, cwd=cwd, check=check, capture_output=True, text=True,
-                encoding='utf-8', errors='replace', env=env
+                encoding='utf-8', errors='replace', env=env, input=input
             )
             return result.stdout.strip()
         except subprocess.CalledProcessError as e:
@@ -1210,14 +1215,33 @@ exit 0
             List of relative file paths from repo root
         """
         all_files = []
-        for root, dirs, files in os.walk(self.repo_root):
-            # Skip .git directory
-            if ".git" in root.split(os.sep):
+        # Iterative scandir walk in os.walk order (each directory's files,
+        # then its subdirectories depth-first). Relative paths are built by
+        # joining names onto the parent's prefix rather than relpath() per
+        # file, and dirent types avoid a stat per entry.
+        stack = [(self.repo_root, "")]
+        while stack:
+            root, prefix = stack.pop()
+            subdirs = []
+            try:
+                with os.scandir(root) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if not is_dir:
+                            all_files.append(prefix + entry.name)
+                        elif entry.name != ".git" and not entry.is_symlink():
+                            # Symlinked directories are listed but not
+                            # followed, as with os.walk
+                            subdirs.append(entry)
+            except OSError:
                 continue
-            for file in files:
-                file_path = os.path.join(root, file)
-                relative_path = os.path.relpath(file_path, self.repo_root)
-                all_files.append(relative_path)
+            stack.extend(
+                (entry.path, prefix + entry.name + os.sep)
+                for entry in reversed(subdirs)
+            )
         return all_files
     
     def _filter_files_for_public_branch(self, file_list: List[str]) -> List[str]:
@@ -1234,13 +1258,16 @@ exit 0
         from pathlib import Path
         
         clean_files = []
-        patterns_to_exclude = DEFAULT_SENSITIVE_PATTERNS.copy()
+        patterns_to_exclude = list(DEFAULT_SENSITIVE_PATTERNS)
         
         # Add any additional patterns from config
         config_patterns = self.config.get("sensitive_patterns", [])
         if config_patterns:
             patterns_to_exclude.extend(config_patterns)
         
+        # Literal names are checked by set lookup, globs through one regex
+        is_sensitive_path = compile_patterns(patterns_to_exclude)
+        
         # Use existing BranchContext for additional pattern checking
         from .branch_utils import BranchContext
         context = BranchContext(self.repo_root, self._get_branch_config())
@@ -1249,8 +1276,9 @@ exit 0
             is_sensitive = False
             matching_pattern = None
             
-            # Check against DEFAULT_SENSITIVE_PATTERNS
-            for pattern in patterns_to_exclude:
+            # Check against DEFAULT_SENSITIVE_PATTERNS (per-pattern loop only
+            # runs on a hit, to report which pattern matched)
+            for pattern in (patterns_to_exclude if is_sensitive_path(file_path) else ()):
                 # Use same cross-platform pattern matching as cleanup
                 normalized_file = str(Path(file_path)).replace('\\', '/')
                 normalized_pattern = pattern.replace('\\', '/')
@@ -1281,6 +1309,41 @@ exit 0
         
         return clean_files
     
+    def _add_files(self, file_list: List[str]) -> None:
+        """
+        Stage a list of files with a single git process.
+
+        Paths are passed NUL-separated on stdin, so spaces and newlines in
+        names survive and no command-line length limit applies. If the batch
+        is rejected (git older than 2.25, or a path git refuses), files are
+        added one by one so a single bad path does not drop the rest.
+
+        Args:
+            file_list: File paths relative to the repository root
+        """
+        if not file_list:
+            return
+
+        try:
+            self.run_git(
+                ["add", "--pathspec-from-file=-", "--pathspec-file-nul"],
+                cwd=self.repo_root,
+                input="\0".join(file_list),
+            )
+            if self.verbose >= 3:
+                self.logger.debug(f"Added {len(file_list)} clean files to git index")
+            return
+        except subprocess.CalledProcessError:
+            self.logger.warning("Batch add failed; adding files individually")
+
+        for file_path in file_list:
+            try:
+                self.run_git(["add", file_path], cwd=self.repo_root)
+                if self.verbose >= 3:
+                    self.logger.debug(f"Added clean file to git index: {file_path}")
+            except Exception as e:
+                self.logger.warning(f"Failed to add file {file_path}: {str(e)}")
+
     def _create_clean_public_branch_selective(self, branch_name: str, source_branch: str) -> None:
         """
         Create public branch by selectively adding only non-sensitive files.
@@ -1323,14 +1386,8 @@ exit 0
             excluded_count = len(all_files) - len(clean_files)
             self.logger.info(f"Filtered to {len(clean_files)} clean files ({excluded_count} sensitive files excluded)")
             
-            # Add only clean files to git index one by one
-            for file_path in clean_files:
-                try:
-                    self.run_git(["add", file_path], cwd=self.repo_root)
-                    if self.verbose >= 3:
-                        self.logger.debug(f"Added clean file to git index: {file_path}")
-                except Exception as e:
-                    self.logger.warning(f"Failed to add file {file_path}: {str(e)}")
+            # Add only clean files to git index
+            self._add_files(clean_files)
             
             # Update .gitignore to ensure future privacy protection
             from .branch_utils import BranchContext
@@ -2070,7 +2127,7 @@ exit 0
         }
         
         # Get patterns to clean - use DEFAULT_SENSITIVE_PATTERNS for consistency
-        patterns_to_clean = DEFAULT_SENSITIVE_PATTERNS.copy()
+        patterns_to_clean = list(DEFAULT_SENSITIVE_PATTERNS)
         
         # Add any additional patterns from config
         config_patterns = self.config.get("sensitive_patterns", [])
@@ -2078,12 +2135,13 @@ exit 0
             patterns_to_clean.extend(config_patterns)
         
         # Determine if this is a private branch
-        private_branches = DEFAULT_PRIVATE_BRANCHES + self.config.get("private_branches", [])
+        private_branches = list(DEFAULT_PRIVATE_BRANCHES) + self.config.get("private_branches", [])
         is_private_branch = branch_context in private_branches
         
         cleanup_logger.info(f"Branch context: {branch_context}")
         cleanup_logger.info(f"Is private branch: {is_private_branch}")
         cleanup_logger.info(f"Using {len(patterns_to_clean)} sensitive patterns: {patterns_to_clean}")
+        is_sensitive_path = compile_patterns(patterns_to_clean)
         
         # For private branches, we preserve working directory files but clean git index
         # For public branches, we clean both working directory and git index
@@ -2096,49 +2154,44 @@ exit 0
         # Clean working directory files (only for public branches)
         if clean_working_dir:
             cleanup_logger.debug("Scanning working directory for sensitive files")
-            for root, dirs, files in os.walk(self.repo_root):
-                # Skip .git directory
-                if ".git" in root.split(os.sep):
-                    continue
-                    
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    relative_path = os.path.relpath(file_path, self.repo_root)
+            for relative_path in self._get_working_directory_files():
+                file = os.path.basename(relative_path)
+                file_path = os.path.join(self.repo_root, relative_path)
+                
+                # Check if file matches any sensitive pattern
+                should_remove = False
+                matching_pattern = None
+                
+                for pattern in (patterns_to_clean if is_sensitive_path(relative_path) else ()):
+                    # Cross-platform pattern matching using normalized paths
+                    normalized_relative = str(Path(relative_path)).replace('\\', '/')
+                    normalized_pattern = pattern.replace('\\', '/')
                     
-                    # Check if file matches any sensitive pattern
-                    should_remove = False
-                    matching_pattern = None
+                    # Check multiple match approaches for cross-platform compatibility
+                    matches = [
+                        fnmatch.fnmatch(normalized_relative, normalized_pattern),  # Full path
+                        fnmatch.fnmatch(file, normalized_pattern),                 # Filename only
+                        fnmatch.fnmatch(str(Path(file)), normalized_pattern),     # Filename as Path
+                    ]
                     
-                    for pattern in patterns_to_clean:
-                        # Cross-platform pattern matching using normalized paths
-                        normalized_relative = str(Path(relative_path)).replace('\\', '/')
-                        normalized_pattern = pattern.replace('\\', '/')
-                        
-                        # Check multiple match approaches for cross-platform compatibility
-                        matches = [
-                            fnmatch.fnmatch(normalized_relative, normalized_pattern),  # Full path
-                            fnmatch.fnmatch(file, normalized_pattern),                 # Filename only
-                            fnmatch.fnmatch(str(Path(file)), normalized_pattern),     # Filename as Path
-                        ]
-                        
-                        if any(matches):
-                            should_remove = True
-                            matching_pattern = pattern
-                            if self.verbose >= 3:
-                                cleanup_logger.debug(f"Pattern '{pattern}' matched file '{relative_path}' (normalized: '{normalized_relative}')")
-                            break
+                    if any(matches):
+                        should_remove = True
+                        matching_pattern = pattern
+                        if self.verbose >= 3:
+                            cleanup_logger.debug(f"Pattern '{pattern}' matched file '{relative_path}' (normalized: '{normalized_relative}')")
+                        break
+                
+                if should_remove:
+                    cleanup_results["working_dir"].append(relative_path)
                     
-                    if should_remove:
-                        cleanup_results["working_dir"].append(relative_path)
-                        
-                        if dry_run:
-                            cleanup_logger.info(f"Would remove (working dir): {relative_path} (pattern: {matching_pattern})")
-                        else:
-                            try:
-                                os.remove(file_path)
-                                cleanup_logger.debug(f"Removed (working dir): {relative_path} (pattern: {matching_pattern})")
-                            except Exception as e:
-                                cleanup_logger.warning(f"Failed to remove {relative_path}: {str(e)}")
+                    if dry_run:
+                        cleanup_logger.info(f"Would remove (working dir): {relative_path} (pattern: {matching_pattern})")
+                    else:
+                        try:
+                            os.remove(file_path)
+                            cleanup_logger.debug(f"Removed (working dir): {relative_path} (pattern: {matching_pattern})")
+                        except Exception as e:
+                            cleanup_logger.warning(f"Failed to remove {relative_path}: {str(e)}")
         else:
             cleanup_logger.info("Skipping working directory cleanup (private branch - files preserved)")
         
@@ -2156,7 +2209,7 @@ exit 0
                     should_remove = False
                     matching_pattern = None
                     
-                    for pattern in patterns_to_clean:
+                    for pattern in (patterns_to_clean if is_sensitive_path(tracked_file) else ()):
                         # Cross-platform pattern matching using normalized paths (same as working directory)
                         normalized_tracked = str(Path(tracked_file)).replace('\\', '/')
                         normalized_pattern = pattern.replace('\\', '/')
@@ -10,6 +10,8 @@ import os
 import fnmatch
 import shutil
 import logging
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Set, Dict, Any, Optional, Union
 
@@ -38,6 +40,64 @@ def match_pattern(path: str, pattern: str) -> bool:
     return fnmatch.fnmatch(os.path.basename(path), pattern)
 
 
+def _glob_union(globs: List[str]):
+    """
+    Compile fnmatch-style globs into one alternation regex.
+
+    Args:
+        globs: Glob patterns, already case-normalized
+
+    Returns:
+        Compiled regex, or None if there are no globs
+    """
+    if not globs:
+        return None
+    alternatives = dict.fromkeys(fnmatch.translate(g) for g in globs)
+    return re.compile("|".join(alternatives))
+
+
+@lru_cache(maxsize=64)
+def _compile_match_patterns(patterns: tuple):
+    """Build and cache the matcher for a tuple of match_pattern() patterns."""
+    dir_re = _glob_union(
+        [os.path.normcase(p[:-1]) for p in patterns if p.endswith("/")]
+    )
+    name_re = _glob_union(
+        [os.path.normcase(p) for p in patterns if not p.endswith("/")]
+    )
+
+    def matches(path: str) -> bool:
+        if name_re is not None and name_re.match(
+            os.path.normcase(os.path.basename(path))
+        ):
+            return True
+        if dir_re is not None:
+            return any(
+                dir_re.match(os.path.normcase(part)) for part in path.split(os.sep)
+            )
+        return False
+
+    return matches
+
+
+def compile_match_patterns(patterns: List[str]):
+    """
+    Build a matcher equivalent to checking match_pattern() for each pattern.
+
+    All file patterns are joined into one regex tried against the basename,
+    and all directory patterns (ending with /) into one regex tried against
+    each path component, so a path is checked in one pass instead of once
+    per pattern. Matchers are cached per pattern list.
+
+    Args:
+        patterns: List of patterns as accepted by match_pattern()
+
+    Returns:
+        Callable taking a path and returning True if any pattern matches
+    """
+    return _compile_match_patterns(tuple(patterns))
+
+
 def should_include_file(
     path: str,
     rel_path: str,
@@ -61,29 +121,15 @@ def should_include_file(
         return False
 
     # Check exclude patterns first
-    if exclude_patterns:
-        for pattern in exclude_patterns:
-            if match_pattern(rel_path, pattern):
-                return False
+    if exclude_patterns and compile_match_patterns(exclude_patterns)(rel_path):
+        return False
 
     # If no include patterns, include everything not excluded
     if not include_patterns:
         return True
 
-    # Check if path matches any include pattern
-    for pattern in include_patterns:
-        if match_pattern(rel_path, pattern):
-            return True
-
-    # Check if any parent directory matches an include pattern
-    path_parts = rel_path.split(os.sep)
-    for i in range(len(path_parts)):
-        parent_path = os.sep.join(path_parts[: i + 1])
-        for pattern in include_patterns:
-            if pattern.endswith("/") and match_pattern(parent_path, pattern[:-1]):
-                return True
-
-    return False
+    # Directory patterns match any parent directory of the path as well
+    return compile_match_patterns(include_patterns)(rel_path)
 
 
 def copy_files(
@@ -134,21 +180,20 @@ def copy_files(
             "*.*~",
         ]
 
+    # Directory excludes are checked against each directory's own name
+    is_excluded_dir = compile_match_patterns(
+        [p[:-1] for p in exclude_patterns if p.endswith("/")]
+    )
+
     # Walk through the source directory
     for dirpath, dirnames, filenames in os.walk(source_dir):
         # Get relative path
         rel_path = os.path.relpath(dirpath, source_dir)
 
         # Skip entire directories if they match exclude patterns
-        skip_dir = False
-        for pattern in exclude_patterns:
-            if pattern.endswith("/") and match_pattern(rel_path, pattern[:-1]):
-                logger.debug(f"Skipping directory: {rel_path}")
-                dirnames[:] = []  # Clear dirnames to skip recursion
-                skip_dir = True
-                break
-
-        if skip_dir:
+        if is_excluded_dir(rel_path):
+            logger.debug(f"Skipping directory: {rel_path}")
+            dirnames[:] = []  # Clear dirnames to skip recursion
             continue
 
         # Process files in this directory
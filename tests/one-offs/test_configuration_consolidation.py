@@ -27,9 +27,9 @@ def test_defaults_import():
     print(f"DEFAULT_SENSITIVE_PATTERNS: {DEFAULT_SENSITIVE_PATTERNS}")
     
     # Basic assertions
-    assert isinstance(DEFAULT_PRIVATE_DIRS, list)
-    assert isinstance(DEFAULT_SENSITIVE_FILES, list)
-    assert isinstance(DEFAULT_SENSITIVE_PATTERNS, list)
+    assert isinstance(DEFAULT_PRIVATE_DIRS, tuple)
+    assert isinstance(DEFAULT_SENSITIVE_FILES, tuple)
+    assert isinstance(DEFAULT_SENSITIVE_PATTERNS, tuple)
     
     assert "private" in DEFAULT_PRIVATE_DIRS
     assert "CLAUDE.md" in DEFAULT_SENSITIVE_FILES
@@ -57,8 +57,8 @@ def test_config_manager_defaults():
     print(f"Expected DEFAULT_PRIVATE_DIRS: {DEFAULT_PRIVATE_DIRS}")
     
     # Check that config uses centralized defaults for new fields
-    assert config["sensitive_files"] == DEFAULT_SENSITIVE_FILES
-    assert config["sensitive_patterns"] == DEFAULT_SENSITIVE_PATTERNS
+    assert config["sensitive_files"] == list(DEFAULT_SENSITIVE_FILES)
+    assert config["sensitive_patterns"] == list(DEFAULT_SENSITIVE_PATTERNS)
     
     # For private_dirs, check that it matches what DirectoryProfileManager returns
     # (This might be different due to profile processing)
@@ -9,6 +9,7 @@ import os
 import tempfile
 import shutil
 import json
+import logging
 from pathlib import Path
 
 from .test_utils import RepoKitTestCase
@@ -26,6 +27,14 @@ from repokit.config import ConfigManager
 from repokit.template_engine import TemplateEngine
 
 
+def age_tree(path, seconds=60):
+    """Backdate the mtime of every directory under path (excluding .git)."""
+    for root, dirs, _ in os.walk(path):
+        dirs[:] = [d for d in dirs if d != ".git"]
+        stat = os.stat(root)
+        os.utime(root, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 10**9))
+
+
 class TestProjectAnalyzer(unittest.TestCase):
     """Test ProjectAnalyzer functionality."""
     
@@ -78,6 +87,205 @@ class TestProjectAnalyzer(unittest.TestCase):
         
         self.assertEqual(result['detected_language'], 'javascript')
         
+    def test_detect_language_from_wildcard_marker(self):
+        """Test wildcard characteristic files such as *.csproj."""
+        with open(os.path.join(self.test_dir, "App.csproj"), "w") as f:
+            f.write("<Project />")
+
+        self.analyzer = ProjectAnalyzer(self.test_dir)
+        self.assertEqual(self.analyzer.language, 'csharp')
+
+    def test_detect_language_from_nested_files(self):
+        """Test language scoring from nested source files, ignoring .git."""
+        os.makedirs(os.path.join(self.test_dir, "pkg", "sub"))
+        os.makedirs(os.path.join(self.test_dir, ".git", "hooks"))
+        for name in ("a.go", "b.go"):
+            with open(os.path.join(self.test_dir, "pkg", "sub", name), "w") as f:
+                f.write("package sub")
+        for name in ("x.py", "y.py", "z.py"):
+            with open(os.path.join(self.test_dir, ".git", "hooks", name), "w") as f:
+                f.write("")
+
+        self.analyzer = ProjectAnalyzer(self.test_dir)
+        self.assertEqual(self.analyzer.language, 'go')
+
+    def test_top_level_listed_once(self):
+        """Test that the analyzers share one top-level scandir snapshot."""
+        from unittest import mock
+        with open(os.path.join(self.test_dir, "main.py"), "w") as f:
+            f.write("")
+
+        with mock.patch("repokit.directory_analyzer.os.scandir",
+                        wraps=os.scandir) as scandir, \
+                mock.patch("repokit.directory_analyzer.os.path.lexists",
+                           wraps=os.path.lexists) as lexists:
+            analyzer = ProjectAnalyzer(self.test_dir)
+
+        self.assertEqual(analyzer.project_type, 'source_no_git')
+        self.assertEqual(scandir.call_count, 1)
+        self.assertEqual(lexists.call_count, 0)
+
+    def test_analyze_project_reuses_summary(self):
+        """Test that repeated analyses of an unchanged tree reuse the walk."""
+        from unittest import mock
+        from repokit.directory_analyzer import analyze_project
+        os.makedirs(os.path.join(self.test_dir, "src", "pkg"))
+        with open(os.path.join(self.test_dir, "main.py"), "w") as f:
+            f.write("")
+        age_tree(self.test_dir)
+        first = analyze_project(self.test_dir)
+
+        with mock.patch.object(DirectoryAnalyzer, "_walk_tree") as walk:
+            second = analyze_project(self.test_dir)
+        walk.assert_not_called()
+        self.assertEqual(second, first)
+        self.assertIsNot(second, first)
+
+        # Callers get their own copy
+        second["file_counts"]["python"] = 99
+        self.assertEqual(analyze_project(self.test_dir)["file_counts"]["python"], 1)
+
+        # A change deep in the tree is seen
+        with open(os.path.join(self.test_dir, "src", "pkg", "util.py"), "w") as f:
+            f.write("")
+        self.assertEqual(analyze_project(self.test_dir)["file_counts"]["python"], 2)
+
+    def test_analyze_project_git_state_is_live(self):
+        """Test that a reused analysis still reports current git state."""
+        import subprocess
+        from repokit.directory_analyzer import analyze_project
+        main_py = os.path.join(self.test_dir, "main.py")
+        with open(main_py, "w") as f:
+            f.write("print('one')\n")
+        subprocess.run(["git", "init", "-q"], cwd=self.test_dir, check=True)
+        subprocess.run(["git", "add", "."], cwd=self.test_dir, check=True)
+        subprocess.run(["git", "-c", "user.name=Test", "-c", "user.email=t@t.com",
+                        "commit", "-q", "-m", "Initial"],
+                       cwd=self.test_dir, check=True)
+        age_tree(self.test_dir)
+        # Whether git touches .git while answering is up to git; pin it
+        git_dir = os.path.join(self.test_dir, ".git")
+        os.utime(git_dir, ns=(10**18, 10**18))
+        first = analyze_project(self.test_dir)
+        self.assertFalse(first["git_state"]["has_uncommitted_changes"])
+
+        # Editing a tracked file in place leaves every directory mtime alone
+        with open(main_py, "w") as f:
+            f.write("print('two')\n")
+        os.utime(git_dir, ns=(10**18, 10**18))
+        second = analyze_project(self.test_dir)
+        self.assertTrue(second["git_state"]["has_uncommitted_changes"])
+        self.assertIn("WARNING: Uncommitted changes detected",
+                      second["migration_steps"])
+
+    def test_analysis_is_lazy(self):
+        """Test that git is only queried once a result needs it."""
+        from unittest import mock
+        with mock.patch.object(GitManager, "get_repo_state",
+                               return_value={"is_repo": False}) as state:
+            analyzer = ProjectAnalyzer(self.test_dir)
+            self.assertEqual(analyzer.language, 'generic')
+            self.assertEqual(state.call_count, 0)
+            analyzer.migration_complexity
+            self.assertEqual(state.call_count, 1)
+
+    def test_source_extensions_are_whole_extensions(self):
+        """Test that the precomputed extension set holds dotted extensions."""
+        for ext in ProjectAnalyzer.SOURCE_EXTENSIONS:
+            self.assertTrue(ext.startswith(".") and len(ext) > 1, ext)
+        self.assertIn(".rs", ProjectAnalyzer.SOURCE_EXTENSIONS)
+
+    def test_detect_repokit_like_and_inaccessible(self):
+        """Test project types decided from the top-level snapshot."""
+        for name in ("private", "logs", "docs"):
+            os.makedirs(os.path.join(self.test_dir, name))
+        self.assertEqual(ProjectAnalyzer(self.test_dir).project_type, 'repokit_like')
+
+        missing = os.path.join(self.test_dir, "missing")
+        self.assertEqual(ProjectAnalyzer(missing).project_type, 'inaccessible')
+
+    def test_concurrency_limit_reaches_directory_analyzer(self):
+        """Test that the executor's concurrency cap bounds the file walks."""
+        from unittest import mock
+        from repokit import directory_analyzer
+        executor = directory_analyzer.UniversalMigrationExecutor(
+            self.test_dir, "target", max_concurrency=3)
+        with mock.patch.object(directory_analyzer, "DirectoryAnalyzer",
+                               wraps=DirectoryAnalyzer) as factory, \
+                self.assertLogs(executor.logger, "INFO"):
+            self.assertTrue(executor.execute_migration(dry_run=True))
+        self.assertTrue(factory.call_args_list)
+        for call in factory.call_args_list:
+            self.assertEqual(call[1]["concurrency_limit"], 3)
+        # The summary came from the executor's own analyzer
+        self.assertIsNotNone(executor._analyzer)
+        self.assertEqual(
+            executor._analyzer.directory_analyzer.concurrency_limit, 3)
+
+        self.assertEqual(
+            ProjectAnalyzer(self.test_dir, concurrency_limit=1)
+            .directory_analyzer.concurrency_limit, 1)
+
+    def test_executor_concurrency_bounds_walk_pool(self):
+        """Test that max_concurrency caps the threads of the categorizing walk."""
+        from unittest import mock
+        from concurrent.futures import ThreadPoolExecutor
+        from repokit import directory_analyzer
+        for name in ("a", "b", "c", "d", "e"):
+            os.makedirs(os.path.join(self.test_dir, name))
+            with open(os.path.join(self.test_dir, name, "main.py"), "w") as f:
+                f.write("")
+
+        executor = directory_analyzer.UniversalMigrationExecutor(
+            self.test_dir, "target", max_concurrency=2)
+        with mock.patch.object(directory_analyzer, "ThreadPoolExecutor",
+                               wraps=ThreadPoolExecutor) as pool, \
+                self.assertLogs(executor.logger, "INFO"):
+            self.assertTrue(executor.execute_migration(dry_run=True))
+        pool.assert_called_once_with(max_workers=2)
+        self.assertEqual(executor.summary["file_counts"]["python"], 5)
+
+    def test_executor_reuses_analysis(self):
+        """Test that the executor takes the caller's analysis instead of redoing it."""
+        from unittest import mock
+        from repokit import directory_analyzer
+        summary = self.analyzer.get_comprehensive_summary()
+        with mock.patch.object(directory_analyzer, "ProjectAnalyzer") as factory:
+            executor = directory_analyzer.UniversalMigrationExecutor(
+                self.test_dir, "target", analyzer=self.analyzer, summary=summary)
+            self.assertTrue(executor.execute_migration(dry_run=True))
+            self.assertIs(executor.analyzer, self.analyzer)
+            self.assertIs(executor.summary, summary)
+            factory.assert_not_called()
+
+    def test_dry_run_skips_analysis_when_not_logged(self):
+        """Test that a silent dry run neither analyzes nor formats."""
+        from unittest import mock
+        from repokit import directory_analyzer
+        executor = directory_analyzer.UniversalMigrationExecutor(self.test_dir, "t")
+        with mock.patch.object(directory_analyzer, "ProjectAnalyzer") as analyze:
+            executor.logger.setLevel("WARNING")
+            self.addCleanup(executor.logger.setLevel, "NOTSET")
+            self.assertTrue(executor.execute_migration(dry_run=True))
+            analyze.assert_not_called()
+
+        with self.assertLogs(executor.logger, "INFO") as logs:
+            self.assertTrue(executor.execute_migration(dry_run=True))
+        self.assertIn("Language: generic", "\n".join(logs.output))
+
+    def test_explicit_strategies_skip_upfront_analysis(self):
+        """Test that a quiet dry run with fixed strategies never walks the tree."""
+        from unittest import mock
+        from repokit import directory_analyzer
+        logger = logging.getLogger("repokit.universal_executor")
+        logger.setLevel("WARNING")
+        self.addCleanup(logger.setLevel, "NOTSET")
+        with mock.patch.object(directory_analyzer, "ProjectAnalyzer") as analyze:
+            self.assertTrue(directory_analyzer.universal_migrate_project(
+                self.test_dir, strategy="safe", branch_strategy="simple",
+                dry_run=True))
+            analyze.assert_not_called()
+
     def test_migration_recommendation(self):
         """Test migration recommendations."""
         # Empty project
@@ -129,7 +337,74 @@ class TestGitManager(unittest.TestCase):
         # Git creates 'master' by default on older systems
         branches = info['branches'] + [info['current_branch']]
         self.assertTrue(any(b in ['master', 'main'] for b in branches))
-        
+        self.assertIn(info['current_branch'], info['branches'])
+        self.assertTrue(info['has_commits'])
+        self.assertFalse(info['has_uncommitted_changes'])
+
+    def test_executor_creates_branches_in_one_transaction(self):
+        """Test branch setup with one ref update and one checkout."""
+        import subprocess
+        from unittest import mock
+        from repokit.directory_analyzer import UniversalMigrationExecutor
+        subprocess.run(["git", "init"], cwd=self.test_dir, capture_output=True)
+        subprocess.run(["git", "-c", "user.name=Test", "-c", "user.email=t@t.com",
+                        "commit", "--allow-empty", "-m", "Initial"],
+                       cwd=self.test_dir, capture_output=True)
+
+        executor = UniversalMigrationExecutor(self.test_dir, "target")
+        with mock.patch.object(GitManager, "run_git", autospec=True,
+                               side_effect=GitManager.run_git) as run_git:
+            self.assertTrue(executor._setup_git_repository("simple"))
+        commands = [call[0][1][0] for call in run_git.call_args_list]
+        self.assertEqual(commands.count("update-ref"), 1)
+        self.assertEqual(commands.count("checkout"), 1)
+
+        state = GitManager(self.test_dir).get_repo_state()
+        self.assertEqual(state['current_branch'], 'main')
+        self.assertTrue({'private', 'dev', 'main'} <= set(state['branches']))
+
+    def test_repo_state_is_cached_until_git_write(self):
+        """Test that repo state is reused until an uncached git command."""
+        self.git_manager.run_git(["init"])
+        state = self.git_manager.get_repo_state()
+        self.assertIs(self.git_manager.get_repo_state(), state)
+        self.assertFalse(state['has_commits'])
+
+        self.git_manager.run_git(["config", "user.name", "Test"])
+        self.assertIsNot(self.git_manager.get_repo_state(), state)
+
+    def test_detect_git_file(self):
+        """Test that a .git file (worktree or submodule) counts as a repo."""
+        with open(os.path.join(self.test_dir, ".git"), "w") as f:
+            f.write("gitdir: /elsewhere/.git/worktrees/wt\n")
+        self.assertTrue(GitManager(self.test_dir).is_git_repo())
+
+    def test_run_git_without_capture(self):
+        """Test exit-status-only git calls."""
+        import subprocess
+        self.git_manager.run_git(["init"])
+        self.assertEqual(
+            self.git_manager.run_git(["rev-parse", "--git-dir"], capture=False), ""
+        )
+        with self.assertRaises(subprocess.CalledProcessError):
+            self.git_manager.run_git(
+                ["rev-parse", "--verify", "-q", "HEAD"], capture=False
+            )
+
+    def test_repo_state_with_untracked_unusual_names(self):
+        """Test status parsing with NUL-separated records and non-ASCII paths."""
+        self.git_manager.run_git(["init"])
+        for name in ("new\nline.txt", "café.txt"):
+            try:
+                with open(os.path.join(self.test_dir, name), "w") as f:
+                    f.write("")
+            except OSError:
+                self.skipTest("filesystem does not allow this file name")
+
+        state = self.git_manager.get_repo_state()
+        self.assertTrue(state['has_uncommitted_changes'])
+        self.assertTrue(state['current_branch'])
+
     def test_branch_strategy(self):
         """Test branch strategy detection."""
         # No Git
@@ -283,6 +558,41 @@ class TestDirectoryAnalyzer(unittest.TestCase):
         # tests directory should be detected as existing
         self.assertIn("tests", stats["existing_dirs"])
         
+    def test_analyze_directory_reuses_summary(self):
+        """Test that an unchanged directory tree is not walked twice."""
+        from unittest import mock
+        from repokit.directory_analyzer import analyze_directory
+        deep = os.path.join(self.test_dir, "src", "pkg", "sub")
+        os.makedirs(deep)
+        age_tree(self.test_dir)
+        first = analyze_directory(self.test_dir)
+
+        with mock.patch.object(DirectoryAnalyzer, "_walk_tree") as walk:
+            second = analyze_directory(self.test_dir)
+        walk.assert_not_called()
+        self.assertEqual(second, first)
+        self.assertIsNot(second, first)
+        second["file_counts"]["python"] = 99
+        self.assertEqual(analyze_directory(self.test_dir)["file_counts"]["python"], 0)
+
+        # A new entry three levels down is seen without any mtime help
+        with open(os.path.join(deep, "main.py"), "w") as f:
+            f.write("")
+        self.assertEqual(analyze_directory(self.test_dir)["file_counts"]["python"], 1)
+
+    def test_analyze_directory_skips_recent_trees(self):
+        """Test that a tree modified just now is walked again next time."""
+        from unittest import mock
+        from repokit.directory_analyzer import analyze_directory
+        os.makedirs(os.path.join(self.test_dir, "src"))
+        analyze_directory(self.test_dir)
+
+        with mock.patch.object(DirectoryAnalyzer, "_walk_tree",
+                               autospec=True,
+                               side_effect=DirectoryAnalyzer._walk_tree) as walk:
+            analyze_directory(self.test_dir)
+        walk.assert_called()
+
     def test_directory_detection(self):
         """Test detection of RepoKit standard directories."""
         # Create some standard RepoKit directories
@@ -296,6 +606,439 @@ class TestDirectoryAnalyzer(unittest.TestCase):
         self.assertIn("scripts", analyzer.existing_dirs)
         self.assertIn("private", analyzer.missing_dirs)
 
+    def test_analysis_walks_tree_once(self):
+        """Test that project analysis shares a single tree walk."""
+        from unittest import mock
+        with open(os.path.join(self.test_dir, "main.py"), "w") as f:
+            f.write("print('test')")
+
+        with mock.patch.object(
+            DirectoryAnalyzer, "_walk_tree", autospec=True,
+            side_effect=DirectoryAnalyzer._walk_tree,
+        ) as walk:
+            summary = ProjectAnalyzer(self.test_dir).get_comprehensive_summary()
+
+        self.assertEqual(summary["detected_language"], "python")
+        self.assertEqual(walk.call_count, 1)
+
+    def test_refresh_picks_up_changes(self):
+        """Test that cached results are kept until refresh() is called."""
+        analyzer = DirectoryAnalyzer(self.test_dir)
+        self.assertEqual(analyzer.categorize_counts()["python"], 0)
+        os.makedirs(os.path.join(self.test_dir, "docs"))
+        with open(os.path.join(self.test_dir, "app.py"), "w") as f:
+            f.write("")
+
+        self.assertEqual(analyzer.categorize_counts()["python"], 0)
+        analyzer.refresh()
+        self.assertEqual(analyzer.categorize_counts()["python"], 1)
+        self.assertEqual(analyzer.categorize_files()["python"],
+                         [os.path.join(self.test_dir, "app.py")])
+        self.assertIn("docs", analyzer.existing_dirs)
+        self.assertNotIn("docs", analyzer.missing_dirs)
+
+    def test_parallel_walk_matches_serial_walk(self):
+        """Test that the thread pool walk keeps the serial top-down order."""
+        for sub in ("a", "b", os.path.join("b", "c"), "d"):
+            os.makedirs(os.path.join(self.test_dir, sub), exist_ok=True)
+            with open(os.path.join(self.test_dir, sub, "mod.py"), "w") as f:
+                f.write("")
+
+        serial = DirectoryAnalyzer(self.test_dir, concurrency_limit=1)
+        parallel = DirectoryAnalyzer(self.test_dir, concurrency_limit=4)
+        self.assertEqual(
+            parallel._walk_tree(self.test_dir), serial._walk_tree(self.test_dir)
+        )
+        self.assertEqual(len(parallel.categorize_files()["python"]), 4)
+
+    def test_unchanged_directory_listing_is_reused(self):
+        """Test that a directory is rescanned only after its mtime changes."""
+        from unittest import mock
+        from repokit import directory_analyzer
+        sub = os.path.join(self.test_dir, "pkg")
+        os.makedirs(sub)
+        with open(os.path.join(sub, "a.py"), "w") as f:
+            f.write("")
+        os.utime(sub, ns=(10**18, 10**18))
+
+        analyzer = DirectoryAnalyzer(self.test_dir)
+        with mock.patch.object(directory_analyzer.os, "scandir",
+                               wraps=os.scandir) as scandir:
+            self.assertEqual(analyzer._list_dir(sub), ([], ["a.py"]))
+            self.assertEqual(analyzer._list_dir(sub), ([], ["a.py"]))
+            self.assertEqual(scandir.call_count, 1)
+
+            with open(os.path.join(sub, "b.py"), "w") as f:
+                f.write("")
+            os.utime(sub, ns=(10**18 + 1, 10**18 + 1))
+            self.assertEqual(sorted(analyzer._list_dir(sub)[1]), ["a.py", "b.py"])
+            self.assertEqual(scandir.call_count, 2)
+
+    def test_missing_target_is_reported_without_exists_probe(self):
+        """Test that the top-level scan needs no separate existence check."""
+        from unittest import mock
+        missing = os.path.join(self.test_dir, "missing")
+        analyzer = DirectoryAnalyzer(missing)
+        with mock.patch("os.path.exists", side_effect=AssertionError):
+            with self.assertLogs("repokit.analyzer", "WARNING") as logs:
+                self.assertIsNone(analyzer.get_top_level_names())
+        self.assertIn("does not exist", logs.output[0])
+        self.assertEqual(analyzer.missing_dirs, set())
+
+    def test_scan_results_are_logged_when_verbose(self):
+        """Test the scan summary, including per-file conflicts at debug level."""
+        os.makedirs(os.path.join(self.test_dir, ".github"))
+        with open(os.path.join(self.test_dir, ".github", "CODEOWNERS"), "w") as f:
+            f.write("")
+        with self.assertLogs("repokit.analyzer", "DEBUG") as logs:
+            DirectoryAnalyzer(self.test_dir, verbose=2).has_template_conflicts()
+        output = "\n".join(logs.output)
+        self.assertIn("Potential conflicts in .github: 1 files", output)
+        self.assertIn("  - CODEOWNERS", output)
+        self.assertIn("Special directories found: .github", output)
+
+    def test_migration_actions_per_strategy(self):
+        """Test the strategy action tables, including the .git exception."""
+        analyzer = DirectoryAnalyzer(self.test_dir)
+        expected = {"safe": ("keep", "backup", "backup"),
+                    "replace": ("replace", "replace", "replace"),
+                    "merge": ("merge", "merge", "merge"),
+                    "unknown": ("keep", "keep", "keep")}
+        for strategy, (git, github, template) in expected.items():
+            self.assertEqual(analyzer._get_special_dir_action(".git", strategy), git)
+            self.assertEqual(
+                analyzer._get_special_dir_action(".github", strategy), github)
+            self.assertEqual(
+                analyzer._get_template_conflict_action(".github", strategy), template)
+
+    def test_scan_is_deferred_until_first_use(self):
+        """Test that constructing an analyzer touches no files."""
+        from unittest import mock
+        from repokit import directory_analyzer
+        os.makedirs(os.path.join(self.test_dir, "docs"))
+        with mock.patch.object(directory_analyzer.os, "scandir",
+                               wraps=os.scandir) as scandir:
+            analyzer = DirectoryAnalyzer(self.test_dir)
+            self.assertEqual(scandir.call_count, 0)
+            self.assertFalse(analyzer.has_git_repository())
+            self.assertEqual(scandir.call_count, 0)
+            self.assertIn("docs", analyzer.existing_dirs)
+            self.assertFalse(analyzer.has_git_repository())
+            self.assertEqual(scandir.call_count, 1)
+
+        os.makedirs(os.path.join(self.test_dir, ".git"))
+        self.assertTrue(DirectoryAnalyzer(self.test_dir).has_git_repository())
+
+    def test_walk_of_missing_or_file_path_is_empty(self):
+        """Test that walking a path that is not a directory yields nothing."""
+        from unittest import mock
+        path = os.path.join(self.test_dir, "file.txt")
+        with open(path, "w") as f:
+            f.write("")
+        analyzer = DirectoryAnalyzer(self.test_dir)
+        with mock.patch("os.path.isdir", side_effect=AssertionError):
+            self.assertEqual(analyzer._walk_tree(path), [])
+            self.assertEqual(
+                analyzer._walk_tree(os.path.join(self.test_dir, "missing")), [])
+
+    def test_walk_does_not_follow_symlinks(self):
+        """Test that symlinked files and directories are not categorized."""
+        os.makedirs(os.path.join(self.test_dir, "src"))
+        with open(os.path.join(self.test_dir, "src", "app.py"), "w") as f:
+            f.write("")
+        try:
+            os.symlink(os.path.join(self.test_dir, "src"),
+                       os.path.join(self.test_dir, "src_link"))
+            os.symlink(os.path.join(self.test_dir, "src", "app.py"),
+                       os.path.join(self.test_dir, "link.py"))
+        except (OSError, NotImplementedError):
+            self.skipTest("symlinks not supported")
+
+        categories = DirectoryAnalyzer(self.test_dir).categorize_files()
+        self.assertEqual(
+            categories["python"], [os.path.join(self.test_dir, "src", "app.py")]
+        )
+
+    def test_template_conflicts_use_relative_paths(self):
+        """Test that template conflicts are keyed by path inside the template dir."""
+        workflows = os.path.join(self.test_dir, ".github", "workflows")
+        os.makedirs(workflows)
+        for path in (os.path.join(self.test_dir, ".github", "CODEOWNERS"),
+                     os.path.join(workflows, "ci.yml")):
+            with open(path, "w") as f:
+                f.write("")
+
+        analyzer = DirectoryAnalyzer(self.test_dir)
+        self.assertTrue(analyzer.has_template_conflicts())
+        self.assertFalse(analyzer.has_git_repository())
+        conflicts = analyzer.template_conflicts[".github"]
+        self.assertEqual(
+            sorted(conflicts), ["CODEOWNERS", os.path.join("workflows", "ci.yml")]
+        )
+        self.assertEqual(conflicts["CODEOWNERS"],
+                         os.path.join(self.test_dir, ".github", "CODEOWNERS"))
+
+    def test_backup_is_independent_copy(self):
+        """Test that migration backups survive in-place edits of the original."""
+        workflows = os.path.join(self.test_dir, ".github", "workflows")
+        os.makedirs(workflows)
+        original = os.path.join(workflows, "ci.yml")
+        with open(original, "w") as f:
+            f.write("name: CI\n")
+
+        analyzer = DirectoryAnalyzer(self.test_dir)
+        self.assertTrue(analyzer.execute_migration_plan(analyzer.get_migration_plan()))
+
+        backup = os.path.join(self.test_dir, ".github_backup", "workflows", "ci.yml")
+        with open(original, "w") as f:
+            f.write("changed\n")
+        with open(backup) as f:
+            self.assertEqual(f.read(), "name: CI\n")
+
+    def test_existing_backup_is_replaced(self):
+        """Test that a stale backup is swapped out and gone once migration ends."""
+        github = os.path.join(self.test_dir, ".github")
+        os.makedirs(github)
+        stale = os.path.join(self.test_dir, ".github_backup")
+        os.makedirs(stale)
+        with open(os.path.join(stale, "stale.txt"), "w") as f:
+            f.write("")
+        with open(os.path.join(github, "CODEOWNERS"), "w") as f:
+            f.write("* @owner\n")
+
+        analyzer = DirectoryAnalyzer(self.test_dir)
+        analyzer.execute_migration_plan(analyzer.get_migration_plan())
+
+        self.assertEqual(analyzer._cleanup_threads, [])
+        self.assertEqual(os.listdir(stale), ["CODEOWNERS"])
+        self.assertEqual(
+            [name for name in os.listdir(self.test_dir)
+             if DirectoryAnalyzer.DISCARD_MARKER in name], []
+        )
+
+    def test_discarded_trees_are_not_walked(self):
+        """Test that trees awaiting deletion stay out of the analysis."""
+        import threading
+        from unittest import mock
+        stale = os.path.join(self.test_dir, "docs_backup")
+        os.makedirs(stale)
+        with open(os.path.join(stale, "old.py"), "w") as f:
+            f.write("")
+
+        analyzer = DirectoryAnalyzer(self.test_dir)
+        gate = threading.Event()
+        with mock.patch.object(DirectoryAnalyzer, "_remove_path",
+                               side_effect=lambda *args: gate.wait()):
+            analyzer._discard_tree(stale)
+            analyzer.refresh()
+            self.assertEqual(analyzer.categorize_counts()["python"], 0)
+            gate.set()
+            self.assertFalse(analyzer.wait_for_cleanup())
+        self.assertEqual(analyzer._cleanup_threads, [])
+
+    def test_discard_tree_handles_files(self):
+        """Test that a file in the way is discarded like a directory."""
+        import errno
+        from unittest import mock
+        path = os.path.join(self.test_dir, ".github_backup")
+        with open(path, "w") as f:
+            f.write("")
+
+        analyzer = DirectoryAnalyzer(self.test_dir)
+        analyzer._discard_tree(path)
+        self.assertTrue(analyzer.wait_for_cleanup())
+        self.assertEqual(os.listdir(self.test_dir), [])
+
+        # Without a rename the file is deleted in place
+        with open(path, "w") as f:
+            f.write("")
+        with mock.patch("repokit.directory_analyzer.os.rename",
+                        side_effect=OSError(errno.EXDEV, "cross-device")):
+            analyzer._discard_tree(path)
+        self.assertEqual(os.listdir(self.test_dir), [])
+
+    def test_parallel_backup_copies_every_file(self):
+        """Test that the thread pool backup recreates the nested layout."""
+        files = {}
+        for rel_path in ("a.txt", "d.txt", os.path.join("x", "b.txt"),
+                         os.path.join("x", "e.txt"),
+                         os.path.join("x", "y", "c.txt"),
+                         os.path.join("x", "y", "f.txt")):
+            src = os.path.join(self.test_dir, "src", rel_path)
+            os.makedirs(os.path.dirname(src), exist_ok=True)
+            with open(src, "w") as f:
+                f.write(rel_path)
+            files[rel_path] = src
+
+        backup_dir = os.path.join(self.test_dir, "backup")
+        from unittest import mock
+        with mock.patch("os.makedirs", wraps=os.makedirs) as makedirs:
+            DirectoryAnalyzer(self.test_dir, concurrency_limit=4)._backup_files(
+                files, backup_dir
+            )
+        # Only the deepest directory needs an explicit makedirs (the other
+        # calls are makedirs recursing into its ancestors)
+        self.assertEqual(makedirs.call_args_list[0][0][0],
+                         os.path.join(backup_dir, "x", "y"))
+        self.assertEqual(makedirs.call_count, 3)
+        for rel_path in files:
+            with open(os.path.join(backup_dir, rel_path)) as f:
+                self.assertEqual(f.read(), rel_path)
+
+    def test_copy_falls_back_only_when_unsupported(self):
+        """Test that copy_file_range failures only fall back when unsupported."""
+        import errno
+        from unittest import mock
+        from repokit import directory_analyzer
+
+        src = os.path.join(self.test_dir, "src.txt")
+        dst = os.path.join(self.test_dir, "dst.txt")
+        with open(src, "w") as f:
+            f.write("payload")
+
+        def failing(code):
+            return mock.patch.object(
+                directory_analyzer.os, "copy_file_range",
+                side_effect=OSError(code, os.strerror(code)), create=True)
+
+        with failing(errno.EXDEV):
+            directory_analyzer._copy_file(src, dst)
+        with open(dst) as f:
+            self.assertEqual(f.read(), "payload")
+
+        with failing(errno.ENOSPC):
+            with self.assertRaises(OSError) as ctx:
+                directory_analyzer._copy_file(src, dst)
+        self.assertEqual(ctx.exception.errno, errno.ENOSPC)
+
+    def test_copy_prefers_reflink_clone(self):
+        """Test that a successful FICLONE skips the byte copy."""
+        from unittest import mock
+        from repokit import directory_analyzer
+        if directory_analyzer._FICLONE is None:
+            self.skipTest("FICLONE is Linux-only")
+        src = os.path.join(self.test_dir, "src.txt")
+        with open(src, "w") as f:
+            f.write("payload")
+
+        with mock.patch.object(directory_analyzer.fcntl, "ioctl") as ioctl, \
+                mock.patch.object(directory_analyzer.os, "copy_file_range",
+                                  create=True) as copy_range:
+            directory_analyzer._copy_file(src, os.path.join(self.test_dir, "dst"))
+        self.assertEqual(ioctl.call_args[0][1], directory_analyzer._FICLONE)
+        copy_range.assert_not_called()
+
+    def test_small_backup_copies_serially(self):
+        """Test that a few files are copied without starting a thread pool."""
+        from unittest import mock
+        from repokit import directory_analyzer
+        files = {}
+        for name in ("a.txt", "b.txt"):
+            files[name] = os.path.join(self.test_dir, name)
+            with open(files[name], "w") as f:
+                f.write(name)
+
+        backup_dir = os.path.join(self.test_dir, "backup")
+        with mock.patch.object(directory_analyzer, "ThreadPoolExecutor") as pool:
+            DirectoryAnalyzer(self.test_dir, concurrency_limit=8)._backup_files(
+                files, backup_dir)
+        pool.assert_not_called()
+        self.assertEqual(sorted(os.listdir(backup_dir)), ["a.txt", "b.txt"])
+
+    def test_categorize_by_extension_ignores_case(self):
+        """Test the extension dispatch table, including upper-case names."""
+        for name in ("App.PY", "notes.md", "logo.Svg", "Makefile"):
+            with open(os.path.join(self.test_dir, name), "w") as f:
+                f.write("")
+
+        analyzer = DirectoryAnalyzer(self.test_dir)
+        self.assertEqual(analyzer.get_summary()["total_files"], 4)
+        # Counts alone never build the per-category path lists
+        self.assertIsNone(analyzer._walk_once()["categories"])
+
+        categories = analyzer.categorize_files()
+        names = {cat: [os.path.basename(p) for p in paths]
+                 for cat, paths in categories.items() if paths}
+        self.assertEqual(names, {"python": ["App.PY"], "markdown": ["notes.md"],
+                                 "images": ["logo.Svg"], "other": ["Makefile"]})
+        self.assertEqual(analyzer.get_extension_counts()[".py"], 1)
+        self.assertEqual(
+            analyzer.categorize_counts(),
+            {cat: len(paths) for cat, paths in categories.items()},
+        )
+
+    def test_categorize_skips_generated_dirs(self):
+        """Test that VCS and generated directories are not categorized."""
+        for skipped in ("node_modules", "__pycache__", "build"):
+            os.makedirs(os.path.join(self.test_dir, skipped))
+            with open(os.path.join(self.test_dir, skipped, "mod.js"), "w") as f:
+                f.write("")
+        with open(os.path.join(self.test_dir, "app.js"), "w") as f:
+            f.write("")
+
+        categories = DirectoryAnalyzer(self.test_dir).categorize_files()
+        self.assertEqual(
+            categories["javascript"], [os.path.join(self.test_dir, "app.js")]
+        )
+
+
+
+class TestRepoManagerWorkingFiles(unittest.TestCase):
+    """Test the working-directory file listing used for public branches."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = tempfile.mkdtemp(prefix="test_repo_manager_")
+
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_listing_matches_os_walk(self):
+        """Test that the scandir listing matches an os.walk that skips .git."""
+        from repokit.repo_manager import RepoManager
+        manager = RepoManager({"name": os.path.join(self.test_dir, "proj")})
+        for rel_path in ("README.md", os.path.join(".git", "HEAD"),
+                         os.path.join("src", "app.py"),
+                         os.path.join("src", "pkg", "mod.py")):
+            path = os.path.join(manager.repo_root, rel_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write("")
+
+        expected = []
+        for root, dirs, files in os.walk(manager.repo_root):
+            dirs[:] = [d for d in dirs if d != ".git"]
+            expected.extend(os.path.relpath(os.path.join(root, f), manager.repo_root)
+                            for f in files)
+        self.assertEqual(manager._get_working_directory_files(), expected)
+        self.assertNotIn(os.path.join(".git", "HEAD"), expected)
+
+
+class TestPatternUtils(unittest.TestCase):
+    """Test include/exclude pattern matching used when copying files."""
+
+    def test_compiled_matcher_agrees_with_match_pattern(self):
+        """Test the one-pass matcher against the per-pattern check."""
+        from repokit.utils import compile_match_patterns, match_pattern
+        patterns = ["__pycache__/", "*.py[cod]", "dist/", "README*"]
+        matcher = compile_match_patterns(patterns)
+        for path in ("app.py", "app.pyc", os.path.join("pkg", "__pycache__", "m.py"),
+                     os.path.join("dist", "x.whl"), "README.md", "distro.txt"):
+            expected = any(match_pattern(path, p) for p in patterns)
+            self.assertEqual(matcher(path), expected, path)
+        self.assertIs(matcher, compile_match_patterns(tuple(patterns)))
+        self.assertFalse(compile_match_patterns([])("anything"))
+
+    def test_should_include_file_directory_patterns(self):
+        """Test that directory include patterns cover nested files."""
+        from repokit.utils import should_include_file
+        nested = os.path.join("src", "pkg", "mod.py")
+        self.assertTrue(should_include_file(nested, nested, ["src/"], None))
+        self.assertFalse(should_include_file(nested, nested, ["docs/"], None))
+        self.assertFalse(should_include_file(nested, nested, None, ["pkg/"]))
+        self.assertFalse(should_include_file(".git", os.path.join(".git", "HEAD")))
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Test cases for the default pattern matchers.
+"""
+
+import os
+import sys
+import unittest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from repokit import defaults
+from repokit.defaults import (
+    SENSITIVE_LITERALS,
+    compile_patterns,
+    is_private_path,
+    is_sensitive,
+    normalize_path,
+)
+
+
+class TestNormalizePath(unittest.TestCase):
+    """Test path normalization used by the matchers."""
+
+    def test_normalize_separators_and_prefix(self):
+        """Test backslash conversion and leading ./ removal."""
+        self.assertEqual(normalize_path("src\\pkg\\mod.py"), "src/pkg/mod.py")
+        self.assertEqual(normalize_path("./docs/index.md"), "docs/index.md")
+        self.assertEqual(normalize_path("README.md"), "README.md")
+
+    def test_matchers_accept_dot_prefixed_paths(self):
+        """Test that ./-prefixed paths match like bare ones."""
+        self.assertTrue(is_sensitive("./CLAUDE.md"))
+        self.assertTrue(is_private_path("./private/notes.md"))
+
+
+class TestSensitiveMatcher(unittest.TestCase):
+    """Test sensitive file matching."""
+
+    def test_literals_are_split_from_globs(self):
+        """Test that literal names are not compiled into the glob regex."""
+        self.assertIn("nul", SENSITIVE_LITERALS)
+        self.assertIn("CLAUDE.md", SENSITIVE_LITERALS)
+        self.assertNotIn("*.tmp", SENSITIVE_LITERALS)
+
+    def test_literal_matches_full_path_and_basename(self):
+        """Test that literal names match at any depth."""
+        self.assertTrue(is_sensitive("CLAUDE.md"))
+        self.assertTrue(is_sensitive("docs/CLAUDE.md"))
+        self.assertTrue(is_sensitive("nul"))
+
+    def test_glob_matches(self):
+        """Test glob patterns against paths and basenames."""
+        self.assertTrue(is_sensitive("build/output.tmp"))
+        self.assertTrue(is_sensitive("listall.cmd~"))
+        self.assertTrue(is_sensitive("logs/nested/run.txt"))
+        self.assertTrue(is_sensitive("logs\\nested\\run.txt"))
+        self.assertFalse(is_sensitive("src/main.py"))
+        self.assertFalse(is_sensitive("README.md"))
+
+    def test_compile_patterns_with_custom_patterns(self):
+        """Test building a matcher from configured patterns."""
+        matcher = compile_patterns(["secret.txt", "*.pem"])
+        self.assertTrue(matcher("config/secret.txt"))
+        self.assertTrue(matcher("certs/server.pem"))
+        self.assertFalse(matcher("src/app.py"))
+
+    def test_compile_patterns_is_cached(self):
+        """Test that equal pattern lists share one compiled matcher."""
+        self.assertIs(compile_patterns(["*.pem", "id_rsa"]),
+                      compile_patterns(("*.pem", "id_rsa")))
+
+    def test_compile_patterns_empty(self):
+        """Test that an empty pattern list matches nothing."""
+        self.assertFalse(compile_patterns([])("anything.tmp"))
+
+
+class TestPrivateMatcher(unittest.TestCase):
+    """Test private-branch-only path matching."""
+
+    def test_exact_and_directory_matches(self):
+        """Test literal files and top-level private directories."""
+        self.assertTrue(is_private_path("CLAUDE.md"))
+        self.assertTrue(is_private_path("private/notes.md"))
+        self.assertTrue(is_private_path("convos/2025/chat.txt"))
+        self.assertFalse(is_private_path("privateer.py"))
+
+    def test_glob_matches(self):
+        """Test nested glob patterns."""
+        self.assertTrue(is_private_path("src/private_keys.py"))
+        self.assertTrue(is_private_path("notes.txt~"))
+        self.assertFalse(is_private_path("src/main.py"))
+
+    def test_globs_bucketed_by_first_character(self):
+        """Test that literal-prefixed globs only land in their own bucket."""
+        buckets = defaults._bucket_globs(["src/*.key", "*.pem"])
+        self.assertEqual(sorted(buckets), ["*", "s"])
+        self.assertIsNotNone(buckets["s"].match("src/app.key"))
+        self.assertIsNone(buckets["s"].match("lib/app.key"))
+
+
+class TestBranchExcludes(unittest.TestCase):
+    """Test per-branch exclude lookups."""
+
+    def test_public_branches_exclude_private_content(self):
+        """Test directory and file excludes on public branches."""
+        self.assertTrue(defaults.is_excluded_on_branch("main", "private/notes.md"))
+        self.assertTrue(defaults.is_excluded_on_branch("dev", "docs/CLAUDE.md"))
+        self.assertFalse(defaults.is_excluded_on_branch("main", "src/app.py"))
+
+    def test_private_and_unknown_branches(self):
+        """Test that private and unlisted branches exclude nothing."""
+        self.assertFalse(defaults.is_excluded_on_branch("private", "private/notes.md"))
+        self.assertFalse(defaults.is_excluded_on_branch("feature/x", "CLAUDE.md"))
+
+    def test_mask_covers_every_public_branch(self):
+        """Test that the mask has one bit per branch that excludes the path."""
+        mask = defaults.excluded_branch_mask("logs/run.txt")
+        for branch, bit in defaults.BRANCH_BITS.items():
+            expected = bool(defaults.BRANCH_SPECIFIC_EXCLUDES[branch])
+            self.assertEqual(bool(mask & bit), expected, branch)
+
+    def test_branches_excluding(self):
+        """Test the inverse name-to-branches lookup."""
+        self.assertEqual(
+            defaults.branches_excluding("convos/chat.txt"),
+            frozenset({"dev", "main", "staging", "test", "live"}),
+        )
+        self.assertEqual(defaults.branches_excluding("src/app.py"), frozenset())
+
+
+class TestPublishedDefaults(unittest.TestCase):
+    """Test the shape of the published default tables."""
+
+    def test_shared_names_appear_once_per_list(self):
+        """Test that shared entries come from one canonical definition."""
+        for patterns in (defaults.DEFAULT_SENSITIVE_PATTERNS,
+                         defaults.DEFAULT_PRIVATE_PATTERNS):
+            self.assertEqual(len(patterns), len(set(patterns)))
+            for pattern in defaults.VIM_BACKUP_PATTERNS:
+                self.assertIn(pattern, patterns)
+        self.assertIn(defaults.AI_INSTRUCTIONS_FILE, defaults.DEFAULT_SENSITIVE_FILES)
+        self.assertIn(defaults.AI_INSTRUCTIONS_FILE, defaults.DEFAULT_EXCLUDE_FROM_PUBLIC)
+
+    def test_mappings_are_read_only(self):
+        """Test that shared default mappings cannot be mutated in place."""
+        with self.assertRaises(TypeError):
+            defaults.DEFAULT_BRANCH_STRATEGIES["custom"] = ["main"]
+        with self.assertRaises(TypeError):
+            defaults.DEFAULT_DIRECTORY_PROFILES["minimal"] = []
+
+    def test_sequences_are_tuples(self):
+        """Test that shared default sequences are immutable."""
+        for name in ("DEFAULT_PRIVATE_DIRS", "DEFAULT_SENSITIVE_FILES",
+                     "DEFAULT_SENSITIVE_PATTERNS", "DEFAULT_PRIVATE_PATTERNS",
+                     "DEFAULT_PRIVATE_BRANCHES", "DEFAULT_PUBLIC_BRANCHES",
+                     "DEFAULT_EXCLUDE_FROM_PUBLIC"):
+            self.assertIsInstance(getattr(defaults, name), tuple, name)
+
+    def test_copies_are_mutable(self):
+        """Test that copies of the defaults can be customized."""
+        profiles = defaults.DEFAULT_DIRECTORY_PROFILES.copy()
+        profiles["custom"] = ["src"]
+        self.assertNotIn("custom", defaults.DEFAULT_DIRECTORY_PROFILES)
+
+    def test_matchers_build_lazily(self):
+        """Test that default matchers are published once first used."""
+        is_sensitive("README.md")
+        self.assertIn("SENSITIVE_GLOB_RE", vars(defaults))
+        self.assertIs(defaults.PRIVATE_LITERALS, defaults.PRIVATE_LITERALS)
+
+    def test_all_exports_exist(self):
+        """Test that every name in __all__ is defined."""
+        for name in defaults.__all__:
+            self.assertTrue(hasattr(defaults, name), name)
+
+
+if __name__ == "__main__":
+    unittest.main()
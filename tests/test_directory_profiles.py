@@ -9,6 +9,7 @@ import json
 import tempfile
 import shutil
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
 
 # Add parent directory to path for imports
@@ -117,6 +118,33 @@ class TestDirectoryProfileManager(unittest.TestCase):
         self.assertIn("config", dirs["standard"])
         self.assertIn("data", dirs["standard"])
 
+    def test_get_all_directories_splits_private_types(self):
+        """Test that private types are never standard and always created."""
+        dirs = self.manager.get_all_directories("standard", package_name="tests")
+        private = set(self.manager.get_private_directories("standard"))
+        self.assertEqual(set(dirs["private"]), private)
+        self.assertFalse(private & set(dirs["standard"]))
+        # src and tests both resolve to "tests" here; it is listed once
+        self.assertEqual(dirs["standard"].count("tests"), 1)
+
+    def test_expansions_are_memoized_until_invalidated(self):
+        """Test that cached expansions are fresh copies and honor invalidation."""
+        first = self.manager.get_all_directories("minimal", groups=["operations"])
+        first["standard"].append("scratch")
+        again = self.manager.get_all_directories("minimal", groups=["operations"])
+        self.assertNotIn("scratch", again["standard"])
+
+        self.manager.groups["operations"] = ["config", "metrics"]
+        self.assertNotIn(
+            "metrics", self.manager.get_directories_for_groups(["operations"])
+        )
+        self.manager.invalidate_caches()
+        self.assertIn("metrics", self.manager.get_directories_for_groups(["operations"]))
+        self.assertIn(
+            "metrics",
+            self.manager.get_all_directories("minimal", groups=["operations"])["standard"],
+        )
+
     def test_create_directories(self):
         """Test directory creation."""
         created = self.manager.create_directories(
@@ -138,6 +166,96 @@ class TestDirectoryProfileManager(unittest.TestCase):
         # Check .gitkeep files
         self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "docs", ".gitkeep")))
 
+    def test_create_directories_in_parallel(self):
+        """Test that a large profile is created through the thread pool."""
+        with patch("repokit.directory_profiles.ThreadPoolExecutor",
+                   wraps=ThreadPoolExecutor) as pool:
+            created = self.manager.create_directories(self.temp_dir, profile="complete")
+        pool.assert_called_once()
+        for category in ("standard", "private"):
+            for dirname in created[category]:
+                self.assertTrue(
+                    os.path.isfile(os.path.join(self.temp_dir, dirname, ".gitkeep"))
+                )
+
+        with patch("repokit.directory_profiles.ThreadPoolExecutor") as pool:
+            self.manager.private_dirs["none"] = []
+            self.manager.create_directories(
+                os.path.join(self.temp_dir, "small"), "minimal", private_set="none"
+            )
+        pool.assert_not_called()
+
+    def test_create_directories_keeps_existing_gitkeep(self):
+        """Test that .gitkeep markers are written once and never overwritten."""
+        os.makedirs(os.path.join(self.temp_dir, "docs"))
+        with open(os.path.join(self.temp_dir, "docs", ".gitkeep"), "w") as f:
+            f.write("custom\n")
+
+        self.manager.create_directories(self.temp_dir, profile="minimal")
+        self.manager.create_directories(self.temp_dir + os.sep, profile="minimal")
+
+        with open(os.path.join(self.temp_dir, "docs", ".gitkeep")) as f:
+            self.assertEqual(f.read(), "custom\n")
+        with open(os.path.join(self.temp_dir, "tests", ".gitkeep")) as f:
+            self.assertIn("tracked by Git", f.read())
+        with open(os.path.join(self.temp_dir, "private", ".gitkeep")) as f:
+            self.assertIn("ensures the directory exists", f.read())
+
+    def test_manage_gitkeep_files(self):
+        """Test .gitkeep is added to empty dirs and removed from non-empty ones."""
+        os.makedirs(os.path.join(self.temp_dir, "a", "empty"))
+        os.makedirs(os.path.join(self.temp_dir, "b", ".hidden"))
+        with open(os.path.join(self.temp_dir, "a", ".gitkeep"), "w") as f:
+            f.write("stale\n")
+        if hasattr(os, "symlink"):
+            os.symlink(os.path.join(self.temp_dir, "a"),
+                       os.path.join(self.temp_dir, "link"))
+
+        result = self.manager.manage_gitkeep_files(self.temp_dir)
+
+        self.assertEqual(sorted(result["added"]), [
+            os.path.join("a", "empty", ".gitkeep"), os.path.join("b", ".gitkeep"),
+        ])
+        self.assertEqual(result["removed"], [os.path.join("a", ".gitkeep")])
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, "a", ".gitkeep")))
+        self.assertEqual(
+            self.manager.manage_gitkeep_files(self.temp_dir),
+            {"added": [], "removed": []},
+        )
+
+        os.makedirs(os.path.join(self.temp_dir, "c"))
+        result = self.manager.manage_gitkeep_files(self.temp_dir + os.sep)
+        self.assertEqual(result["added"], [os.path.join("c", ".gitkeep")])
+
+        shallow = self.manager.manage_gitkeep_files(
+            os.path.join(self.temp_dir, "missing"), recursive=False
+        )
+        self.assertEqual(shallow, {"added": [], "removed": []})
+
+    def test_manage_gitkeep_files_skips_settled_directories(self):
+        """Test that unchanged directories are not listed again."""
+        os.makedirs(os.path.join(self.temp_dir, "a"))
+        os.makedirs(os.path.join(self.temp_dir, "b"))
+        with open(os.path.join(self.temp_dir, "a", "x.py"), "w") as f:
+            f.write("x = 1\n")
+        with open(os.path.join(self.temp_dir, "b", ".gitkeep"), "w") as f:
+            f.write("keep\n")
+        for path in ("a", "b", ""):
+            os.utime(os.path.join(self.temp_dir, path), (1000000000, 1000000000))
+
+        self.assertEqual(
+            self.manager.manage_gitkeep_files(self.temp_dir),
+            {"added": [], "removed": []},
+        )
+        with patch("repokit.directory_profiles.os.scandir") as scandir:
+            self.manager.manage_gitkeep_files(self.temp_dir)
+        scandir.assert_not_called()
+
+        with open(os.path.join(self.temp_dir, "b", "y.py"), "w") as f:
+            f.write("y = 1\n")
+        result = self.manager.manage_gitkeep_files(self.temp_dir)
+        self.assertEqual(result["removed"], [os.path.join("b", ".gitkeep")])
+
     def test_config_loading(self):
         """Test loading configuration from file."""
         config_file = os.path.join(self.temp_dir, "test_config.json")
@@ -195,6 +313,19 @@ class TestDirectoryProfileManager(unittest.TestCase):
         self.assertIn("unknown_dir", result["unknown"])
         self.assertIn("docs", result["missing"])
 
+    def test_validate_directories_ignores_files_and_hidden_dirs(self):
+        """Test that only visible directories are categorized."""
+        os.makedirs(os.path.join(self.temp_dir, ".cache"))
+        with open(os.path.join(self.temp_dir, "docs"), "w") as f:
+            f.write("not a directory\n")
+
+        result = self.manager.validate_directories(self.temp_dir)
+
+        self.assertEqual(result["existing"], [])
+        self.assertEqual(result["unknown"], [])
+        self.assertIn("docs", result["missing"])
+        self.assertEqual(result["missing"], sorted(result["missing"]))
+
     def test_suggest_profile(self):
         """Test profile suggestion based on existing directories."""
         # Create minimal directories
@@ -215,6 +346,21 @@ class TestDirectoryProfileManager(unittest.TestCase):
         # Should now suggest standard
         self.assertEqual(suggestion, "standard")
 
+    def test_suggest_profile_follows_loaded_config(self):
+        """Test that cached profile name sets are rebuilt after load_config."""
+        for name in ("api", "web", "infra"):
+            os.makedirs(os.path.join(self.temp_dir, name))
+        self.assertEqual(self.manager.suggest_profile(self.temp_dir), "standard")
+        self.assertIn("api", self.manager.validate_directories(self.temp_dir)["unknown"])
+
+        config_file = os.path.join(self.temp_dir, "profiles.json")
+        with open(config_file, "w") as f:
+            json.dump({"directory_profiles": {"services": ["api", "web", "infra"]}}, f)
+        self.assertTrue(self.manager.load_config(config_file))
+
+        self.assertEqual(self.manager.suggest_profile(self.temp_dir), "services")
+        self.assertIn("api", self.manager.validate_directories(self.temp_dir)["existing"])
+
 
 class TestConfigManagerDirectoryProfiles(unittest.TestCase):
     """Test ConfigManager integration with directory profiles."""
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Test cases for git user configuration detection.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from repokit import git_config
+from repokit.git_config import GitConfigManager
+
+# Keys that would let the caller's own git setup leak into the tests
+_ISOLATED_ENV = (
+    "GIT_AUTHOR_NAME", "GIT_AUTHOR_EMAIL", "GIT_COMMITTER_NAME",
+    "GIT_COMMITTER_EMAIL", "REPOKIT_USER_NAME", "REPOKIT_USER_EMAIL",
+    "GIT_DIR", "GIT_WORK_TREE",
+)
+
+
+class GitConfigTestCase(unittest.TestCase):
+    """Base class running against a throwaway repo and global config."""
+
+    def setUp(self):
+        """Set up an isolated repository and global config file."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.repo_dir = os.path.join(self.temp_dir, "repo")
+        self.global_config = os.path.join(self.temp_dir, "gitconfig")
+        open(self.global_config, "w").close()
+
+        env = {k: v for k, v in os.environ.items() if k not in _ISOLATED_ENV}
+        env.update({
+            "GIT_CONFIG_GLOBAL": self.global_config,
+            "GIT_CONFIG_NOSYSTEM": "1",
+        })
+        self.env_patch = patch.dict(os.environ, env, clear=True)
+        self.env_patch.start()
+
+        subprocess.run(["git", "init", "-q", self.repo_dir], check=True)
+        git_config._MERGED_CACHE.clear()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.env_patch.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def git_config(self, *args):
+        """Run git config against the test repository."""
+        subprocess.run(["git", "config", *args], cwd=self.repo_dir, check=True)
+
+
+class TestUserInfoDetection(GitConfigTestCase):
+    """Test the user.name/user.email detection cascade."""
+
+    def test_levels_fill_missing_keys_in_order(self):
+        """Test that repo config wins and global config fills the gaps."""
+        self.git_config("--global", "user.name", "Global User")
+        self.git_config("--global", "user.email", "global@example.com")
+        self.git_config("--local", "user.name", "Repo User")
+
+        info = GitConfigManager(self.repo_dir).get_comprehensive_user_info(
+            interactive=False
+        )
+
+        self.assertEqual(info, {"name": "Repo User", "email": "global@example.com"})
+
+    def test_each_level_is_read_with_one_git_call(self):
+        """Test that both keys of a level come from a single subprocess."""
+        self.git_config("--local", "user.name", "Repo User")
+        self.git_config("--local", "user.email", "repo@example.com")
+        manager = GitConfigManager(self.repo_dir)
+
+        with patch("repokit.git_config.subprocess.run",
+                   wraps=subprocess.run) as run:
+            config = manager._get_repo_git_config()
+
+        self.assertEqual(config, {"name": "Repo User", "email": "repo@example.com"})
+        self.assertEqual(run.call_count, 1)
+
+    def test_cascade_uses_one_git_call(self):
+        """Test that all three levels come from a single merged listing."""
+        self.git_config("--global", "user.email", "global@example.com")
+        self.git_config("--local", "user.name", "Repo User")
+        manager = GitConfigManager(self.repo_dir)
+
+        with patch("repokit.git_config.subprocess.run",
+                   wraps=subprocess.run) as run:
+            info = manager.get_comprehensive_user_info(interactive=False)
+
+        self.assertEqual(info, {"name": "Repo User", "email": "global@example.com"})
+        self.assertEqual(run.call_count, 1)
+
+    def test_per_level_fallback_without_show_scope(self):
+        """Test that each level is read separately when git lacks --show-scope."""
+        self.git_config("--global", "user.email", "global@example.com")
+        self.git_config("--local", "user.name", "Repo User")
+        real_run = subprocess.run
+
+        def old_git(args, **kwargs):
+            if "--show-scope" in args:
+                return subprocess.CompletedProcess(args, 129, b"", b"unknown option")
+            return real_run(args, **kwargs)
+
+        with patch("repokit.git_config.subprocess.run", side_effect=old_git) as run, \
+                patch("repokit.git_config.ThreadPoolExecutor",
+                      wraps=ThreadPoolExecutor) as pool:
+            info = GitConfigManager(self.repo_dir).get_comprehensive_user_info(
+                interactive=False
+            )
+
+        self.assertEqual(info, {"name": "Repo User", "email": "global@example.com"})
+        pool.assert_called_once_with(max_workers=3)
+        # The merged attempt plus one read per level
+        self.assertEqual(run.call_count, 4)
+
+    def test_surrounding_repository_is_not_repo_level(self):
+        """Test that without repo_path the current directory's repo is ignored."""
+        self.git_config("--local", "user.name", "Repo User")
+        cwd = os.getcwd()
+        os.chdir(self.repo_dir)
+        try:
+            info = GitConfigManager().get_comprehensive_user_info(interactive=False)
+        finally:
+            os.chdir(cwd)
+        self.assertNotIn("name", info)
+
+    def test_user_info_is_memoized_until_configured(self):
+        """Test that repeat lookups reuse the result until new values are set."""
+        self.git_config("--global", "user.name", "Global User")
+        manager = GitConfigManager(self.repo_dir)
+        first = manager.get_comprehensive_user_info(interactive=False)
+        first["name"] = "Edited By Caller"
+
+        with patch("repokit.git_config.subprocess.run") as run:
+            again = manager.get_comprehensive_user_info(interactive=False)
+        run.assert_not_called()
+        self.assertEqual(again, {"name": "Global User"})
+
+        self.assertTrue(manager.configure_repo_git_user({"name": "Repo User"}))
+        info = manager.get_comprehensive_user_info(interactive=False)
+        self.assertEqual(info, {"name": "Repo User"})
+
+    def test_merged_listing_is_shared_until_a_file_changes(self):
+        """Test that managers share one git call until the config is edited."""
+        self.git_config("--global", "user.name", "Global User")
+        GitConfigManager(self.repo_dir).get_comprehensive_user_info(interactive=False)
+
+        with patch("repokit.git_config.subprocess.run",
+                   wraps=subprocess.run) as run:
+            info = GitConfigManager(self.repo_dir).get_comprehensive_user_info(
+                interactive=False
+            )
+        run.assert_not_called()
+        self.assertEqual(info, {"name": "Global User"})
+
+        self.git_config("--global", "user.email", "global@example.com")
+        info = GitConfigManager(self.repo_dir).get_comprehensive_user_info(
+            interactive=False
+        )
+        self.assertEqual(info, {"name": "Global User", "email": "global@example.com"})
+
+    def test_included_files_are_tracked(self):
+        """Test that edits to an included config file invalidate the listing."""
+        included = os.path.join(self.temp_dir, "user.inc")
+        with open(included, "w") as f:
+            f.write("[user]\n\tname = First Name\n")
+        self.git_config("--global", "include.path", included)
+        manager_info = GitConfigManager(self.repo_dir).get_comprehensive_user_info
+        self.assertEqual(manager_info(interactive=False), {"name": "First Name"})
+
+        with open(included, "w") as f:
+            f.write("[user]\n\tname = Second Name\n\temail = new@example.com\n")
+        info = GitConfigManager(self.repo_dir).get_comprehensive_user_info(
+            interactive=False
+        )
+        self.assertEqual(info, {"name": "Second Name", "email": "new@example.com"})
+
+    def test_repokit_overrides_skip_git(self):
+        """Test that REPOKIT_USER_* win over git config without running git."""
+        self.git_config("--local", "user.name", "Repo User")
+        self.git_config("--local", "user.email", "repo@example.com")
+        overrides = {"REPOKIT_USER_NAME": "Override", "REPOKIT_USER_EMAIL": "o@x.org"}
+
+        with patch.dict(os.environ, overrides), \
+                patch("repokit.git_config.subprocess.run") as run:
+            info = GitConfigManager(self.repo_dir).get_comprehensive_user_info(
+                interactive=False
+            )
+        run.assert_not_called()
+        self.assertEqual(info, {"name": "Override", "email": "o@x.org"})
+
+        with patch.dict(os.environ, {"REPOKIT_USER_NAME": "Override"}):
+            info = GitConfigManager(self.repo_dir).get_comprehensive_user_info(
+                interactive=False
+            )
+        self.assertEqual(info, {"name": "Override", "email": "repo@example.com"})
+
+    def test_configure_skips_values_already_set(self):
+        """Test that only changed user settings are written to the repo."""
+        self.git_config("--local", "user.name", "Repo User")
+        manager = GitConfigManager(self.repo_dir)
+        manager.get_comprehensive_user_info(interactive=False)
+
+        with patch("repokit.git_config.subprocess.run",
+                   wraps=subprocess.run) as run:
+            self.assertTrue(manager.configure_repo_git_user(
+                {"name": "Repo User", "email": "repo@example.com"}
+            ))
+        writes = [c[0][0] for c in run.call_args_list if "--list" not in c[0][0]]
+        self.assertEqual(writes, [["git", "config", "user.email", "repo@example.com"]])
+
+        info = manager.get_comprehensive_user_info(interactive=False)
+        self.assertEqual(info, {"name": "Repo User", "email": "repo@example.com"})
+
+    def test_non_ascii_values_decode_as_utf8(self):
+        """Test that names outside ASCII survive whatever the locale is."""
+        # Written as bytes so the test itself does not depend on the locale
+        with open(os.path.join(self.repo_dir, ".git", "config"), "ab") as f:
+            f.write("[user]\n\tname = Zoë Ångström\n".encode("utf-8"))
+        manager = GitConfigManager(self.repo_dir)
+
+        # Text-mode pipes decode with this process's locale encoding
+        # (getencoding() on 3.11+, getpreferredencoding() before), so an
+        # ASCII locale is simulated there; LC_ALL would only reach git.
+        # Python's UTF-8 mode bypasses the locale and cannot break this.
+        with patch("locale.getpreferredencoding", return_value="ascii"), \
+                patch("locale.getencoding", return_value="ascii", create=True):
+            self.assertEqual(manager._get_repo_git_config(), {"name": "Zoë Ångström"})
+            self.assertEqual(
+                manager.get_comprehensive_user_info(interactive=False),
+                {"name": "Zoë Ångström"},
+            )
+
+    def test_environment_fallback(self):
+        """Test that environment variables fill keys git does not set."""
+        with patch.dict(os.environ, {"GIT_AUTHOR_EMAIL": "env@example.com"}):
+            info = GitConfigManager(self.repo_dir).get_comprehensive_user_info(
+                interactive=False
+            )
+        self.assertEqual(info, {"email": "env@example.com"})
+
+
+if __name__ == "__main__":
+    unittest.main()